@@ -4,7 +4,7 @@ import os
 import threading
 import time
 from functools import partial
-from typing import Optional, List
+from typing import Dict, Optional, List
 
 from nicegui import ui
 from nicegui.elements.number import Number
@@ -12,10 +12,21 @@ from nicegui.elements.label import Label
 from nicegui.elements.column import Column
 
 from models import Grid
+from models.grid import RESIZE_ANCHORS
 from simulation import run_conway_step
+from simulation.checkpoint import Checkpointer, latest_checkpoint
+from simulation.cycles import Cycle, CycleDetector
+from simulation.history import History
+from simulation.vectorized import states_to_grid
 from ui import GRID_CSS
 
 DEFAULT_SAVE_PATH = os.path.join(os.path.dirname(__file__), "saved_grid.json")
+DEFAULT_CHECKPOINT_DIR = os.path.join(os.path.dirname(__file__), "checkpoints")
+
+# One checkpointer per directory for the whole process, shared by every page:
+# separate writers would prune each other's newest files.
+_checkpointers: Dict[str, Checkpointer] = {}
+_checkpointers_lock = threading.Lock()
 
 
 class InteractiveGridApp:
@@ -32,6 +43,7 @@ class InteractiveGridApp:
         self.height = height
         self.grid = Grid(width, height)
         self.save_path = DEFAULT_SAVE_PATH
+        self.resize_anchor = "top-left"
 
         # UI components
         self.width_input: Optional[Number] = None
@@ -49,6 +61,18 @@ class InteractiveGridApp:
         # Simulation state
         self.simulation_running: bool = False
         self.simulation_thread: Optional[threading.Thread] = None
+
+        # Optionally stop continuous simulation once traffic settles into a cycle
+        self.stop_on_cycle: bool = False
+        self.cycle_detector = CycleDetector()
+        self.cycle: Optional[Cycle] = None
+
+        # Compressed history of recent generations for rewinding
+        self.history = History()
+        self.rewind_input: Optional[Number] = None
+
+        # Periodic checkpoints of continuous runs (see enable_checkpoints)
+        self.checkpointer: Optional[Checkpointer] = None
         
         # Mouse drag state
         self.is_dragging: bool = False
@@ -58,7 +82,9 @@ class InteractiveGridApp:
 
     def run_simulation_step(self) -> None:
         """Run a single simulation step."""
+        self.record_history()
         self.grid.apply_conway_step()
+        self.record_history()
         self.create_grid()
         self.update_traffic_count()
 
@@ -70,15 +96,33 @@ class InteractiveGridApp:
         self.simulation_running = True
         if self.run_button:
             self.run_button.text = "Stop"
+        self.cycle = None
+        self.cycle_detector.reset()
+        self.cycle_detector.observe(self.grid.generation, self.grid.state_hash)
+        self.record_history()
 
         def simulation_loop():
             """Simulation loop running in separate thread."""
+            steps = self.simulation_step_count
             while self.simulation_running:
                 self.grid.apply_conway_step()
-                self.simulation_step_count += 1
+                self.record_history()
+                steps += 1
+                self.simulation_step_count = steps
+                if self.checkpointer:
+                    self.checkpointer.maybe_checkpoint(
+                        self.grid.generation,
+                        self.grid.to_numpy(),
+                        steps,
+                        self.grid.engine,
+                    )
                 
                 # Update traffic count every step
                 self.update_traffic_count()
+
+                if self.check_for_cycle():
+                    self.stop_simulation()
+                    break
                 
                 # Update grid every 5 steps (0.25 seconds) to show progress
                 if self.simulation_step_count % 5 == 0:
@@ -86,12 +130,111 @@ class InteractiveGridApp:
                 
                 time.sleep(0.05)
 
+            # The final checkpoint is taken here, between steps, rather than
+            # by stop_simulation on the UI thread, which could catch a step
+            # half-written or the new board with the old generation.
+            self.save_checkpoint(steps)
+
         self.simulation_thread = threading.Thread(target=simulation_loop, daemon=True)
         self.simulation_thread.start()
 
+    def check_for_cycle(self) -> bool:
+        """Record the current generation and check whether traffic has settled.
+
+        Returns:
+            True if a cycle was found and the simulation should stop
+        """
+        cycle = self.cycle_detector.observe(self.grid.generation, self.grid.state_hash)
+        if cycle is None:
+            return False
+        self.cycle = cycle
+        return self.stop_on_cycle
+
+    def enable_checkpoints(self, directory: str = DEFAULT_CHECKPOINT_DIR) -> bool:
+        """Checkpoint continuous runs and resume from the newest valid checkpoint.
+
+        The checkpointer for a directory is shared by every app in the
+        process, and only the app that starts it resumes; later pages open
+        on a fresh grid instead of reloading the checkpoint each time.
+
+        Args:
+            directory: Checkpoint directory
+
+        Returns:
+            True if a checkpoint was restored
+        """
+        key = os.path.abspath(directory)
+        with _checkpointers_lock:
+            checkpointer = _checkpointers.get(key)
+            started = checkpointer is None or checkpointer.closed
+            if started:
+                checkpointer = _checkpointers[key] = Checkpointer(directory)
+        self.checkpointer = checkpointer
+        if not started:
+            return False
+        checkpoint = latest_checkpoint(directory)
+        if checkpoint is None:
+            return False
+        self.grid = checkpoint.to_grid()
+        self.width = self.grid.width
+        self.height = self.grid.height
+        self.simulation_step_count = checkpoint.step_count
+        self.checkpointer.last_generation = checkpoint.generation
+        return True
+
+    def record_history(self) -> None:
+        """Record the current generation in the rewind history."""
+        self.history.record(self.grid.generation, self.grid.to_numpy())
+
+    def rewind_to(self, generation: int) -> bool:
+        """Restore the grid to a generation kept in the history.
+
+        Args:
+            generation: Generation number to restore
+
+        Returns:
+            True if the generation was restored, False if it is not retained
+        """
+        if self.simulation_running or generation not in self.history:
+            return False
+        engine = self.grid.engine
+        self.grid = states_to_grid(self.history.states_at(generation))
+        self.grid.engine = engine
+        self.grid.generation = generation
+        self.create_grid()
+        self.update_traffic_count()
+        return True
+
+    def rewind(self) -> None:
+        """Rewind to the generation entered in the UI."""
+        if self.rewind_input and self.rewind_input.value is not None:
+            if not self.rewind_to(int(self.rewind_input.value)):
+                ui.notify("Generation is not in the history")
+
+    def save_checkpoint(self, step_count: int) -> None:
+        """Queue a checkpoint of the current board if checkpoints are enabled.
+
+        Args:
+            step_count: Simulation step counter to record
+        """
+        if self.checkpointer:
+            self.checkpointer.checkpoint(
+                self.grid.generation,
+                self.grid.to_numpy(),
+                step_count,
+                self.grid.engine,
+            )
+
     def stop_simulation(self) -> None:
-        """Stop continuous simulation."""
+        """Stop continuous simulation.
+
+        A running simulation thread checkpoints the final board itself once
+        its current step is done; otherwise the board is checkpointed here.
+        """
         self.simulation_running = False
+        thread = self.simulation_thread
+        if thread is None or not thread.is_alive():
+            self.save_checkpoint(self.simulation_step_count)
         self.simulation_step_count = 0
         if self.run_button:
             self.run_button.text = "Run"
@@ -129,10 +272,14 @@ class InteractiveGridApp:
         """Handle mouse up event to complete drag operation."""
         if self.is_dragging:
             # Apply color cycling to all dragged cells
-            for cell_x, cell_y in self.dragged_cells:
-                # Only cycle cells that are within grid boundaries
-                if 0 <= cell_x < self.grid.width and 0 <= cell_y < self.grid.height:
-                    self.grid.cycle_cell_color(cell_x, cell_y)
+            # Only cycle cells that are within grid boundaries
+            self.grid.cycle_cells(
+                [
+                    (cell_x, cell_y)
+                    for cell_x, cell_y in self.dragged_cells
+                    if 0 <= cell_x < self.grid.width and 0 <= cell_y < self.grid.height
+                ]
+            )
             
             # Reset drag state
             self.is_dragging = False
@@ -154,7 +301,7 @@ class InteractiveGridApp:
             new_height = int(self.height_input.value)
 
             if new_width > 0 and new_height > 0:
-                self.grid.resize(new_width, new_height)
+                self.grid.resize(new_width, new_height, self.resize_anchor)
                 self.width = new_width
                 self.height = new_height
                 self.create_grid()
@@ -253,6 +400,7 @@ class InteractiveGridApp:
         with ui.row().classes("w-full gap-4 items-end"):
             self.width_input = ui.number("Width", value=self.width, min=1, max=1000)
             self.height_input = ui.number("Height", value=self.height, min=1, max=1000)
+            ui.select(list(RESIZE_ANCHORS), label="Anchor").bind_value(self, "resize_anchor")
             ui.button("Resize Grid", on_click=self.resize_grid)
             ui.button("Clear All", on_click=self.clear_all)
             ui.button("Save Pattern", on_click=self.save_grid)
@@ -260,6 +408,9 @@ class InteractiveGridApp:
             self.run_button = ui.button(
                 "Start Simulation", on_click=self.toggle_simulation
             )
+            ui.checkbox("Stop when traffic settles").bind_value(self, "stop_on_cycle")
+            self.rewind_input = ui.number("Generation", value=0, min=0)
+            ui.button("Rewind", on_click=self.rewind)
 
         # Grid info
         with ui.row().classes("w-full gap-4"):
@@ -287,6 +438,7 @@ class InteractiveGridApp:
 def main_page() -> InteractiveGridApp:
     """Main page route."""
     app = InteractiveGridApp()
+    app.enable_checkpoints()
     app.create_ui()
     return app
 
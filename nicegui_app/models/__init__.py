@@ -1,6 +1,6 @@
 """Models package for Conway Traffic simulation."""
 
-from .cell import Cell
+from .cell import Cell, CellView
 from .grid import Grid
 
-__all__ = ["Cell", "Grid"]
+__all__ = ["Cell", "CellView", "Grid"]
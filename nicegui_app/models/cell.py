@@ -1,6 +1,9 @@
 """Cell class for Conway Traffic simulation."""
 
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .grid import Grid
 
 
 class Cell:
@@ -12,6 +15,8 @@ class Cell:
     - 2: Blue (moving traffic)
     """
 
+    __slots__ = ("x", "y", "color_state")
+
     def __init__(
         self, x: int, y: int, color_state: int = 0, is_blue: Optional[bool] = None
     ) -> None:
@@ -88,3 +93,42 @@ class Cell:
         """Return string representation of the cell."""
         state_names = {0: "black", 1: "orange", 2: "blue"}
         return f"Cell({self.x}, {self.y}, {state_names[self.color_state]})"
+
+
+class CellView(Cell):
+    """Lightweight view of a cell stored in an array-backed grid.
+
+    The view holds no state of its own: reading or writing ``color_state``
+    goes straight to the grid's uint8 state buffer, so views are cheap to
+    create on demand and always reflect the current grid contents.
+    """
+
+    # x and y are inherited slots; the color_state property below replaces
+    # the inherited color_state slot, which views leave unused.
+    __slots__ = ("_grid",)
+
+    def __init__(self, grid: "Grid", x: int, y: int) -> None:
+        """Initialize a view of the cell at the given coordinates.
+
+        Args:
+            grid: Array-backed grid that owns the cell state
+            x: X coordinate in the grid
+            y: Y coordinate in the grid
+        """
+        self._grid = grid
+        self.x = x
+        self.y = y
+
+    @property
+    def color_state(self) -> int:
+        """Return the color state stored in the grid buffer."""
+        return int(self._grid._states[self.y, self.x])
+
+    @color_state.setter
+    def color_state(self, state: int) -> None:
+        """Write the color state into the grid buffer.
+
+        Args:
+            state: 0=black, 1=orange, 2=blue
+        """
+        self._grid._set_state(self.x, self.y, state)
@@ -1,12 +1,137 @@
 """Grid class for Conway Traffic simulation."""
 
 import json
-from typing import List, Dict, Any, Optional, TYPE_CHECKING
-
-from .cell import Cell
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    TYPE_CHECKING,
+)
+
+import numpy as np
+
+from .cell import Cell, CellView
 
 if TYPE_CHECKING:
-    from simulation.conway import run_conway_step
+    from simulation.barriers import BarrierLayer
+    from simulation.base import Engine
+    from simulation.cycles import Cycle
+    from simulation.stats import StepStats
+
+STORAGE_MODES = ("objects", "array")
+
+# Where the existing cells stay when the grid is resized, as (vertical,
+# horizontal) placement: 0 = top/left, 1 = center, 2 = bottom/right.
+RESIZE_ANCHORS = {
+    "top-left": (0, 0),
+    "top": (0, 1),
+    "top-right": (0, 2),
+    "left": (1, 0),
+    "center": (1, 1),
+    "right": (1, 2),
+    "bottom-left": (2, 0),
+    "bottom": (2, 1),
+    "bottom-right": (2, 2),
+}
+
+
+def _check_state(state: int) -> None:
+    """Raise ValueError if ``state`` is not a color state."""
+    if state not in (0, 1, 2):
+        raise ValueError("Color state must be 0, 1, or 2")
+
+
+def _as_states(values: Any, name: str) -> np.ndarray:
+    """Convert a 2D array-like of color states to uint8 without truncating.
+
+    Raises:
+        ValueError: If the array is not two-dimensional or holds values other
+            than 0, 1 and 2, such as 0.5, which a plain cast would turn into 0
+    """
+    array = np.asarray(values)
+    if array.ndim != 2:
+        raise ValueError(f"{name} must be two-dimensional")
+    if array.dtype.kind not in "biuf":
+        raise ValueError("Color states must be 0, 1 or 2")
+    with np.errstate(invalid="ignore"):
+        states = array.astype(np.uint8, copy=False)
+        if array.size and (
+            array.min() < 0 or array.max() > 2 or not np.array_equal(states, array)
+        ):
+            raise ValueError("Color states must be 0, 1 or 2")
+    return states
+
+
+def _anchor_offset(old: int, new: int, anchor: int) -> int:
+    """Return where an anchored axis of length ``old`` starts in length ``new``.
+
+    ``anchor`` is 0, 1 or 2 for the start, center or end. The half of an odd
+    difference is rounded toward zero both ways, so growing pads the same
+    sides that shrinking back crops.
+    """
+    if new >= old:
+        return (new - old) * anchor // 2
+    return -((old - new) * anchor // 2)
+
+
+def _is_mask(cells: Any) -> bool:
+    """Return whether bulk-edit cells are given as a boolean mask."""
+    return isinstance(cells, np.ndarray) and cells.dtype == bool
+
+
+# PyBUF_WRITABLE from the buffer protocol flags.
+_PYBUF_WRITABLE = 0x1
+
+
+class _CellRow(Sequence):
+    """Read-only row of an array-backed grid that hands out cell views."""
+
+    def __init__(self, grid: "Grid", y: int) -> None:
+        """Initialize a view of row ``y`` of the grid."""
+        self._grid = grid
+        self._y = y
+
+    def __len__(self) -> int:
+        return self._grid.width
+
+    def __getitem__(self, x: int) -> CellView:
+        if x < 0:
+            x += self._grid.width
+        if not 0 <= x < self._grid.width:
+            raise IndexError("row index out of range")
+        return CellView(self._grid, x, self._y)
+
+    def __iter__(self) -> Iterator[CellView]:
+        for x in range(self._grid.width):
+            yield CellView(self._grid, x, self._y)
+
+
+class _CellRows(Sequence):
+    """Read-only ``cells`` sequence of an array-backed grid."""
+
+    def __init__(self, grid: "Grid") -> None:
+        """Initialize a view of all rows of the grid."""
+        self._grid = grid
+
+    def __len__(self) -> int:
+        return self._grid.height
+
+    def __getitem__(self, y: int) -> _CellRow:
+        if y < 0:
+            y += self._grid.height
+        if not 0 <= y < self._grid.height:
+            raise IndexError("grid index out of range")
+        return _CellRow(self._grid, y)
+
+    def __iter__(self) -> Iterator[_CellRow]:
+        for y in range(self._grid.height):
+            yield _CellRow(self._grid, y)
 
 
 class Grid:
@@ -17,32 +142,62 @@ class Grid:
     - Grid resizing
     - Conway's Game of Life simulation
     - Save/load functionality
+
+    Cell states live in two contiguous uint8 buffers: the current
+    generation and a scratch buffer that engines write the next generation
+    into, after which the two are swapped. ``cells`` and ``get_cell`` expose
+    the current buffer through CellView objects.
+
+    Storage modes:
+    - "array": CellView objects are created on demand (default)
+    - "objects": one persistent CellView per cell is kept in a nested list
     """
 
-    def __init__(self, width: int, height: int) -> None:
+    def __init__(self, width: int, height: int, storage: str = "array") -> None:
         """Initialize a grid with the specified dimensions.
 
         Args:
             width: Number of columns
             height: Number of rows
+            storage: Cell storage mode ("objects" or "array")
             
         Raises:
-            ValueError: If dimensions are not positive
+            ValueError: If dimensions are not positive or storage is unknown
         """
         if width <= 0 or height <= 0:
             raise ValueError("Grid dimensions must be positive")
+        if storage not in STORAGE_MODES:
+            raise ValueError(f"Unknown storage mode: {storage}")
         self.width = width
         self.height = height
-        self.cells: List[List[Cell]] = []
+        self.storage = storage
+        from simulation.engines import default_engine_name
+
+        self.engine: str = default_engine_name()
+        self.generation = 0
+        self._states = np.zeros((height, width), dtype=np.uint8)
+        self._next = np.zeros((height, width), dtype=np.uint8)
+        self._engines: Dict[str, "Engine"] = {}
+        # Zobrist hash of the traffic layer, kept up to date once requested.
+        self._hash: Optional[int] = None
+        # Static barrier layer, rebuilt only after barriers are edited.
+        self._barriers: Optional["BarrierLayer"] = None
+        # Number of cells in each color state (black, orange, blue).
+        self._populations: List[int] = [width * height, 0, 0]
+        self.cells: Union[List[List[Cell]], _CellRows] = []
         self._initialize_cells()
 
     def _initialize_cells(self) -> None:
-        """Initialize the 2D array of cells."""
+        """Initialize the ``cells`` view of the state buffer."""
+        if self.storage == "array":
+            self.cells = _CellRows(self)
+            return
+
         self.cells = []
         for y in range(self.height):
             row: List[Cell] = []
             for x in range(self.width):
-                row.append(Cell(x, y))
+                row.append(CellView(self, x, y))
             self.cells.append(row)
 
     def get_cell(self, x: int, y: int) -> Cell:
@@ -82,45 +237,263 @@ class Grid:
         """
         self.get_cell(x, y).cycle_color()
 
-    def resize(self, new_width: int, new_height: int) -> None:
+    def fill_rect(self, x: int, y: int, width: int, height: int, state: int) -> None:
+        """Set every cell of a rectangle to one color state.
+
+        The rectangle is clipped to the grid.
+
+        Args:
+            x: X coordinate of the left column
+            y: Y coordinate of the top row
+            width: Number of columns
+            height: Number of rows
+            state: Color state to write (0=black, 1=orange, 2=blue)
+
+        Raises:
+            ValueError: If the size is negative or the state is invalid
+        """
+        if width < 0 or height < 0:
+            raise ValueError("Rectangle size must be non-negative")
+        _check_state(state)
+        ys, xs = self._clip(x, y, width, height)
+        rows, cols = np.meshgrid(ys, xs, indexing="ij")
+        indices = (rows * self.width + cols).ravel()
+        self._write_cells(indices, np.full(len(indices), state, dtype=np.uint8))
+
+    def set_cells(
+        self, cells: Union[Sequence[Tuple[int, int]], np.ndarray], state: int
+    ) -> None:
+        """Set a list or mask of cells to one color state.
+
+        Args:
+            cells: (x, y) coordinates, as a sequence of pairs or an array of
+                shape (n, 2), or a boolean mask with the grid's shape
+            state: Color state to write (0=black, 1=orange, 2=blue)
+
+        Raises:
+            ValueError: If the state is invalid, the coordinates are not (x, y)
+                pairs or the mask has the wrong shape
+            IndexError: If a coordinate is out of bounds
+        """
+        _check_state(state)
+        indices = self._cell_indices(cells)
+        self._write_cells(indices, np.full(len(indices), state, dtype=np.uint8))
+
+    def cycle_cells(self, cells: Union[Sequence[Tuple[int, int]], np.ndarray]) -> None:
+        """Cycle the color of several cells: black -> orange -> blue -> black.
+
+        A cell listed several times is cycled once per occurrence, as if
+        ``cycle_cell_color`` had been called for each entry.
+
+        Args:
+            cells: (x, y) coordinates, as a sequence of pairs or an array of
+                shape (n, 2), or a boolean mask with the grid's shape
+
+        Raises:
+            ValueError: If the coordinates are not (x, y) pairs or the mask
+                has the wrong shape
+            IndexError: If a coordinate is out of bounds
+        """
+        if _is_mask(cells):
+            indices, repeats = self._cell_indices(cells), 1
+        else:
+            coords = self._coordinates(cells)
+            indices, repeats = np.unique(
+                coords[:, 1] * self.width + coords[:, 0], return_counts=True
+            )
+        old_states = self._states.ravel()[indices]
+        self._write_cells(indices, ((old_states + repeats) % 3).astype(np.uint8))
+
+    def stamp(self, pattern: Any, x: int, y: int, skip_empty: bool = False) -> None:
+        """Copy a pattern of color states onto the grid.
+
+        The pattern is clipped to the grid.
+
+        Args:
+            pattern: 2D array-like of color states
+            x: X coordinate of the pattern's left column
+            y: Y coordinate of the pattern's top row
+            skip_empty: Leave the grid unchanged under black pattern cells
+
+        Raises:
+            ValueError: If the pattern is not 2D or holds invalid states
+        """
+        pattern = _as_states(pattern, "Pattern")
+        ys, xs = self._clip(x, y, pattern.shape[1], pattern.shape[0])
+        values = pattern[ys[:, None] - y, xs[None, :] - x]
+        indices = ys[:, None] * self.width + xs[None, :]
+        if skip_empty:
+            keep = values != 0
+            indices, values = indices[keep], values[keep]
+        self._write_cells(indices.ravel(), values.ravel())
+
+    def _clip(self, x: int, y: int, width: int, height: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the rows and columns of a rectangle that lie inside the grid."""
+        ys = np.arange(max(y, 0), min(y + height, self.height), dtype=np.intp)
+        xs = np.arange(max(x, 0), min(x + width, self.width), dtype=np.intp)
+        return ys, xs
+
+    def _check_bounds(self, coords: np.ndarray) -> None:
+        """Raise IndexError if any (x, y) row of ``coords`` is off the grid."""
+        inside = (
+            (coords[:, 0] >= 0)
+            & (coords[:, 0] < self.width)
+            & (coords[:, 1] >= 0)
+            & (coords[:, 1] < self.height)
+        )
+        if not inside.all():
+            bad_x, bad_y = coords[np.argmin(inside)].tolist()
+            raise IndexError(
+                f"Cell coordinates ({bad_x}, {bad_y}) out of bounds for grid {self.width}x{self.height}"
+            )
+
+    def _cell_indices(self, cells: Union[Sequence[Tuple[int, int]], np.ndarray]) -> np.ndarray:
+        """Convert a coordinate list or boolean mask into unique flat indices."""
+        if _is_mask(cells):
+            if cells.shape != self._states.shape:
+                raise ValueError("Mask must have the same shape as the grid")
+            return np.flatnonzero(cells)
+        coords = self._coordinates(cells)
+        return np.unique(coords[:, 1] * self.width + coords[:, 0])
+
+    def _coordinates(self, cells: Union[Sequence[Tuple[int, int]], np.ndarray]) -> np.ndarray:
+        """Convert (x, y) pairs into an (n, 2) array of on-grid coordinates.
+
+        Raises:
+            ValueError: If the cells are not a list or array of (x, y) pairs
+            IndexError: If a coordinate is out of bounds
+        """
+        coords = np.asarray(cells, dtype=np.intp)
+        if coords.size == 0:
+            return coords.reshape(0, 2)
+        if coords.ndim != 2 or coords.shape[1] != 2:
+            raise ValueError(
+                f"Cells must be (x, y) pairs of shape (n, 2), not {coords.shape}"
+            )
+        self._check_bounds(coords)
+        return coords
+
+    def _write_cells(self, indices: np.ndarray, states: np.ndarray) -> None:
+        """Write color states into unique flat cell indices in one pass.
+
+        This is the bulk counterpart of ``_set_state`` and keeps the same
+        caches up to date: population counters, barrier layer, state hash
+        and engine state.
+        """
+        flat = self._states.ravel()
+        old_states = flat[indices]
+        changed = old_states != states
+        if not changed.any():
+            return
+        indices = indices[changed]
+        old_states, states = old_states[changed], states[changed]
+        flat[indices] = states
+
+        delta = np.bincount(states, minlength=3) - np.bincount(old_states, minlength=3)
+        self._populations = [
+            count + int(change) for count, change in zip(self._populations, delta)
+        ]
+        if (old_states == 1).any() or (states == 1).any():
+            self._barriers = None
+        if self._hash is not None:
+            toggled = indices[(old_states == 2) != (states == 2)]
+            if len(toggled):
+                from simulation.cycles import zobrist_keys
+
+                keys = zobrist_keys(self._states.shape)[toggled]
+                self._hash ^= int(np.bitwise_xor.reduce(keys))
+        ys, xs = np.divmod(indices, self.width)
+        for engine in self._engines.values():
+            engine.cells_changed(xs, ys, old_states, states)
+
+    def resize(self, new_width: int, new_height: int, anchor: str = "top-left") -> None:
         """Resize the grid to new dimensions.
 
+        The cells that still fit are copied with one slice assignment into
+        a new buffer, so the cost is proportional to the new area. Growing
+        pads with black cells and shrinking crops, on the sides opposite to
+        the anchor.
+
         Args:
             new_width: New number of columns
             new_height: New number of rows
+            anchor: Part of the grid that stays in place: "top-left",
+                "top", "top-right", "left", "center", "right",
+                "bottom-left", "bottom" or "bottom-right"
+
+        Raises:
+            ValueError: If dimensions are not positive or the anchor is unknown
         """
         if new_width <= 0 or new_height <= 0:
             raise ValueError("Grid dimensions must be positive")
-
-        # Create new cells
-        new_cells = []
-        for y in range(new_height):
-            row = []
-            for x in range(new_width):
-                # Preserve existing cells if possible
-                if y < self.height and x < self.width:
-                    row.append(self.cells[y][x])
-                else:
-                    row.append(Cell(x, y))
-            new_cells.append(row)
+        if anchor not in RESIZE_ANCHORS:
+            raise ValueError(f"Unknown resize anchor: {anchor}")
+
+        vertical, horizontal = RESIZE_ANCHORS[anchor]
+        # Offset of the old grid's origin inside the new one (negative when
+        # cropping), e.g. half the size difference for a centered anchor.
+        dy = _anchor_offset(self.height, new_height, vertical)
+        dx = _anchor_offset(self.width, new_width, horizontal)
+        src_y0, src_y1 = max(0, -dy), min(self.height, new_height - dy)
+        src_x0, src_x1 = max(0, -dx), min(self.width, new_width - dx)
+
+        new_states = np.zeros((new_height, new_width), dtype=np.uint8)
+        if src_y0 < src_y1 and src_x0 < src_x1:
+            new_states[src_y0 + dy : src_y1 + dy, src_x0 + dx : src_x1 + dx] = self._states[
+                src_y0:src_y1, src_x0:src_x1
+            ]
 
         self.width = new_width
         self.height = new_height
-        self.cells = new_cells
+        self._states = new_states
+        self._next = np.zeros_like(new_states)
+        self._initialize_cells()
+        self._hash = None
+        self._barriers = None
+        self._recount()
+        self._reset_engines()
+
+    def crop(self, x: int, y: int, width: int, height: int) -> np.ndarray:
+        """Return a read-only, zero-copy view of a rectangle of the board.
+
+        The rectangle is clipped to the grid. Like :meth:`to_numpy`, the
+        view shows the current generation until the next step or resize.
+
+        Args:
+            x: X coordinate of the left column
+            y: Y coordinate of the top row
+            width: Number of columns
+            height: Number of rows
+
+        Returns:
+            uint8 array of color states
+
+        Raises:
+            ValueError: If the size is negative
+        """
+        if width < 0 or height < 0:
+            raise ValueError("Rectangle size must be non-negative")
+        x0, y0 = max(x, 0), max(y, 0)
+        return self.to_numpy()[y0 : max(y + height, y0), x0 : max(x + width, x0)]
 
     def clear_all(self) -> None:
         """Reset all cells to black (empty road) state."""
-        for row in self.cells:
-            for cell in row:
-                cell.reset()
+        self._states.fill(0)
+        self._hash = None
+        self._barriers = None
+        self._populations = [self.width * self.height, 0, 0]
+        self._reset_engines()
 
     def count_active_cells(self) -> int:
         """Count the number of active cells (orange + blue).
 
+        Counts are kept up to date as cells are written and stepped, so
+        this does not scan the board.
+
         Returns:
             Number of active cells
         """
-        return sum(1 for row in self.cells for cell in row if cell.is_blue)
+        return self._populations[1] + self._populations[2]
 
     def count_orange_cells(self) -> int:
         """Count the number of orange cells (barriers).
@@ -128,7 +501,7 @@ class Grid:
         Returns:
             Number of orange cells
         """
-        return sum(1 for row in self.cells for cell in row if cell.is_orange())
+        return self._populations[1]
 
     def count_blue_cells(self) -> int:
         """Count the number of blue cells (traffic).
@@ -136,14 +509,442 @@ class Grid:
         Returns:
             Number of blue cells
         """
-        return sum(1 for row in self.cells for cell in row if cell.is_blue_traffic())
+        return self._populations[2]
+
+    def stats(
+        self, states: Optional[np.ndarray] = None, previous: Optional[np.ndarray] = None
+    ) -> "StepStats":
+        """Summarize a board with a few vectorized passes.
+
+        Args:
+            states: Color states to summarize; defaults to this grid's board,
+                whose populations are already counted
+            previous: Color states of the previous generation, to also count
+                traffic births and deaths
+
+        Returns:
+            StepStats with populations, births, deaths, bounding box and density
+        """
+        from simulation.stats import compute_stats
+
+        if states is None:
+            return compute_stats(
+                self._states, previous, self.generation, tuple(self._populations)
+            )
+        return compute_stats(np.asarray(states, dtype=np.uint8), previous, self.generation)
+
+    def _recount(self) -> None:
+        """Recount the cells in each color state from the state buffer."""
+        counts = np.bincount(self._states.ravel(), minlength=3)
+        self._populations = [int(count) for count in counts[:3]]
+
+    def _set_state(self, x: int, y: int, state: int) -> None:
+        """Write one color state into the current buffer.
+
+        All writes outside of engine steps go through here so that engines
+        can update or drop state cached from earlier generations.
+
+        Raises:
+            ValueError: If the state is invalid; nothing is written
+        """
+        _check_state(state)
+        old_state = int(self._states[y, x])
+        if old_state == state:
+            return
+        self._states[y, x] = state
+        self._populations[old_state] -= 1
+        self._populations[state] += 1
+        if old_state == 1 or state == 1:
+            self._barriers = None
+        if self._hash is not None and (old_state == 2) != (state == 2):
+            from simulation.cycles import zobrist_keys
+
+            self._hash ^= int(zobrist_keys(self._states.shape)[y * self.width + x])
+        for engine in self._engines.values():
+            engine.cell_changed(x, y, old_state, state)
+
+    def _reset_engines(self, keep: Optional["Engine"] = None) -> None:
+        """Reset every cached engine except ``keep``."""
+        for engine in self._engines.values():
+            if engine is not keep:
+                engine.reset()
+
+    @property
+    def barrier_layer(self) -> "BarrierLayer":
+        """Return the static barrier layer of the current layout.
+
+        The layer is built on first use and reused across generations until
+        an edit adds or removes a barrier.
+        """
+        if self._barriers is None:
+            from simulation.barriers import BarrierLayer
+
+            self._barriers = BarrierLayer.from_states(self._states)
+        return self._barriers
+
+    def _get_engine(self, engine: Union[str, "Engine"]) -> "Engine":
+        """Return the engine instance for a name, ready to step this grid.
+
+        Engines are created on first use and handed the current barrier
+        layer. Engine instances passed in directly replace the cached
+        instance of the same name, so that edits to the grid reset them too.
+        """
+        if not isinstance(engine, str):
+            self._engines[engine.name] = engine
+            instance = engine
+        else:
+            instance = self._engines.get(engine)
+            if instance is None:
+                from simulation.engines import create_engine
+
+                instance = self._engines[engine] = create_engine(engine)
+        instance.set_barrier_layer(self.barrier_layer)
+        return instance
+
+    def _load_states(self, states: np.ndarray) -> None:
+        """Replace the grid contents with an array of color states."""
+        np.copyto(self._states, states)
+        self._hash = None
+        self._barriers = None
+        self._recount()
+        self._reset_engines()
+
+    def _commit_step(
+        self, result: np.ndarray, engine: "Engine", generations: int = 1
+    ) -> None:
+        """Make an engine's result the current generation.
+
+        Engines write into the scratch buffer (which is then swapped with
+        the current one) or update the current buffer in place; any other
+        result array is copied into the scratch buffer first.
+
+        Steps never add or remove barriers, so the traffic count and a live
+        state hash only need the step's births and deaths. Engines that
+        update in place report them; for a new buffer they are found by one
+        comparison with the old buffer, if the hash needs them. Without
+        them, the traffic is recounted and the hash is dropped.
+        """
+        swapped = result is not self._states
+        if swapped:
+            if result is not self._next:
+                np.copyto(self._next, result)
+            self._states, self._next = self._next, self._states
+        changes = engine.last_changes if generations == 1 else None
+        if changes is None and swapped and generations == 1 and self._hash is not None:
+            from simulation.stats import traffic_changes
+
+            changes = traffic_changes(self._next, self._states)
+
+        barriers = self._populations[1]
+        if changes is None:
+            traffic = int(np.count_nonzero(self._states)) - barriers
+        else:
+            births, deaths = changes
+            traffic = self._populations[2] + len(births) - len(deaths)
+        self._populations = [self.width * self.height - barriers - traffic, barriers, traffic]
+        if self._hash is not None:
+            if changes is None:
+                self._hash = None
+            else:
+                from simulation.cycles import zobrist_toggle
+
+                toggled = np.concatenate(changes)
+                self._hash = zobrist_toggle(self._hash, self._states.shape, toggled)
+        self._reset_engines(keep=engine)
+
+    def apply_conway_step(
+        self, engine: Union[str, "Engine", None] = None, stats: bool = False
+    ) -> Optional["StepStats"]:
+        """Apply one step of Conway's Game of Life simulation to this grid.
+
+        The next generation is written into the grid's scratch buffer and
+        the buffers are swapped, so stepping creates no new cells or grids.
+
+        Args:
+            engine: Simulation engine to use ("numpy", "python", "bitpacked",
+                "tiled", "incremental", "lookup", "lookup-block", "sparse",
+                "auto", "processes" or "threads"), a B/S rulestring such as
+                "B36/S23", or an engine instance; defaults to ``self.engine``
+            stats: Also summarize the new generation, including the births
+                and deaths of the step
+
+        Returns:
+            StepStats of the new generation if ``stats`` is True, else None
+
+        Raises:
+            ValueError: If the engine name is unknown and not a valid rulestring
+        """
+        instance = self._get_engine(engine or self.engine)
+        # Engines may update the board in place, so keep the old generation.
+        previous = self._states.copy() if stats else None
+        self._commit_step(instance.step(self._states, self._next), instance)
+        self.generation += 1
+        if previous is not None:
+            return self.stats(previous=previous)
+        return None
+
+    def step(
+        self,
+        generations: int = 1,
+        callback_every: Optional[int] = None,
+        callback: Optional[Callable[["Grid"], None]] = None,
+        engine: Union[str, "Engine", None] = None,
+    ) -> None:
+        """Advance the grid by several generations inside the engine.
+
+        Generations are handed to the engine's ``run`` in batches, ping-ponging
+        between the grid's two buffers, so cells are only looked at when the
+        callback asks for them.
+
+        Args:
+            generations: Number of generations to advance
+            callback_every: Call ``callback`` after every this many
+                generations; without it the callback runs once at the end
+            callback: Function called with the grid between batches
+            engine: Simulation engine to use, as for ``apply_conway_step``
+
+        Raises:
+            ValueError: If generations is negative, callback_every is not
+                positive or the engine name is unknown
+        """
+        if generations < 0:
+            raise ValueError("Number of generations must be non-negative")
+        if callback_every is not None and callback_every <= 0:
+            raise ValueError("callback_every must be positive")
+
+        instance = self._get_engine(engine or self.engine)
+        batch = callback_every or generations
+        remaining = generations
+        while remaining > 0:
+            count = min(batch, remaining)
+            result = instance.run(self._states, count, self._next)
+            self._commit_step(result, instance, count)
+            self.generation += count
+            remaining -= count
+            if callback is not None and (callback_every or not remaining):
+                callback(self)
+
+    def advance(self, generations: int) -> None:
+        """Advance the grid by many generations using the HashLife engine.
+
+        The number of generations is split into powers of two and each one
+        is applied as a single memoized jump, so the result matches calling
+        ``apply_conway_step`` ``generations`` times.
+
+        Args:
+            generations: Number of generations to advance
+
+        Raises:
+            ValueError: If generations is negative
+        """
+        from simulation.hashlife import HashLife
+
+        self._load_states(HashLife().advance(self._states, generations))
+        self.generation += generations
+
+    @property
+    def state_hash(self) -> int:
+        """Return the Zobrist hash of the traffic layer.
+
+        The hash is computed on first use and then kept up to date with
+        every edit, at a cost proportional to the edited cells, and every
+        single-generation step. Engines that report their births and deaths
+        (sparse, incremental, tiled and auto) patch it at a cost proportional
+        to the changed cells; other engines write a new buffer, and the hash
+        is patched after one comparison of the old and new buffers, no more
+        than the dense step itself costs. Multi-generation runs drop it
+        until the next call. Boards of the same size with the same traffic
+        hash equally.
+        """
+        if self._hash is None:
+            from simulation.cycles import zobrist_hash
+
+            self._hash = zobrist_hash(self._states)
+        return self._hash
+
+    def find_cycle(
+        self,
+        max_generations: int,
+        max_history: Optional[int] = None,
+        engine: Union[str, "Engine", None] = None,
+    ) -> Optional["Cycle"]:
+        """Step until the board repeats or the generation budget runs out.
+
+        Args:
+            max_generations: Maximum number of generations to advance
+            max_history: Number of recent generations to remember; cycles
+                with a longer period are not found (defaults to
+                ``simulation.cycles.DEFAULT_HISTORY``)
+            engine: Simulation engine to use, as for ``apply_conway_step``
+
+        Returns:
+            The cycle the board has entered, with ``start`` giving the
+            generation where the run stabilized, or None if no repeat was
+            found within the budget
+        """
+        from simulation.cycles import DEFAULT_HISTORY, CycleDetector
+
+        detector = CycleDetector(max_history or DEFAULT_HISTORY)
+        detector.observe(self.generation, self.state_hash)
+        for _ in range(max_generations):
+            self.apply_conway_step(engine)
+            cycle = detector.observe(self.generation, self.state_hash)
+            if cycle is not None:
+                return cycle
+        return None
+
+    def skip_cycle(self, cycle: "Cycle", generations: int) -> None:
+        """Jump ahead through a detected cycle.
+
+        Since the board repeats every ``cycle.period`` generations, only
+        ``generations % cycle.period`` steps are actually computed.
+
+        Args:
+            cycle: Cycle returned by ``find_cycle`` for this board
+            generations: Number of generations to advance
+
+        Raises:
+            ValueError: If generations is negative or the board has not
+                reached the cycle yet
+        """
+        if generations < 0:
+            raise ValueError("Number of generations must be non-negative")
+        if self.generation < cycle.start:
+            raise ValueError("Grid has not reached the cycle yet")
+        remainder = generations % cycle.period
+        self.step(remainder)
+        self.generation += generations - remainder
+
+    def generations(
+        self,
+        start: int = 0,
+        stop: Optional[int] = None,
+        deltas: bool = False,
+        engine: Union[str, "Engine", None] = None,
+    ) -> Iterator[Tuple[Any, ...]]:
+        """Lazily step the grid and yield one item per generation.
+
+        ``start`` and ``stop`` count generations from the current one, like
+        ``range``: the first ``start`` generations are advanced inside the
+        engine without being yielded, and iteration ends before ``stop``
+        (or never, if it is None), leaving the grid at the last generation
+        yielded. The grid is only stepped when the next item is requested,
+        so a slow consumer simply slows the simulation down and no history
+        is buffered.
+
+        Snapshots are read-only views of the grid's current buffer, not
+        copies; they stay valid only until the next item is requested, so
+        copy them to keep them. Deltas list the cells that changed since the
+        previous item (since an empty board for the first one), including
+        edits made between items.
+
+        Args:
+            start: Number of generations to skip before the first item
+            stop: Generation (counted from now) to stop before
+            deltas: Yield deltas instead of snapshots
+            engine: Simulation engine to use, as for ``apply_conway_step``
+
+        Yields:
+            ``(generation, states)`` tuples, or with ``deltas``
+            ``(generation, indices, values)`` tuples holding the flat indices
+            of the changed cells and their new color states
+
+        Raises:
+            ValueError: If start is negative
+            RuntimeError: If the grid is resized during iteration
+        """
+        if start < 0:
+            raise ValueError("start must be non-negative")
+        if stop is not None and stop <= start:
+            return
+        shape = self._states.shape
+        previous = np.zeros(shape, dtype=np.uint8) if deltas else None
+
+        self.step(start, engine=engine)
+        offset = start
+        while True:
+            if self._states.shape != shape:
+                raise RuntimeError("Grid was resized during iteration")
+            if previous is None:
+                snapshot = self._states.view()
+                snapshot.flags.writeable = False
+                yield self.generation, snapshot
+            else:
+                indices = np.flatnonzero(self._states != previous)
+                values = self._states.ravel()[indices]
+                np.copyto(previous, self._states)
+                yield self.generation, indices, values
+            offset += 1
+            if stop is not None and offset >= stop:
+                return
+            self.apply_conway_step(engine)
+
+    def to_numpy(self, copy: bool = False) -> np.ndarray:
+        """Return the color states as a NumPy array.
+
+        Without ``copy`` the array is a read-only view of the current state
+        buffer, so no cells are copied. Steps swap the grid's two buffers
+        and resizing replaces them, so a view only shows the current
+        generation until the next step or resize; edits must go through
+        the grid so that its caches stay correct.
+
+        Args:
+            copy: Return a new writable array instead of a view
+
+        Returns:
+            uint8 array of color states with shape (height, width)
+        """
+        if copy:
+            return self._states.copy()
+        view = self._states.view()
+        view.flags.writeable = False
+        return view
+
+    @classmethod
+    def from_numpy(cls, array: Any, storage: str = "array") -> "Grid":
+        """Create a grid from an array of color states.
+
+        Args:
+            array: Array-like of color states (0, 1 or 2) with shape
+                (height, width); it is copied into the grid's own buffer
+            storage: Cell storage mode for the new grid
+
+        Returns:
+            New Grid instance
+
+        Raises:
+            ValueError: If the array is not two-dimensional, is empty or
+                holds values other than 0, 1 and 2 (fractions included)
+        """
+        states = _as_states(array, "Array")
+        height, width = states.shape
+        grid = cls(width, height, storage=storage)
+        grid._load_states(states)
+        return grid
+
+    def __array__(self, dtype: Any = None, copy: Optional[bool] = None) -> np.ndarray:
+        """Support ``np.asarray(grid)`` with a read-only view of the states.
+
+        Raises:
+            ValueError: If ``copy=False`` is combined with a dtype that needs
+                a conversion, which cannot be done without copying
+        """
+        convert = dtype is not None and np.dtype(dtype) != self._states.dtype
+        if convert and copy is False:
+            raise ValueError(f"Converting grid states to {np.dtype(dtype)} requires a copy")
+        if copy or convert:
+            return self._states.astype(dtype or self._states.dtype)
+        return self.to_numpy()
 
-    def apply_conway_step(self) -> None:
-        """Apply one step of Conway's Game of Life simulation to this grid."""
-        from simulation.conway import run_conway_step
+    def __buffer__(self, flags: int) -> memoryview:
+        """Export the states through the buffer protocol (Python 3.12+).
 
-        new_grid = run_conway_step(self)
-        self.cells = new_grid.cells
+        Raises:
+            BufferError: If a writable buffer is requested
+        """
+        if flags & _PYBUF_WRITABLE:
+            raise BufferError("Grid states are read-only; edit cells through the grid")
+        return memoryview(self.to_numpy())
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert the grid to a dictionary for serialization.
@@ -155,25 +956,23 @@ class Grid:
             "width": self.width,
             "height": self.height,
             "cells": [
-                [
-                    {"is_blue": cell.is_blue, "color_state": cell.color_state}
-                    for cell in row
-                ]
-                for row in self.cells
+                [{"is_blue": state != 0, "color_state": state} for state in row]
+                for row in self._states.tolist()
             ],
         }
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "Grid":
+    def from_dict(cls, data: Dict[str, Any], storage: str = "array") -> "Grid":
         """Create a grid from a dictionary representation.
 
         Args:
             data: Dictionary containing grid data
+            storage: Cell storage mode for the new grid
 
         Returns:
             New Grid instance
         """
-        grid = cls(data["width"], data["height"])
+        grid = cls(data["width"], data["height"], storage=storage)
 
         for y, row in enumerate(data["cells"]):
             for x, cell_data in enumerate(row):
@@ -200,18 +999,19 @@ class Grid:
             json.dump(self.to_dict(), f)
 
     @classmethod
-    def load_from_file(cls, filename: str) -> "Grid":
+    def load_from_file(cls, filename: str, storage: str = "array") -> "Grid":
         """Load a grid from a JSON file.
 
         Args:
             filename: Path to the file to load from
+            storage: Cell storage mode for the new grid
 
         Returns:
             New Grid instance loaded from file
         """
         with open(filename, "r") as f:
             data = json.load(f)
-        return cls.from_dict(data)
+        return cls.from_dict(data, storage=storage)
 
     def __repr__(self) -> str:
         """Return string representation of the grid."""
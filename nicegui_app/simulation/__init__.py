@@ -1,5 +1,6 @@
 """Simulation package for Conway Traffic."""
 
 from .conway import run_conway_step
+from .vectorized import run_conway_step_vectorized
 
-__all__ = ["run_conway_step"]
+__all__ = ["run_conway_step", "run_conway_step_vectorized"]
@@ -0,0 +1,49 @@
+"""Static barrier layer shared across generations.
+
+Orange barriers never change during a run, so everything derived from them
+is computed once per barrier layout instead of once per generation. The grid
+keeps one :class:`BarrierLayer` and only rebuilds it when an edit adds or
+removes a barrier; engines that accept the layer skip recomputing the
+barrier masks every step.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+
+class BarrierLayer:
+    """Immutable masks derived from one barrier layout."""
+
+    __slots__ = ("mask", "open", "states", "count")
+
+    def __init__(self, mask: np.ndarray) -> None:
+        """Initialize the layer from a barrier mask.
+
+        Args:
+            mask: Boolean array with shape (height, width), True on barriers
+        """
+        self.mask = np.array(mask, dtype=bool)
+        self.open = ~self.mask
+        # Barriers as color states, ready to be ORed into a traffic layer.
+        self.states = self.mask.view(np.uint8)
+        self.count = int(np.count_nonzero(self.mask))
+        for array in (self.mask, self.open, self.states):
+            array.flags.writeable = False
+
+    @classmethod
+    def from_states(cls, states: np.ndarray) -> "BarrierLayer":
+        """Extract the barrier layer from an array of color states.
+
+        Args:
+            states: Color states with shape (height, width)
+
+        Returns:
+            New BarrierLayer instance
+        """
+        return cls(states == 1)
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """Return the board shape as (height, width)."""
+        return self.mask.shape
@@ -0,0 +1,138 @@
+"""Base classes for array-based simulation engines.
+
+An engine advances a 2D ``uint8`` array of color states by one generation.
+Engines may keep state between generations (activity flags, caches), so the
+grid keeps one instance per engine name and calls :meth:`Engine.reset`
+whenever its cells change outside of that engine's own steps. Single-cell
+edits go through :meth:`Engine.cell_changed` and bulk edits through
+:meth:`Engine.cells_changed` instead, which engines can override to patch
+their cached state rather than discard it.
+
+Engines that already know which cells a step changed report them in
+:attr:`Engine.last_changes`, so the grid can update its counters and state
+hash without rescanning the board.
+"""
+
+from typing import Callable, Optional, Tuple, TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from .barriers import BarrierLayer
+
+StepFunction = Callable[..., np.ndarray]
+
+# Flat indices of the cells a step turned into traffic and out of traffic.
+Changes = Tuple[np.ndarray, np.ndarray]
+
+
+class Engine:
+    """Base class for array-based simulation engines."""
+
+    name = ""
+
+    # (births, deaths) of the last call to step, or None if the engine does
+    # not track them. Engines that set it must set it on every step.
+    last_changes: Optional[Changes] = None
+
+    def step(self, states: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Advance an array of color states by one generation.
+
+        Engines either write the next generation into ``out`` (or a new
+        array) or update ``states`` in place; callers must use the returned
+        array.
+
+        Args:
+            states: Current color states with shape (height, width)
+            out: Optional array to write the next generation into
+
+        Returns:
+            Array holding the next generation
+        """
+        raise NotImplementedError
+
+    def run(
+        self, states: np.ndarray, generations: int, out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Advance an array of color states by several generations.
+
+        When ``out`` is given, ``states`` and ``out`` are used as a pair of
+        alternating buffers and both may be overwritten; otherwise ``states``
+        is left untouched unless the engine updates it in place.
+
+        Args:
+            states: Current color states with shape (height, width)
+            generations: Number of generations to advance
+            out: Optional scratch array of the same shape
+
+        Returns:
+            Array holding the final generation (``states``, ``out`` or a new
+            array)
+        """
+        scratch = out
+        for _ in range(generations):
+            result = self.step(states, scratch)
+            if result is not states:
+                scratch = states if out is not None else None
+                states = result
+        return states
+
+    def reset(self) -> None:
+        """Forget any state kept from previous generations."""
+
+    def set_barrier_layer(self, layer: "BarrierLayer") -> None:
+        """Receive the static barrier layer of the board about to be stepped.
+
+        The grid calls this before every step with a layer it only rebuilds
+        when barriers are edited. The default implementation ignores it.
+
+        Args:
+            layer: Barrier layer with the same shape as the states
+        """
+
+    def cell_changed(self, x: int, y: int, old_state: int, new_state: int) -> None:
+        """Handle a single cell edited outside of the engine's own steps.
+
+        The default implementation resets the engine.
+
+        Args:
+            x: X coordinate of the edited cell
+            y: Y coordinate of the edited cell
+            old_state: Color state before the edit
+            new_state: Color state after the edit
+        """
+        self.reset()
+
+    def cells_changed(
+        self, xs: np.ndarray, ys: np.ndarray, old_states: np.ndarray, new_states: np.ndarray
+    ) -> None:
+        """Handle a batch of cells edited outside of the engine's own steps.
+
+        Every listed cell appears once and actually changed. The default
+        implementation resets the engine.
+
+        Args:
+            xs: X coordinate of each edited cell
+            ys: Y coordinate of each edited cell
+            old_states: Color state of each cell before the edit
+            new_states: Color state of each cell after the edit
+        """
+        self.reset()
+
+
+class StepFunctionEngine(Engine):
+    """Stateless engine that delegates to a step function."""
+
+    def __init__(self, name: str, step_function: StepFunction) -> None:
+        """Initialize the engine.
+
+        Args:
+            name: Engine name
+            step_function: Function with the signature of ``Engine.step``
+        """
+        self.name = name
+        self._step_function = step_function
+
+    def step(self, states: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Advance an array of color states by one generation."""
+        return self._step_function(states, out)
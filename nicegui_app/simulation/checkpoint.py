@@ -0,0 +1,379 @@
+"""Periodic, atomic checkpoints of a running simulation.
+
+A checkpoint holds the color states, the generation counter, the app's step
+counter, the engine name and, optionally, the state of a NumPy random
+generator. It is written as an ``.npz`` file whose metadata carries a CRC32
+of the states, so a truncated or corrupted file is detected and skipped.
+
+Writing never blocks the simulation: :class:`Checkpointer` copies the board
+(one memcpy) and hands it to a background thread, which writes to a
+temporary file in the same directory and renames it into place with
+``os.replace``, then syncs the directory so the rename itself survives a
+power loss. A crash at any point leaves either the old checkpoint or the
+new one, never a partial file under a checkpoint name. If the writer falls
+behind, only the newest pending snapshot is kept.
+
+Files are numbered by a sequence that grows with every write, not by
+generation: after rewinding, the newest checkpoint can hold an earlier
+generation than an older one, and it is still the one to resume from.
+"""
+
+import json
+import os
+import re
+import tempfile
+import threading
+import zipfile
+import zlib
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from models.grid import Grid
+
+CHECKPOINT_VERSION = 1
+
+DEFAULT_EVERY = 100
+
+DEFAULT_KEEP = 3
+
+_FILENAME = re.compile(r"^checkpoint-(\d+)\.npz$")
+
+
+class Checkpoint:
+    """Simulation state loaded from or written to a checkpoint file."""
+
+    __slots__ = ("generation", "states", "step_count", "engine", "rng_state", "sequence")
+
+    def __init__(
+        self,
+        generation: int,
+        states: np.ndarray,
+        step_count: int = 0,
+        engine: Optional[str] = None,
+        rng_state: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Initialize a checkpoint.
+
+        Args:
+            generation: Generation counter of the grid
+            states: Color states with shape (height, width)
+            step_count: The app's simulation step counter
+            engine: Name of the grid's simulation engine
+            rng_state: ``bit_generator.state`` of a NumPy random generator
+        """
+        self.generation = generation
+        self.states = states
+        self.step_count = step_count
+        self.engine = engine
+        self.rng_state = rng_state
+        # Write-order number, set once the checkpoint is written or read
+        self.sequence: Optional[int] = None
+
+    def to_grid(self) -> "Grid":
+        """Build a grid holding the checkpointed board, generation and engine.
+
+        Returns:
+            New Grid instance
+        """
+        from .vectorized import states_to_grid
+
+        grid = states_to_grid(self.states)
+        grid.generation = self.generation
+        if self.engine is not None:
+            grid.engine = self.engine
+        return grid
+
+    def restore_rng(self, rng: np.random.Generator) -> None:
+        """Put a random generator back into the checkpointed state.
+
+        Args:
+            rng: Generator using the same bit generator type as the saved one
+
+        Raises:
+            ValueError: If the checkpoint holds no RNG state
+        """
+        if self.rng_state is None:
+            raise ValueError("Checkpoint has no RNG state")
+        rng.bit_generator.state = self.rng_state
+
+
+def checkpoint_path(directory: str, sequence: int) -> str:
+    """Return the file name of the checkpoint with a sequence number."""
+    return os.path.join(directory, f"checkpoint-{sequence:012d}.npz")
+
+
+def _sequence(path: str) -> int:
+    """Return the sequence number in a checkpoint file name."""
+    return int(_FILENAME.match(os.path.basename(path)).group(1))
+
+
+def next_sequence(directory: str) -> int:
+    """Return the sequence number following every checkpoint in a directory."""
+    paths = list_checkpoints(directory)
+    return _sequence(paths[0]) + 1 if paths else 1
+
+
+def _fsync_directory(directory: str) -> None:
+    """Flush a directory entry change, such as a rename, to disk."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:  # directories cannot be opened on Windows
+        return
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def write_checkpoint(directory: str, checkpoint: Checkpoint) -> str:
+    """Write a checkpoint atomically as the newest one in a directory.
+
+    Only one writer should use a directory at a time, since the sequence
+    number is taken from the files already there.
+
+    Args:
+        directory: Checkpoint directory, created if missing
+        checkpoint: Checkpoint to write; its ``sequence`` is set
+
+    Returns:
+        Path of the written file
+    """
+    os.makedirs(directory, exist_ok=True)
+    states = np.ascontiguousarray(checkpoint.states, dtype=np.uint8)
+    sequence = next_sequence(directory)
+    metadata = {
+        "version": CHECKPOINT_VERSION,
+        "sequence": sequence,
+        "generation": checkpoint.generation,
+        "step_count": checkpoint.step_count,
+        "engine": checkpoint.engine,
+        "rng_state": checkpoint.rng_state,
+        "crc32": zlib.crc32(states.tobytes()),
+    }
+    path = checkpoint_path(directory, sequence)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".checkpoint-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.savez(f, states=states, metadata=np.array(json.dumps(metadata)))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+    _fsync_directory(directory)
+    checkpoint.sequence = sequence
+    return path
+
+
+def read_checkpoint(path: str) -> Checkpoint:
+    """Read and validate a checkpoint file.
+
+    Args:
+        path: Path of the checkpoint file
+
+    Returns:
+        Loaded Checkpoint
+
+    Raises:
+        ValueError: If the file is unreadable, truncated or fails validation
+    """
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            states = data["states"]
+            metadata = json.loads(str(data["metadata"]))
+    except (OSError, EOFError, KeyError, ValueError, zipfile.BadZipFile, zlib.error) as e:
+        raise ValueError(f"Unreadable checkpoint {path}: {e}") from e
+
+    if metadata.get("version") != CHECKPOINT_VERSION:
+        raise ValueError(f"Unsupported checkpoint version in {path}")
+    if states.ndim != 2 or states.dtype != np.uint8:
+        raise ValueError(f"Invalid states in checkpoint {path}")
+    if zlib.crc32(states.tobytes()) != metadata.get("crc32"):
+        raise ValueError(f"Checksum mismatch in checkpoint {path}")
+    checkpoint = Checkpoint(
+        metadata["generation"],
+        states,
+        metadata.get("step_count", 0),
+        metadata.get("engine"),
+        metadata.get("rng_state"),
+    )
+    checkpoint.sequence = metadata.get("sequence")
+    return checkpoint
+
+
+def list_checkpoints(directory: str) -> List[str]:
+    """Return the checkpoint files in a directory, most recently written first."""
+    if not os.path.isdir(directory):
+        return []
+    paths = [
+        os.path.join(directory, name) for name in os.listdir(directory) if _FILENAME.match(name)
+    ]
+    paths.sort(key=_sequence, reverse=True)
+    return paths
+
+
+def latest_checkpoint(directory: str) -> Optional[Checkpoint]:
+    """Load the most recently written valid checkpoint, skipping invalid ones.
+
+    Args:
+        directory: Checkpoint directory
+
+    Returns:
+        The newest checkpoint that passes validation, or None if there is none
+    """
+    for path in list_checkpoints(directory):
+        try:
+            return read_checkpoint(path)
+        except ValueError:
+            continue
+    return None
+
+
+class Checkpointer:
+    """Writes checkpoints every few generations from a background thread.
+
+    Use one checkpointer per directory: each prunes every file but its
+    ``keep`` newest, including files written by another writer.
+    """
+
+    def __init__(
+        self, directory: str, every: int = DEFAULT_EVERY, keep: int = DEFAULT_KEEP
+    ) -> None:
+        """Initialize the checkpointer.
+
+        Args:
+            directory: Checkpoint directory
+            every: Generations between checkpoints taken by ``maybe_checkpoint``
+            keep: Number of most recent checkpoint files to keep
+
+        Raises:
+            ValueError: If every or keep is not positive
+        """
+        if every <= 0:
+            raise ValueError("Checkpoint interval must be positive")
+        if keep <= 0:
+            raise ValueError("Number of checkpoints to keep must be positive")
+        self.directory = directory
+        self.every = every
+        self.keep = keep
+        self.last_generation: Optional[int] = None
+        self.error: Optional[BaseException] = None
+        self._pending: Optional[Checkpoint] = None
+        self._busy = False
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def maybe_checkpoint(
+        self,
+        generation: int,
+        states: np.ndarray,
+        step_count: int = 0,
+        engine: Optional[str] = None,
+        rng: Optional[np.random.Generator] = None,
+    ) -> bool:
+        """Checkpoint if ``every`` generations passed since the last one.
+
+        Args:
+            generation: Generation counter of the grid
+            states: Color states with shape (height, width)
+            step_count: The app's simulation step counter
+            engine: Name of the grid's simulation engine
+            rng: Random generator whose state should be saved
+
+        Returns:
+            True if a checkpoint was queued
+        """
+        if self.last_generation is not None and (
+            0 <= generation - self.last_generation < self.every
+        ):
+            return False
+        self.checkpoint(generation, states, step_count, engine, rng)
+        return True
+
+    def checkpoint(
+        self,
+        generation: int,
+        states: np.ndarray,
+        step_count: int = 0,
+        engine: Optional[str] = None,
+        rng: Optional[np.random.Generator] = None,
+    ) -> None:
+        """Queue a checkpoint; the board is copied before returning.
+
+        Args:
+            generation: Generation counter of the grid
+            states: Color states with shape (height, width)
+            step_count: The app's simulation step counter
+            engine: Name of the grid's simulation engine
+            rng: Random generator whose state should be saved
+        """
+        rng_state = rng.bit_generator.state if rng is not None else None
+        checkpoint = Checkpoint(generation, states.copy(), step_count, engine, rng_state)
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Checkpointer is closed")
+            self._pending = checkpoint
+            self.last_generation = generation
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._writer, daemon=True)
+                self._thread.start()
+            self._condition.notify_all()
+
+    @property
+    def closed(self) -> bool:
+        """Return whether the checkpointer has been closed."""
+        return self._closed
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued checkpoint has been written.
+
+        Args:
+            timeout: Maximum number of seconds to wait
+
+        Returns:
+            True if nothing is left to write
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: self._pending is None and not self._busy, timeout
+            )
+
+    def close(self) -> None:
+        """Write any queued checkpoint and stop the background thread."""
+        self.flush()
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _writer(self) -> None:
+        """Background loop writing the newest queued checkpoint."""
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending is not None or self._closed)
+                if self._pending is None:
+                    return
+                checkpoint, self._pending = self._pending, None
+                self._busy = True
+            try:
+                write_checkpoint(self.directory, checkpoint)
+                self._prune()
+            except Exception as e:  # keep the simulation running on disk errors
+                self.error = e
+            finally:
+                with self._condition:
+                    self._busy = False
+                    self._condition.notify_all()
+
+    def _prune(self) -> None:
+        """Delete all but the ``keep`` most recently written checkpoint files."""
+        for path in list_checkpoints(self.directory)[self.keep :]:
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
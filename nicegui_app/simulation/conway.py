@@ -1,6 +1,8 @@
 """Conway's Game of Life simulation for traffic modeling."""
 
-from typing import TYPE_CHECKING
+from typing import List, Optional, TYPE_CHECKING
+
+import numpy as np
 
 if TYPE_CHECKING:
     from models.grid import Grid
@@ -82,3 +84,46 @@ def _count_traffic_neighbors(grid: "Grid", x: int, y: int) -> int:
                     traffic_count += 1
 
     return traffic_count
+
+
+def step_states_python(states: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Advance an array of color states by one generation in pure Python.
+
+    This applies the same per-cell rules as :func:`run_conway_step` to a 2D
+    array of color states instead of a grid of cells.
+
+    Args:
+        states: Current color states with shape (height, width)
+        out: Optional array to write the next generation into
+
+    Returns:
+        Array holding the next generation (``out`` if it was given)
+    """
+    rows: List[List[int]] = states.tolist()
+    height, width = states.shape
+    next_rows = []
+
+    for y in range(height):
+        next_row = []
+        for x in range(width):
+            state = rows[y][x]
+            if state == 1:
+                next_row.append(1)  # orange barriers don't evolve
+                continue
+
+            traffic_neighbors = 0
+            for ny in range(max(y - 1, 0), min(y + 2, height)):
+                for nx in range(max(x - 1, 0), min(x + 2, width)):
+                    if (nx != x or ny != y) and rows[ny][nx] == 2:
+                        traffic_neighbors += 1
+
+            if traffic_neighbors == 3 or (state == 2 and traffic_neighbors == 2):
+                next_row.append(2)  # blue
+            else:
+                next_row.append(0)  # black
+        next_rows.append(next_row)
+
+    if out is None:
+        out = np.empty(states.shape, dtype=np.uint8)
+    out[...] = next_rows
+    return out
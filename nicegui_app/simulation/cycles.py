@@ -0,0 +1,168 @@
+"""Cycle and stabilization detection with Zobrist hashes of the traffic layer.
+
+Every cell position has a fixed random 64-bit key, and the hash of a board is
+the XOR of the keys of its traffic cells. Turning one cell into traffic or
+back XORs its key in or out, so the hash can be kept up to date in time
+proportional to the number of changed cells.
+
+:class:`CycleDetector` remembers the hashes of a bounded number of recent
+generations. When a hash comes back, the board has entered a cycle: a still
+life repeats with period 1, a blinker with period 2, and so on.
+"""
+
+from collections import deque
+from functools import lru_cache
+from typing import Deque, Dict, Optional, Tuple
+
+import numpy as np
+
+# Fixed seed so that equal boards of the same shape always hash equally.
+ZOBRIST_SEED = 0x5EED
+
+DEFAULT_HISTORY = 1024
+
+
+@lru_cache(maxsize=8)
+def zobrist_keys(shape: Tuple[int, int]) -> np.ndarray:
+    """Return the random per-cell keys for a board shape.
+
+    Args:
+        shape: Board shape as (height, width)
+
+    Returns:
+        Read-only flat uint64 array with one key per cell
+    """
+    rng = np.random.default_rng(ZOBRIST_SEED)
+    keys = rng.integers(0, 2**64, size=shape[0] * shape[1], dtype=np.uint64)
+    keys.flags.writeable = False
+    return keys
+
+
+def zobrist_hash(states: np.ndarray) -> int:
+    """Hash the traffic layer of a board from scratch.
+
+    Args:
+        states: Color states with shape (height, width)
+
+    Returns:
+        XOR of the keys of all traffic cells
+    """
+    keys = zobrist_keys(states.shape)
+    return int(np.bitwise_xor.reduce(keys[states.ravel() == 2], initial=np.uint64(0)))
+
+
+def zobrist_update(state_hash: int, before: np.ndarray, after: np.ndarray) -> int:
+    """Update a hash for the cells whose traffic state differs between boards.
+
+    Args:
+        state_hash: Hash of ``before``
+        before: Previous color states
+        after: New color states with the same shape
+
+    Returns:
+        Hash of ``after``
+    """
+    toggled = np.flatnonzero((before.ravel() == 2) != (after.ravel() == 2))
+    if not len(toggled):
+        return state_hash
+    keys = zobrist_keys(before.shape)
+    return state_hash ^ int(np.bitwise_xor.reduce(keys[toggled]))
+
+
+def zobrist_toggle(state_hash: int, shape: Tuple[int, int], cells: np.ndarray) -> int:
+    """Update a hash for cells whose traffic state flipped.
+
+    Args:
+        state_hash: Hash before the change
+        shape: Board shape
+        cells: Flat indices of the flipped cells, each listed once
+
+    Returns:
+        Hash after the change
+    """
+    if not len(cells):
+        return state_hash
+    return state_hash ^ int(np.bitwise_xor.reduce(zobrist_keys(shape)[cells]))
+
+
+class Cycle:
+    """A repeating sequence of generations found by :class:`CycleDetector`."""
+
+    __slots__ = ("start", "period")
+
+    def __init__(self, start: int, period: int) -> None:
+        """Initialize a cycle.
+
+        Args:
+            start: First generation of the repeating sequence, i.e. the
+                generation where the run stabilized
+            period: Number of generations after which the board repeats
+        """
+        self.start = start
+        self.period = period
+
+    @property
+    def is_still(self) -> bool:
+        """Return whether the board stopped changing (period 1)."""
+        return self.period == 1
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Cycle):
+            return NotImplemented
+        return (self.start, self.period) == (other.start, other.period)
+
+    def __repr__(self) -> str:
+        return f"Cycle(start={self.start}, period={self.period})"
+
+
+class CycleDetector:
+    """Detects repeated boards from a bounded history of state hashes.
+
+    Only the last ``max_history`` generations are remembered, so cycles
+    with a longer period are not detected.
+    """
+
+    def __init__(self, max_history: int = DEFAULT_HISTORY) -> None:
+        """Initialize the detector.
+
+        Args:
+            max_history: Number of recent generations to remember
+
+        Raises:
+            ValueError: If max_history is not positive
+        """
+        if max_history <= 0:
+            raise ValueError("History size must be positive")
+        self.max_history = max_history
+        self._order: Deque[Tuple[int, int]] = deque()
+        self._seen: Dict[int, int] = {}
+        self.cycle: Optional[Cycle] = None
+
+    def reset(self) -> None:
+        """Forget all remembered generations."""
+        self._order.clear()
+        self._seen.clear()
+        self.cycle = None
+
+    def observe(self, generation: int, state_hash: int) -> Optional[Cycle]:
+        """Record a generation and report a cycle if its board was seen before.
+
+        Args:
+            generation: Generation number of the board
+            state_hash: Hash of the board
+
+        Returns:
+            The detected cycle, or None if the board is new
+        """
+        first = self._seen.get(state_hash)
+        if first is not None and first < generation:
+            self.cycle = Cycle(first, generation - first)
+            return self.cycle
+
+        self._seen[state_hash] = generation
+        self._order.append((generation, state_hash))
+        while len(self._order) > self.max_history:
+            old_generation, old_hash = self._order.popleft()
+            if self._seen.get(old_hash) == old_generation:
+                del self._seen[old_hash]
+        return None
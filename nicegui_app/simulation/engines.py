@@ -0,0 +1,89 @@
+"""Registry of array-based simulation engines."""
+
+import os
+from typing import Callable, Dict
+
+from .base import Engine, StepFunctionEngine
+from .bitpacked import step_bitpacked
+from .conway import step_states_python
+from .incremental import IncrementalEngine
+from .jit import HAS_NUMBA, JitEngine
+from .lookup import BlockLookupEngine, LookupEngine
+from .parallel import ProcessPoolEngine, ThreadPoolEngine
+from .rules import RuleEngine, compile_rule, is_rulestring
+from .sparse import AutoEngine, SparseEngine
+from .tiled import TiledEngine
+from .vectorized import VectorizedEngine
+
+# Environment variable that overrides the default engine, e.g. for benchmarks.
+ENGINE_ENV_VAR = "CONWAY_TRAFFIC_ENGINE"
+
+DEFAULT_ENGINE = "numpy"
+
+ENGINE_FACTORIES: Dict[str, Callable[[], Engine]] = {
+    "numpy": VectorizedEngine,
+    "python": lambda: StepFunctionEngine("python", step_states_python),
+    "numba": JitEngine,
+    "bitpacked": lambda: StepFunctionEngine("bitpacked", step_bitpacked),
+    "tiled": TiledEngine,
+    "incremental": IncrementalEngine,
+    "lookup": LookupEngine,
+    "lookup-block": BlockLookupEngine,
+    "sparse": SparseEngine,
+    "auto": AutoEngine,
+    "processes": ProcessPoolEngine,
+    "threads": ThreadPoolEngine,
+}
+
+
+def create_engine(name: str) -> Engine:
+    """Create a new instance of an array-based engine.
+
+    Names that are not registered engines are read as B/S rulestrings,
+    optionally followed by ``":neighbor"`` for barriers that count as
+    traffic neighbors.
+
+    Args:
+        name: Engine name, e.g. "numpy", "tiled", "auto" or "B36/S23"
+
+    Returns:
+        New engine instance
+
+    Raises:
+        ValueError: If the engine name is unknown
+    """
+    factory = ENGINE_FACTORIES.get(name)
+    if factory is not None:
+        return factory()
+    rulestring, _, barriers = name.partition(":")
+    if is_rulestring(rulestring):
+        return RuleEngine(rulestring, barriers or "static")
+    raise ValueError(f"Unknown simulation engine: {name}")
+
+
+def default_engine_name() -> str:
+    """Return the engine new grids step with.
+
+    This is ``DEFAULT_ENGINE`` unless the ``CONWAY_TRAFFIC_ENGINE``
+    environment variable names another engine or rulestring.
+
+    Returns:
+        Engine name
+
+    Raises:
+        ValueError: If the environment variable names an unknown engine, or
+            the Numba engine while Numba is not installed
+    """
+    name = os.environ.get(ENGINE_ENV_VAR, "").strip()
+    if not name:
+        return DEFAULT_ENGINE
+    if name == "numba" and not HAS_NUMBA:
+        # Forcing the backend is for benchmarking it; running the
+        # pure-Python fallback instead would be silently ~1000x slower.
+        raise ValueError(f"{ENGINE_ENV_VAR}=numba requires Numba, which is not installed")
+    if name not in ENGINE_FACTORIES:
+        rulestring, _, barriers = name.partition(":")
+        if not is_rulestring(rulestring):
+            raise ValueError(f"Unknown simulation engine: {name}")
+        compile_rule(rulestring, barriers or "static")
+    return name
@@ -0,0 +1,197 @@
+"""Ensemble engine that steps many independent boards in one batched array.
+
+For Monte Carlo studies of one barrier layout, every board shares the same
+barrier mask and only the traffic differs. The traffic of ``B`` boards is
+kept in a single ``(B, H, W)`` array and all boards are advanced with the
+same shifted-sum kernel as :class:`simulation.vectorized.VectorizedEngine`,
+so the Python overhead is paid once per generation instead of once per
+board.
+
+Each board is also checked for stabilization: a board whose traffic equals
+its traffic ``p`` generations earlier (for ``p`` up to ``max_period``) has
+entered a cycle of period ``p``.
+"""
+
+from collections import deque
+from typing import Deque, Optional, TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from models.grid import Grid
+
+
+class Ensemble:
+    """Batch of boards sharing one barrier mask."""
+
+    def __init__(
+        self, barriers: np.ndarray, traffic: np.ndarray, max_period: int = 2
+    ) -> None:
+        """Initialize an ensemble.
+
+        Args:
+            barriers: Boolean barrier mask with shape (height, width)
+            traffic: Traffic of every board with shape (boards, height, width);
+                nonzero cells are traffic, and traffic on barriers is dropped
+            max_period: Longest cycle period detected per board
+
+        Raises:
+            ValueError: If the shapes do not match or max_period is not positive
+        """
+        if traffic.ndim != 3 or traffic.shape[1:] != barriers.shape:
+            raise ValueError(
+                "Traffic must have shape (boards, height, width) matching barriers"
+            )
+        if max_period <= 0:
+            raise ValueError("Maximum period must be positive")
+
+        self.barriers = np.asarray(barriers, dtype=bool)
+        self._open = ~self.barriers
+        self.traffic = np.logical_and(traffic, self._open).view(np.uint8)
+        self.max_period = max_period
+        self.generation = 0
+
+        boards, height, width = traffic.shape
+        self.stabilized_at = np.full(boards, -1, dtype=np.int64)
+        self.period = np.zeros(boards, dtype=np.int64)
+
+        self._padded = np.zeros((boards, height + 2, width + 2), dtype=np.uint8)
+        self._counts = np.empty(traffic.shape, dtype=np.uint8)
+        self._mask = np.empty(traffic.shape, dtype=bool)
+        # Earlier generations, newest first, plus spare buffers to write into.
+        self._history: Deque[np.ndarray] = deque()
+        self._spare = [np.empty(traffic.shape, dtype=np.uint8) for _ in range(max_period)]
+
+    @classmethod
+    def from_grid(
+        cls,
+        grid: "Grid",
+        boards: int,
+        traffic_density: float = 0.35,
+        seed: Optional[int] = None,
+        max_period: int = 2,
+    ) -> "Ensemble":
+        """Create boards with the grid's barriers and random traffic.
+
+        Args:
+            grid: Grid whose orange cells form the shared barrier layout
+            boards: Number of boards
+            traffic_density: Probability of traffic on each open cell
+            seed: Seed for the random traffic
+            max_period: Longest cycle period detected per board
+
+        Returns:
+            New Ensemble instance
+        """
+        barriers = grid.to_numpy() == 1
+        rng = np.random.default_rng(seed)
+        traffic = rng.random((boards,) + barriers.shape) < traffic_density
+        return cls(barriers, traffic, max_period)
+
+    @property
+    def boards(self) -> int:
+        """Return the number of boards."""
+        return self.traffic.shape[0]
+
+    @property
+    def stabilized(self) -> np.ndarray:
+        """Return a boolean array marking boards that have entered a cycle."""
+        return self.stabilized_at >= 0
+
+    def populations(self) -> np.ndarray:
+        """Return the number of traffic cells on every board.
+
+        Returns:
+            int64 array with shape (boards,)
+        """
+        return np.count_nonzero(self.traffic, axis=(1, 2))
+
+    def board_states(self, index: int) -> np.ndarray:
+        """Return the color states of one board.
+
+        Args:
+            index: Board index
+
+        Returns:
+            New uint8 array of color states with shape (height, width)
+        """
+        return (self.traffic[index] << 1) | self.barriers
+
+    def to_grid(self, index: int) -> "Grid":
+        """Build a grid holding one board.
+
+        Args:
+            index: Board index
+
+        Returns:
+            New Grid instance
+        """
+        from .vectorized import states_to_grid
+
+        return states_to_grid(self.board_states(index))
+
+    def step(self) -> None:
+        """Advance every board by one generation."""
+        padded, counts, mask = self._padded, self._counts, self._mask
+        new = self._spare.pop()
+
+        padded[:, 1:-1, 1:-1] = self.traffic
+        np.add(padded[:, :-2, :-2], padded[:, :-2, 1:-1], out=counts)
+        counts += padded[:, :-2, 2:]
+        counts += padded[:, 1:-1, :-2]
+        counts += padded[:, 1:-1, 2:]
+        counts += padded[:, 2:, :-2]
+        counts += padded[:, 2:, 1:-1]
+        counts += padded[:, 2:, 2:]
+
+        # new = ((counts == 3) | (traffic & counts == 2)) & open
+        np.equal(counts, 2, out=mask)
+        np.logical_and(mask, self.traffic, out=mask)
+        np.equal(counts, 3, out=new.view(bool))
+        np.logical_or(new.view(bool), mask, out=new.view(bool))
+        np.logical_and(new.view(bool), self._open, out=new.view(bool))
+
+        self._history.appendleft(self.traffic)
+        self.traffic = new
+        self.generation += 1
+        self._detect_cycles()
+
+    def _detect_cycles(self) -> None:
+        """Record boards whose new traffic repeats an earlier generation."""
+        pending = ~self.stabilized
+        for period, earlier in enumerate(self._history, start=1):
+            if not pending.any():
+                break
+            np.not_equal(self.traffic, earlier, out=self._mask)
+            repeated = np.flatnonzero(pending & ~self._mask.any(axis=(1, 2)))
+            self.stabilized_at[repeated] = self.generation - period
+            self.period[repeated] = period
+            pending[repeated] = False
+        if len(self._history) >= self.max_period:
+            self._spare.append(self._history.pop())
+
+    def run(self, generations: int, until_stable: bool = False) -> np.ndarray:
+        """Advance every board by several generations.
+
+        Args:
+            generations: Maximum number of generations to advance
+            until_stable: Stop early once every board has entered a cycle
+
+        Returns:
+            int64 array with shape (generations run, boards) holding each
+            board's population after every generation
+
+        Raises:
+            ValueError: If generations is negative
+        """
+        if generations < 0:
+            raise ValueError("Number of generations must be non-negative")
+        populations = []
+        for _ in range(generations):
+            if until_stable and self.stabilized.all():
+                break
+            self.step()
+            populations.append(self.populations())
+        if not populations:
+            return np.zeros((0, self.boards), dtype=np.int64)
+        return np.stack(populations)
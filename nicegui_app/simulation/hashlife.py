@@ -0,0 +1,298 @@
+"""HashLife fast-forward engine for the Conway traffic simulation.
+
+The grid is stored as a quadtree of canonical, hash-consed macrocells whose
+leaves hold color states (0=black, 1=orange, 2=blue). The successor of every
+macrocell is memoized, so repeated structure in space and time lets the
+engine jump ``2**j`` generations at once.
+
+Orange barriers are part of the leaves and never change, so they behave as a
+fixed layer. The grid is embedded in a universe padded with barrier cells:
+outside cells then count as empty and never become traffic, which is exactly
+how :func:`simulation.conway.run_conway_step` treats the bounded edges.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Macrocells up to this level are rendered once and cached as small arrays.
+_BLOCK_LEVEL = 3
+
+
+class Node:
+    """Canonical quadtree macrocell of size ``2**level``.
+
+    Leaves (level 0) hold a color state; larger nodes hold four children.
+    Nodes are created through :meth:`HashLife.join` only, so two nodes with
+    the same contents are always the same object.
+    """
+
+    __slots__ = ("level", "nw", "ne", "sw", "se", "state", "index")
+
+    def __init__(
+        self,
+        level: int,
+        index: int,
+        children: Optional[Tuple["Node", "Node", "Node", "Node"]] = None,
+        state: int = 0,
+    ) -> None:
+        """Initialize a macrocell.
+
+        Args:
+            level: Log2 of the node's side length
+            index: Position of the node in its engine's node table
+            children: (nw, ne, sw, se) children for non-leaf nodes
+            state: Color state for leaf nodes
+        """
+        self.level = level
+        self.index = index
+        self.nw, self.ne, self.sw, self.se = children or (None, None, None, None)
+        self.state = state
+
+
+class HashLife:
+    """Quadtree engine that memoizes macrocells and their successors."""
+
+    def __init__(self) -> None:
+        """Initialize an engine with empty node and result caches."""
+        self._nodes: List[Node] = [Node(0, index=state, state=state) for state in range(3)]
+        self._table: Dict[Tuple[Node, Node, Node, Node], Node] = {}
+        self._results: Dict[Tuple[Node, int], Node] = {}
+        self._barriers: List[Node] = [self._nodes[1]]
+        self._blocks: Dict[Node, np.ndarray] = {}
+
+    def join(self, nw: Node, ne: Node, sw: Node, se: Node) -> Node:
+        """Return the canonical node with the given four children.
+
+        Args:
+            nw: North-west child
+            ne: North-east child
+            sw: South-west child
+            se: South-east child
+
+        Returns:
+            Node one level above its children
+        """
+        key = (nw, ne, sw, se)
+        node = self._table.get(key)
+        if node is None:
+            node = Node(nw.level + 1, len(self._nodes), children=key)
+            self._nodes.append(node)
+            self._table[key] = node
+        return node
+
+    def barrier_node(self, level: int) -> Node:
+        """Return the node of the given level filled with orange barriers.
+
+        Args:
+            level: Log2 of the node's side length
+
+        Returns:
+            Canonical all-barrier node
+        """
+        while len(self._barriers) <= level:
+            child = self._barriers[-1]
+            self._barriers.append(self.join(child, child, child, child))
+        return self._barriers[level]
+
+    def _centre(self, node: Node) -> Node:
+        """Embed a node in the center of a node one level up, padded with barriers."""
+        pad = self.barrier_node(node.level - 1)
+        return self.join(
+            self.join(pad, pad, pad, node.nw),
+            self.join(pad, pad, node.ne, pad),
+            self.join(pad, node.sw, pad, pad),
+            self.join(node.se, pad, pad, pad),
+        )
+
+    def _base(self, node: Node) -> Node:
+        """Advance the inner 2x2 of a 4x4 node by one generation."""
+        rows = [
+            [node.nw.nw, node.nw.ne, node.ne.nw, node.ne.ne],
+            [node.nw.sw, node.nw.se, node.ne.sw, node.ne.se],
+            [node.sw.nw, node.sw.ne, node.se.nw, node.se.ne],
+            [node.sw.sw, node.sw.se, node.se.sw, node.se.se],
+        ]
+        states = [[leaf.state for leaf in row] for row in rows]
+
+        inner = []
+        for y, x in ((1, 1), (1, 2), (2, 1), (2, 2)):
+            state = states[y][x]
+            if state == 1:
+                inner.append(state)  # orange barriers are a fixed layer
+                continue
+            traffic_neighbors = sum(
+                states[y + dy][x + dx] == 2
+                for dy in (-1, 0, 1)
+                for dx in (-1, 0, 1)
+                if dx or dy
+            )
+            if traffic_neighbors == 3 or (state == 2 and traffic_neighbors == 2):
+                inner.append(2)
+            else:
+                inner.append(0)
+        return self.join(*(self._nodes[state] for state in inner))
+
+    def successor(self, node: Node, j: Optional[int] = None) -> Node:
+        """Return the center of a node advanced by ``2**j`` generations.
+
+        Args:
+            node: Node of level 2 or higher
+            j: Log2 of the number of generations, at most ``node.level - 2``
+                (defaults to the maximum)
+
+        Returns:
+            Node one level below ``node`` covering its central region
+        """
+        j = node.level - 2 if j is None else min(j, node.level - 2)
+        key = (node, j)
+        result = self._results.get(key)
+        if result is not None:
+            return result
+
+        if node.level == 2:
+            result = self._base(node)
+        else:
+            nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+            join = self.join
+            c1 = self.successor(nw, j)
+            c2 = self.successor(join(nw.ne, ne.nw, nw.se, ne.sw), j)
+            c3 = self.successor(ne, j)
+            c4 = self.successor(join(nw.sw, nw.se, sw.nw, sw.ne), j)
+            c5 = self.successor(join(nw.se, ne.sw, sw.ne, se.nw), j)
+            c6 = self.successor(join(ne.sw, ne.se, se.nw, se.ne), j)
+            c7 = self.successor(sw, j)
+            c8 = self.successor(join(sw.ne, se.nw, sw.se, se.sw), j)
+            c9 = self.successor(se, j)
+
+            if j < node.level - 2:
+                result = join(
+                    join(c1.se, c2.sw, c4.ne, c5.nw),
+                    join(c2.se, c3.sw, c5.ne, c6.nw),
+                    join(c4.se, c5.sw, c7.ne, c8.nw),
+                    join(c5.se, c6.sw, c8.ne, c9.nw),
+                )
+            else:
+                result = join(
+                    self.successor(join(c1, c2, c4, c5), j),
+                    self.successor(join(c2, c3, c5, c6), j),
+                    self.successor(join(c4, c5, c7, c8), j),
+                    self.successor(join(c5, c6, c8, c9), j),
+                )
+
+        self._results[key] = result
+        return result
+
+    def from_states(self, states: np.ndarray, level: int) -> Node:
+        """Build a root node with the states placed in its central region.
+
+        The states are placed at offset ``2**(level - 2)`` in both directions
+        and everything around them is filled with orange barriers.
+
+        Args:
+            states: Array of color states with shape (height, width)
+            level: Level of the root node; ``2**(level - 1)`` must be at
+                least the larger grid dimension
+
+        Returns:
+            Root node of the given level
+        """
+        height, width = states.shape
+        size = 1 << level
+        offset = size // 4
+        universe = np.ones((size, size), dtype=np.int64)
+        universe[offset : offset + height, offset : offset + width] = states
+
+        # Build the tree bottom-up, interning each distinct group of four
+        # children once per level.
+        ids = universe
+        while ids.shape[0] > 1:
+            quads = np.stack(
+                [ids[0::2, 0::2], ids[0::2, 1::2], ids[1::2, 0::2], ids[1::2, 1::2]],
+                axis=-1,
+            )
+            unique, inverse = np.unique(quads.reshape(-1, 4), axis=0, return_inverse=True)
+            parents = np.array(
+                [
+                    self.join(*(self._nodes[index] for index in quad)).index
+                    for quad in unique.tolist()
+                ],
+                dtype=np.int64,
+            )
+            ids = parents[inverse.reshape(-1)].reshape(quads.shape[:2])
+        return self._nodes[int(ids[0, 0])]
+
+    def _block(self, node: Node) -> np.ndarray:
+        """Return the color states of a small node as a cached array."""
+        block = self._blocks.get(node)
+        if block is None:
+            if node.level == 0:
+                block = np.full((1, 1), node.state, dtype=np.uint8)
+            else:
+                block = np.block(
+                    [
+                        [self._block(node.nw), self._block(node.ne)],
+                        [self._block(node.sw), self._block(node.se)],
+                    ]
+                )
+            self._blocks[node] = block
+        return block
+
+    def _render(self, node: Node, out: np.ndarray, x: int, y: int) -> None:
+        """Write the part of a node that overlaps ``out`` with its corner at (x, y)."""
+        height, width = out.shape
+        size = 1 << node.level
+        if x >= width or y >= height or x + size <= 0 or y + size <= 0:
+            return
+        if node.level <= _BLOCK_LEVEL:
+            block = self._block(node)
+            top, left = max(0, -y), max(0, -x)
+            bottom, right = min(size, height - y), min(size, width - x)
+            out[y + top : y + bottom, x + left : x + right] = block[top:bottom, left:right]
+            return
+        half = size // 2
+        self._render(node.nw, out, x, y)
+        self._render(node.ne, out, x + half, y)
+        self._render(node.sw, out, x, y + half)
+        self._render(node.se, out, x + half, y + half)
+
+    def advance(self, states: np.ndarray, generations: int) -> np.ndarray:
+        """Advance an array of color states by any number of generations.
+
+        The generation count is split into powers of two and each power is
+        applied as a single memoized jump. The universe is grown with barrier
+        padding only as far as the largest jump needs.
+
+        Args:
+            states: Current color states with shape (height, width)
+            generations: Number of generations to advance
+
+        Returns:
+            New array holding the advanced color states
+
+        Raises:
+            ValueError: If generations is negative
+        """
+        if generations < 0:
+            raise ValueError("Number of generations must be non-negative")
+        height, width = states.shape
+
+        level = max(2, (max(width, height) - 1).bit_length() + 1)
+        root = self.from_states(states, level)
+        # Distance from the root's corner to the grid's corner. Re-centering a
+        # successor keeps it unchanged; only growing the universe moves it.
+        offset = 1 << (level - 2)
+
+        j = 0
+        while generations:
+            if generations & 1:
+                while root.level < j + 2:
+                    offset += 1 << (root.level - 1)
+                    root = self._centre(root)
+                root = self._centre(self.successor(root, j))
+            generations >>= 1
+            j += 1
+
+        out = np.empty((height, width), dtype=np.uint8)
+        self._render(root, out, -offset, -offset)
+        return out
@@ -0,0 +1,292 @@
+"""Compressed, bounded history of recent generations for time travel.
+
+Keeping a full copy of every generation is far too large for thousands of
+generations, and consecutive generations differ in only a few cells. The
+history therefore stores a keyframe every ``keyframe_interval`` generations
+and, in between, the XOR of each generation with the one before it. Both
+are run-length encoded: only the runs of nonzero bytes are kept, as run
+starts, run lengths and the bytes themselves. On a busy board the runs are
+short and the encoding outgrows the board, so a frame whose runs would take
+more room than packing every cell into two bits (states and their XORs are
+all below 4) is stored bit-packed instead.
+
+Frames live in a ring buffer with a memory cap. When the cap is exceeded the
+oldest generation is dropped; if a keyframe goes, the delta after it is
+rebuilt into the new keyframe. Any retained generation is reconstructed
+from its keyframe by applying at most ``keyframe_interval - 1`` deltas.
+"""
+
+from bisect import bisect_right
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+DEFAULT_KEYFRAME_INTERVAL = 64
+
+_NO_RUNS = np.empty(0, dtype=np.int32)
+
+_NO_VALUES = np.empty(0, dtype=np.uint8)
+
+# Bit offsets of the four cells packed into each byte.
+_SHIFTS = np.array([0, 2, 4, 6], dtype=np.uint8)
+
+
+class Frame:
+    """One keyframe or XOR delta, run-length encoded or bit-packed."""
+
+    __slots__ = ("generation", "starts", "lengths", "values", "packed")
+
+    def __init__(self, generation: int, data: np.ndarray) -> None:
+        """Encode a flat array in whichever form is smaller.
+
+        Args:
+            generation: Generation the frame belongs to
+            data: Flat uint8 array of values below 4; the states for a
+                keyframe, or the XOR of two consecutive generations for a
+                delta
+        """
+        nonzero = np.zeros(data.size + 2, dtype=bool)
+        np.not_equal(data, 0, out=nonzero[1:-1])
+        edges = np.flatnonzero(nonzero[1:] != nonzero[:-1]).astype(np.int32)
+        self.generation = generation
+        # The runs cost their starts and lengths (together, the edges) plus
+        # one byte per nonzero cell.
+        if edges.nbytes + np.count_nonzero(nonzero) < _packed_size(data.size):
+            self.starts = edges[::2].copy()
+            self.lengths = edges[1::2] - self.starts
+            self.values = data[nonzero[1:-1]]
+            self.packed = None
+        else:
+            self.starts = self.lengths = _NO_RUNS
+            self.values = _NO_VALUES
+            self.packed = _pack(data)
+
+    @property
+    def nbytes(self) -> int:
+        """Return the memory used by the encoded frame."""
+        if self.packed is not None:
+            return self.packed.nbytes
+        return self.starts.nbytes + self.lengths.nbytes + self.values.nbytes
+
+    def apply(self, board: np.ndarray) -> None:
+        """XOR the frame into a flat board in place.
+
+        Args:
+            board: Flat uint8 array, all zeros for a keyframe or the previous
+                generation for a delta
+        """
+        if self.packed is not None:
+            board ^= _unpack(self.packed, board.size)
+            return
+        if not len(self.values):
+            return
+        # Flat index of every encoded byte: each run's start, repeated over
+        # the run, plus the byte's position inside the run.
+        offsets = np.cumsum(self.lengths) - self.lengths
+        indices = np.repeat(self.starts - offsets, self.lengths)
+        indices += np.arange(len(self.values), dtype=np.int32)
+        board[indices] ^= self.values
+
+
+def _packed_size(size: int) -> int:
+    """Return the bytes needed to pack ``size`` two-bit values."""
+    return (size + 3) // 4
+
+
+def _pack(data: np.ndarray) -> np.ndarray:
+    """Pack a flat array of values below 4 into two bits per value."""
+    quads = np.zeros((_packed_size(data.size), 4), dtype=np.uint8)
+    quads.ravel()[: data.size] = data
+    quads <<= _SHIFTS
+    return np.bitwise_or.reduce(quads, axis=1)
+
+
+def _unpack(packed: np.ndarray, size: int) -> np.ndarray:
+    """Expand two-bit values packed by :func:`_pack` back to ``size`` bytes."""
+    quads = packed[:, None] >> _SHIFTS
+    quads &= 3
+    return quads.ravel()[:size]
+
+
+class History:
+    """Ring buffer of recent generations under a memory cap."""
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL,
+    ) -> None:
+        """Initialize an empty history.
+
+        Args:
+            max_bytes: Memory cap for the encoded frames plus the one
+                uncompressed copy of the latest generation; the latest
+                generation is always kept even if it alone exceeds the cap
+            keyframe_interval: Number of generations per keyframe
+
+        Raises:
+            ValueError: If max_bytes or keyframe_interval is not positive
+        """
+        if max_bytes <= 0:
+            raise ValueError("Memory cap must be positive")
+        if keyframe_interval <= 0:
+            raise ValueError("Keyframe interval must be positive")
+        self.max_bytes = max_bytes
+        self.keyframe_interval = keyframe_interval
+        # Each segment is a keyframe followed by its deltas, oldest first.
+        self._segments: List[List[Frame]] = []
+        self._last: Optional[np.ndarray] = None
+        self._shape: Optional[Tuple[int, int]] = None
+        self._count = 0
+        self._nbytes = 0
+
+    def __len__(self) -> int:
+        """Return the number of retained generations."""
+        return self._count
+
+    def __contains__(self, generation: object) -> bool:
+        """Return whether a generation is retained."""
+        return isinstance(generation, int) and self._find(generation) is not None
+
+    @property
+    def nbytes(self) -> int:
+        """Return the memory counted against the cap."""
+        return self._nbytes
+
+    @property
+    def generations(self) -> List[int]:
+        """Return the retained generation numbers, oldest first."""
+        return [frame.generation for segment in self._segments for frame in segment]
+
+    @property
+    def first(self) -> Optional[int]:
+        """Return the oldest retained generation, or None if empty."""
+        return self._segments[0][0].generation if self._segments else None
+
+    @property
+    def last(self) -> Optional[int]:
+        """Return the newest retained generation, or None if empty."""
+        return self._segments[-1][-1].generation if self._segments else None
+
+    def clear(self) -> None:
+        """Forget all generations."""
+        self._segments = []
+        self._last = None
+        self._shape = None
+        self._count = 0
+        self._nbytes = 0
+
+    def record(self, generation: int, states: np.ndarray) -> None:
+        """Append a generation.
+
+        Generations are expected in increasing order. Recording a generation
+        at or before the newest one (after rewinding, for example) first
+        drops that generation and everything after it; a board of a
+        different shape starts a new history.
+
+        Args:
+            generation: Generation number of the board
+            states: Color states with shape (height, width)
+        """
+        if states.shape != self._shape:
+            self.clear()
+            self._shape = states.shape
+        elif self.last is not None and generation <= self.last:
+            self.truncate(generation)
+
+        flat = np.ravel(states)
+        if self._last is None or len(self._segments[-1]) >= self.keyframe_interval:
+            frame = Frame(generation, flat)
+            self._segments.append([frame])
+        else:
+            frame = Frame(generation, flat ^ self._last)
+            self._segments[-1].append(frame)
+
+        if self._last is None:
+            self._last = flat.copy()
+            self._nbytes += self._last.nbytes
+        else:
+            np.copyto(self._last, flat)
+        self._count += 1
+        self._nbytes += frame.nbytes
+
+        while self._nbytes > self.max_bytes and self._count > 1:
+            self._evict()
+
+    def truncate(self, generation: int) -> None:
+        """Drop a generation and every newer one.
+
+        Args:
+            generation: First generation to drop
+        """
+        while self._segments and self._segments[-1][0].generation >= generation:
+            for frame in self._segments.pop():
+                self._count -= 1
+                self._nbytes -= frame.nbytes
+        if self._segments:
+            segment = self._segments[-1]
+            keep = bisect_right([frame.generation for frame in segment], generation - 1)
+            for frame in segment[keep:]:
+                self._count -= 1
+                self._nbytes -= frame.nbytes
+            del segment[keep:]
+        if self._segments:
+            np.copyto(self._last, self._decode(len(self._segments) - 1, None))
+        else:
+            shape = self._shape
+            self.clear()
+            self._shape = shape
+
+    def states_at(self, generation: int) -> np.ndarray:
+        """Reconstruct the board of a retained generation.
+
+        Args:
+            generation: Generation number
+
+        Returns:
+            New uint8 array of color states with shape (height, width)
+
+        Raises:
+            KeyError: If the generation is not retained
+        """
+        found = self._find(generation)
+        if found is None:
+            raise KeyError(f"Generation {generation} is not in the history")
+        return self._decode(*found).reshape(self._shape)
+
+    def _find(self, generation: int) -> Optional[Tuple[int, int]]:
+        """Return the (segment, frame) indices of a generation, if retained."""
+        starts = [segment[0].generation for segment in self._segments]
+        index = bisect_right(starts, generation) - 1
+        if index < 0:
+            return None
+        segment = self._segments[index]
+        position = bisect_right([frame.generation for frame in segment], generation) - 1
+        if segment[position].generation != generation:
+            return None
+        return index, position
+
+    def _decode(self, index: int, position: Optional[int]) -> np.ndarray:
+        """Apply a segment's keyframe and deltas up to a frame (the last if None)."""
+        segment = self._segments[index]
+        stop = len(segment) if position is None else position + 1
+        board = np.zeros(self._shape[0] * self._shape[1], dtype=np.uint8)
+        for frame in segment[:stop]:
+            frame.apply(board)
+        return board
+
+    def _evict(self) -> None:
+        """Drop the oldest generation, promoting the next one to a keyframe."""
+        segment = self._segments[0]
+        if len(segment) == 1:
+            self._segments.pop(0)
+        else:
+            board = self._decode(0, 1)
+            keyframe = Frame(segment[1].generation, board)
+            self._nbytes += keyframe.nbytes - segment[1].nbytes
+            segment[1] = keyframe
+        self._count -= 1
+        self._nbytes -= segment[0].nbytes
+        del segment[0]
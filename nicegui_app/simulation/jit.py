@@ -0,0 +1,157 @@
+"""Optional Numba-compiled stepping kernels with a pure-Python fallback.
+
+The kernels below are plain loops over the cells, the way
+:func:`simulation.conway.run_conway_step` is written, which is what Numba
+compiles well. :func:`step_cells` walks an irregular list of candidate
+cells, which NumPy can only handle through fancy-indexed temporaries; the
+incremental engine uses it for its candidate lists when Numba is present.
+Numba is detected at import time: when it is installed the loops are
+compiled to machine code on first use, otherwise whole-board steps fall
+back to :func:`simulation.conway.step_states_python`.
+"""
+
+from typing import Optional
+
+import numpy as np
+
+from .base import Engine
+from .conway import step_states_python
+
+try:
+    import numba
+except ImportError:  # pragma: no cover - depends on the environment
+    numba = None
+
+HAS_NUMBA = numba is not None
+
+# Backend used by the kernels in this module: "numba" or "python".
+BACKEND = "numba" if HAS_NUMBA else "python"
+
+
+def _next_state(states: np.ndarray, y: int, x: int) -> int:
+    """Return the next color state of one cell."""
+    state = states[y, x]
+    if state == 1:
+        return 1  # orange barriers don't evolve
+
+    height, width = states.shape
+    traffic_neighbors = 0
+    for ny in range(max(y - 1, 0), min(y + 2, height)):
+        for nx in range(max(x - 1, 0), min(x + 2, width)):
+            if (nx != x or ny != y) and states[ny, nx] == 2:
+                traffic_neighbors += 1
+
+    if traffic_neighbors == 3 or (state == 2 and traffic_neighbors == 2):
+        return 2
+    return 0
+
+
+def _step_board(states: np.ndarray, out: np.ndarray) -> None:
+    """Write the next generation of every cell into ``out``."""
+    height, width = states.shape
+    for y in range(height):
+        for x in range(width):
+            out[y, x] = _next_state(states, y, x)
+
+
+def _step_cells(
+    states: np.ndarray, counts: np.ndarray, ys: np.ndarray, xs: np.ndarray, changed: np.ndarray
+) -> int:
+    """Step listed cells against a padded neighbor-count field in place.
+
+    Every cell is decided from the counts of the current generation before
+    any count is patched. Returns how many leading entries of ``changed``
+    hold the list positions of cells that changed.
+    """
+    changes = 0
+    for index in range(ys.shape[0]):
+        y, x = ys[index], xs[index]
+        state = states[y, x]
+        count = counts[y + 1, x + 1]
+        if state == 0 and count == 3:
+            states[y, x] = 2
+        elif state == 2 and count != 2 and count != 3:
+            states[y, x] = 0
+        else:
+            continue
+        changed[changes] = index
+        changes += 1
+
+    for position in range(changes):
+        index = changed[position]
+        y, x = ys[index], xs[index]
+        delta = 1 if states[y, x] == 2 else -1
+        for dy in range(3):
+            for dx in range(3):
+                if dy != 1 or dx != 1:
+                    counts[y + dy, x + dx] += delta
+    return changes
+
+
+if HAS_NUMBA:
+    # Rebinding the module global makes the compiled loop call the
+    # compiled _next_state.
+    _next_state = numba.njit(cache=True)(_next_state)
+    _step_board = numba.njit(cache=True)(_step_board)
+    _step_cells = numba.njit(cache=True)(_step_cells)
+
+
+def step_states_jit(states: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Advance an array of color states by one generation with the best backend.
+
+    Args:
+        states: Current color states with shape (height, width)
+        out: Optional array to write the next generation into
+
+    Returns:
+        Array holding the next generation (``out`` if it was given)
+    """
+    if not HAS_NUMBA:
+        return step_states_python(states, out)
+    if out is None:
+        out = np.empty(states.shape, dtype=np.uint8)
+    _step_board(states, out)
+    return out
+
+
+def step_cells(
+    states: np.ndarray, counts: np.ndarray, ys: np.ndarray, xs: np.ndarray
+) -> np.ndarray:
+    """Advance an irregular list of cells by one generation in place.
+
+    Args:
+        states: Color states with shape (height, width), updated in place
+        counts: Padded neighbor counts as built by
+            :func:`simulation.incremental.padded_neighbor_counts`, patched
+            in place for the changed cells
+        ys: Row of each cell; cells must be distinct
+        xs: Column of each cell
+
+    Returns:
+        Positions in ``ys``/``xs`` of the cells that changed
+    """
+    changed = np.empty(len(ys), dtype=np.intp)
+    return changed[: _step_cells(states, counts, ys, xs, changed)]
+
+
+class JitEngine(Engine):
+    """Engine running the per-cell loop, compiled with Numba when available."""
+
+    name = "numba"
+
+    @property
+    def backend(self) -> str:
+        """Return the backend in use ("numba" or "python")."""
+        return BACKEND
+
+    def step(self, states: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Advance an array of color states by one generation.
+
+        Args:
+            states: Current color states with shape (height, width)
+            out: Optional array to write the next generation into
+
+        Returns:
+            Array holding the next generation (``out`` if it was given)
+        """
+        return step_states_jit(states, out)
@@ -0,0 +1,307 @@
+"""Parallel engines that split the grid into horizontal bands of rows.
+
+:class:`ProcessPoolEngine` keeps a persistent pool of worker processes that
+step their bands over two buffers in :mod:`multiprocessing.shared_memory`.
+Each worker reads the one-row halos above and below its band straight from
+the shared source buffer, and all workers meet at a barrier before the
+buffers are swapped, so halos are exchanged every generation without any
+copying or message passing.
+
+:class:`ThreadPoolEngine` runs the same band kernel on a thread pool inside
+the current process. NumPy releases the GIL inside its array loops, so the
+bands run concurrently without the cost of starting processes.
+"""
+
+import multiprocessing
+import os
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .base import Engine
+from .vectorized import BandScratch, step_rows
+
+
+# Bands smaller than this spend more time on thread handoff than on work.
+MIN_BAND_ROWS = 16
+
+
+def split_bands(height: int, workers: int) -> List[Tuple[int, int]]:
+    """Split rows into at most ``workers`` contiguous, non-empty bands.
+
+    Args:
+        height: Number of rows
+        workers: Maximum number of bands
+
+    Returns:
+        List of (start, stop) row ranges covering all rows
+    """
+    count = max(1, min(workers, height))
+    edges = [height * index // count for index in range(count + 1)]
+    return list(zip(edges[:-1], edges[1:]))
+
+
+def _band_worker(
+    names: Sequence[str],
+    shape: Tuple[int, int],
+    band: Tuple[int, int],
+    barrier,
+    conn: Connection,
+) -> None:
+    """Step one band of rows for as many generations as the parent asks."""
+    blocks = [SharedMemory(name=name) for name in names]
+    buffers = [np.ndarray(shape, dtype=np.uint8, buffer=block.buf) for block in blocks]
+    start, stop = band
+    scratch = BandScratch(stop - start, shape[1])
+    try:
+        while True:
+            command = conn.recv()
+            if command is None:
+                break
+            source, generations = command
+            for _ in range(generations):
+                step_rows(buffers[source], buffers[1 - source], start, stop, scratch)
+                barrier.wait()
+                source = 1 - source
+            conn.send(source)
+    finally:
+        del buffers
+        for block in blocks:
+            block.close()
+
+
+def _shutdown(owner: int, processes, conns, blocks) -> None:
+    """Stop the workers and release the shared memory.
+
+    Forked processes inherit the finalizers of every engine alive at fork
+    time, so this does nothing outside the process that started the pool.
+    """
+    if os.getpid() != owner:
+        return
+    for conn in conns:
+        try:
+            conn.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+    for process in processes:
+        process.join(timeout=5)
+        if process.is_alive():
+            process.terminate()
+    for conn in conns:
+        conn.close()
+    for block in blocks:
+        block.close()
+        block.unlink()
+
+
+class ProcessPoolEngine(Engine):
+    """Engine that steps row bands in persistent worker processes.
+
+    The workers and the shared buffers are created on first use and kept
+    until :meth:`close` is called or the grid shape changes.
+    """
+
+    name = "processes"
+
+    def __init__(self, workers: Optional[int] = None, start_method: Optional[str] = None) -> None:
+        """Initialize the engine.
+
+        Args:
+            workers: Number of worker processes (defaults to the CPU count)
+            start_method: multiprocessing start method (defaults to the
+                platform default)
+
+        Raises:
+            ValueError: If workers is not positive
+        """
+        if workers is not None and workers <= 0:
+            raise ValueError("Number of workers must be positive")
+        self.workers = workers or os.cpu_count() or 1
+        self._context = multiprocessing.get_context(start_method)
+        self._shape: Optional[Tuple[int, int]] = None
+        self._buffers: List[np.ndarray] = []
+        self._conns: List[Connection] = []
+        self._finalizer: Optional[weakref.finalize] = None
+
+    def _start(self, shape: Tuple[int, int]) -> None:
+        """Create the shared buffers and start one worker per band."""
+        self.close()
+        size = shape[0] * shape[1]
+        blocks = [SharedMemory(create=True, size=size) for _ in range(2)]
+        bands = split_bands(shape[0], self.workers)
+        barrier = self._context.Barrier(len(bands))
+
+        processes = []
+        for band in bands:
+            parent_conn, child_conn = self._context.Pipe()
+            process = self._context.Process(
+                target=_band_worker,
+                args=([block.name for block in blocks], shape, band, barrier, child_conn),
+                daemon=True,
+            )
+            process.start()
+            child_conn.close()
+            processes.append(process)
+            self._conns.append(parent_conn)
+
+        self._buffers = [
+            np.ndarray(shape, dtype=np.uint8, buffer=block.buf) for block in blocks
+        ]
+        self._shape = shape
+        self._finalizer = weakref.finalize(
+            self, _shutdown, os.getpid(), processes, self._conns, blocks
+        )
+
+    def close(self) -> None:
+        """Stop the worker processes and release the shared memory."""
+        self._buffers = []
+        if self._finalizer is not None:
+            self._finalizer()
+        self._finalizer = None
+        self._conns = []
+        self._shape = None
+
+    def _run_shared(self, states: np.ndarray, generations: int) -> np.ndarray:
+        """Run the workers and return the shared buffer holding the result."""
+        if self._shape != states.shape:
+            self._start(states.shape)
+        self._buffers[0][...] = states
+        for conn in self._conns:
+            conn.send((0, generations))
+        sources = [conn.recv() for conn in self._conns]
+        return self._buffers[sources[0]]
+
+    def run(
+        self, states: np.ndarray, generations: int, out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Advance an array of color states by several generations in parallel.
+
+        Args:
+            states: Current color states with shape (height, width)
+            generations: Number of generations to advance
+            out: Optional array to write the final generation into
+
+        Returns:
+            Array holding the final generation (``out`` if it was given)
+        """
+        result = self._run_shared(states, generations)
+        if out is None:
+            return result.copy()
+        out[...] = result
+        return out
+
+    def step(self, states: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Advance an array of color states by one generation.
+
+        Args:
+            states: Current color states with shape (height, width)
+            out: Optional array to write the next generation into
+
+        Returns:
+            Array holding the next generation (``out`` if it was given)
+        """
+        result = self._run_shared(states, 1)
+        if out is None:
+            return result.copy()
+        out[...] = result
+        return out
+
+    def __enter__(self) -> "ProcessPoolEngine":
+        """Return the engine for use as a context manager."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Stop the workers when leaving the context."""
+        self.close()
+
+
+class ThreadPoolEngine(Engine):
+    """Engine that steps row bands on a thread pool.
+
+    The engine owns two output buffers and alternates between them, and
+    each band keeps its own scratch arrays, so stepping allocates no new
+    board-sized arrays.
+    """
+
+    name = "threads"
+
+    def __init__(self, workers: Optional[int] = None) -> None:
+        """Initialize the engine.
+
+        Args:
+            workers: Number of worker threads (defaults to the CPU count)
+
+        Raises:
+            ValueError: If workers is not positive
+        """
+        if workers is not None and workers <= 0:
+            raise ValueError("Number of workers must be positive")
+        self.workers = workers or os.cpu_count() or 1
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="conway-band"
+        )
+        self._buffers: List[np.ndarray] = []
+        self._scratch: Dict[Tuple[int, int, int], BandScratch] = {}
+
+    def _band_scratch(self, start: int, stop: int, width: int) -> BandScratch:
+        """Return the scratch arrays of a band, allocating them on first use."""
+        key = (start, stop, width)
+        scratch = self._scratch.get(key)
+        if scratch is None:
+            if len(self._scratch) >= 4 * self.workers:
+                self._scratch.clear()  # the grid was resized
+            scratch = self._scratch[key] = BandScratch(stop - start, width)
+        return scratch
+
+    def _next_buffer(self, states: np.ndarray) -> np.ndarray:
+        """Return the output buffer that does not hold ``states``."""
+        if not self._buffers or self._buffers[0].shape != states.shape:
+            self._buffers = [np.empty(states.shape, dtype=np.uint8) for _ in range(2)]
+        return self._buffers[1] if states is self._buffers[0] else self._buffers[0]
+
+    def step(self, states: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Advance an array of color states by one generation.
+
+        Args:
+            states: Current color states with shape (height, width)
+            out: Optional array to write the next generation into; defaults
+                to whichever of the engine's two buffers is not ``states``
+
+        Returns:
+            Array holding the next generation
+        """
+        if out is None:
+            out = self._next_buffer(states)
+        height, width = states.shape
+        bands = split_bands(height, min(self.workers, max(1, height // MIN_BAND_ROWS)))
+        if len(bands) == 1:
+            step_rows(states, out, 0, height, self._band_scratch(0, height, width))
+            return out
+
+        futures = [
+            self._executor.submit(
+                step_rows, states, out, start, stop, self._band_scratch(start, stop, width)
+            )
+            for start, stop in bands
+        ]
+        for future in futures:
+            future.result()
+        return out
+
+    def close(self) -> None:
+        """Shut down the worker threads."""
+        self._executor.shutdown(wait=True)
+        self._buffers = []
+        self._scratch = {}
+
+    def __enter__(self) -> "ThreadPoolEngine":
+        """Return the engine for use as a context manager."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Shut down the worker threads when leaving the context."""
+        self.close()
@@ -0,0 +1,267 @@
+"""Life-like rules given as B/S rulestrings, compiled into vectorized kernels.
+
+A rulestring such as ``B3/S23`` (Conway, the default traffic rule) or
+``B36/S23`` (HighLife) lists the traffic-neighbor counts for which an empty
+cell becomes traffic (``B``) and for which traffic survives (``S``).
+
+Barriers are part of the rule too. With ``"static"`` barrier semantics (the
+default and the behavior of every other engine) orange cells never change
+and do not count as traffic neighbors. With ``"neighbor"`` semantics they
+still never change but count as a traffic neighbor, like a wall of parked
+cars.
+
+Each rule is compiled once, and cached by rulestring, into runs of
+consecutive neighbor counts; the kernel tests membership with one or two
+in-place comparisons per run on top of the same shifted-sum count as the
+built-in engine, so a custom rule steps about as fast as Conway's.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Tuple, Union, TYPE_CHECKING
+
+import numpy as np
+
+from .base import Engine
+
+if TYPE_CHECKING:
+    from .barriers import BarrierLayer
+
+BARRIER_MODES = ("static", "neighbor")
+
+CONWAY_RULE = "B3/S23"
+
+_RULESTRING = re.compile(r"^B([0-8]*)/?S([0-8]*)$", re.IGNORECASE)
+
+
+def _runs(counts: FrozenSet[int]) -> List[Tuple[int, int]]:
+    """Split a set of neighbor counts into runs of consecutive values."""
+    runs: List[Tuple[int, int]] = []
+    for count in sorted(counts):
+        if runs and runs[-1][1] == count - 1:
+            runs[-1] = (runs[-1][0], count)
+        else:
+            runs.append((count, count))
+    return runs
+
+
+class Rule:
+    """Compiled B/S rule for the traffic layer."""
+
+    __slots__ = ("birth", "survival", "barriers", "birth_runs", "survival_runs")
+
+    def __init__(
+        self, birth: FrozenSet[int], survival: FrozenSet[int], barriers: str = "static"
+    ) -> None:
+        """Initialize a rule and compile its count runs.
+
+        Args:
+            birth: Neighbor counts for which an empty cell becomes traffic
+            survival: Neighbor counts for which traffic survives
+            barriers: Barrier semantics ("static" or "neighbor")
+
+        Raises:
+            ValueError: If a count is outside 0-8 or the barrier mode is unknown
+        """
+        if barriers not in BARRIER_MODES:
+            raise ValueError(f"Unknown barrier mode: {barriers}")
+        if any(not 0 <= count <= 8 for count in birth | survival):
+            raise ValueError("Neighbor counts must be between 0 and 8")
+        self.birth = frozenset(birth)
+        self.survival = frozenset(survival)
+        self.barriers = barriers
+        self.birth_runs = _runs(self.birth)
+        self.survival_runs = _runs(self.survival)
+
+    @property
+    def rulestring(self) -> str:
+        """Return the canonical rulestring, e.g. ``"B36/S23"``."""
+        birth = "".join(str(count) for count in sorted(self.birth))
+        survival = "".join(str(count) for count in sorted(self.survival))
+        return f"B{birth}/S{survival}"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Rule):
+            return NotImplemented
+        return (self.birth, self.survival, self.barriers) == (
+            other.birth,
+            other.survival,
+            other.barriers,
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.birth, self.survival, self.barriers))
+
+    def __repr__(self) -> str:
+        return f"Rule({self.rulestring!r}, barriers={self.barriers!r})"
+
+
+def parse_rulestring(rulestring: str) -> Tuple[FrozenSet[int], FrozenSet[int]]:
+    """Parse a B/S rulestring into birth and survival counts.
+
+    Args:
+        rulestring: Rule such as ``"B3/S23"``; case and the slash are optional
+
+    Returns:
+        Tuple of (birth counts, survival counts)
+
+    Raises:
+        ValueError: If the rulestring is malformed
+    """
+    match = _RULESTRING.match(rulestring.strip())
+    if match is None:
+        raise ValueError(f"Invalid rulestring: {rulestring}")
+    birth, survival = match.groups()
+    return frozenset(int(c) for c in birth), frozenset(int(c) for c in survival)
+
+
+@lru_cache(maxsize=None)
+def _compile(birth: FrozenSet[int], survival: FrozenSet[int], barriers: str) -> Rule:
+    """Compile a rule once per distinct set of counts and barrier mode."""
+    return Rule(birth, survival, barriers)
+
+
+def compile_rule(rulestring: str, barriers: str = "static") -> Rule:
+    """Return the compiled rule for a rulestring, compiling it on first use.
+
+    Equivalent spellings (``"b36s23"``, ``"B63/S32"``) share one compiled rule.
+
+    Args:
+        rulestring: Rule such as ``"B3/S23"``
+        barriers: Barrier semantics ("static" or "neighbor")
+
+    Returns:
+        Cached Rule instance
+
+    Raises:
+        ValueError: If the rulestring or barrier mode is invalid
+    """
+    birth, survival = parse_rulestring(rulestring)
+    return _compile(birth, survival, barriers)
+
+
+def is_rulestring(name: str) -> bool:
+    """Return whether a string is a valid B/S rulestring."""
+    return _RULESTRING.match(name.strip()) is not None
+
+
+def _match_runs(
+    counts: np.ndarray,
+    runs: List[Tuple[int, int]],
+    out: np.ndarray,
+    tmp: np.ndarray,
+    hit: np.ndarray,
+) -> None:
+    """Set ``out`` where ``counts`` falls into one of the runs."""
+    out.fill(False)
+    for low, high in runs:
+        if low == high:
+            np.equal(counts, low, out=hit)
+        else:
+            # low <= counts <= high as one unsigned comparison
+            np.subtract(counts, low, out=tmp)
+            np.less_equal(tmp, high - low, out=hit)
+        np.logical_or(out, hit, out=out)
+
+
+class RuleEngine(Engine):
+    """Vectorized engine running a compiled B/S rule.
+
+    Neighbor counts are computed with shifted sums and matched against the
+    rule's count runs, all in preallocated scratch arrays.
+    """
+
+    def __init__(self, rule: Union[str, Rule] = CONWAY_RULE, barriers: str = "static") -> None:
+        """Initialize the engine.
+
+        Args:
+            rule: Rulestring or compiled Rule
+            barriers: Barrier semantics when ``rule`` is a rulestring
+
+        Raises:
+            ValueError: If the rulestring or barrier mode is invalid
+        """
+        self.rule = compile_rule(rule, barriers) if isinstance(rule, str) else rule
+        self.name = self.rule.rulestring
+        if self.rule.barriers != "static":
+            self.name += f":{self.rule.barriers}"
+        self._scratch: Dict[str, np.ndarray] = {}
+        self._shape: Optional[Tuple[int, int]] = None
+        self._barriers: Optional["BarrierLayer"] = None
+
+    def reset(self) -> None:
+        """Drop the barrier layer; the grid hands it over again before stepping."""
+        self._barriers = None
+
+    def set_barrier_layer(self, layer: "BarrierLayer") -> None:
+        """Use a precomputed barrier layer for the following steps.
+
+        Args:
+            layer: Barrier layer with the same shape as the states
+        """
+        self._barriers = layer
+
+    def _ensure_scratch(self, shape: Tuple[int, int]) -> Dict[str, np.ndarray]:
+        """Allocate the scratch arrays for a grid shape on first use."""
+        if self._shape != shape:
+            height, width = shape
+            self._scratch = {
+                "traffic": np.zeros((height + 2, width + 2), dtype=np.uint8),
+                "counts": np.empty(shape, dtype=np.uint8),
+                "tmp": np.empty(shape, dtype=np.uint8),
+                "center": np.empty(shape, dtype=bool),
+                "born": np.empty(shape, dtype=bool),
+                "survives": np.empty(shape, dtype=bool),
+                "hit": np.empty(shape, dtype=bool),
+            }
+            self._shape = shape
+        return self._scratch
+
+    def step(self, states: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Advance an array of color states by one generation.
+
+        Args:
+            states: Current color states with shape (height, width)
+            out: Optional array to write the next generation into
+
+        Returns:
+            Array holding the next generation (``out`` if it was given)
+        """
+        scratch = self._ensure_scratch(states.shape)
+        traffic, counts, tmp = scratch["traffic"], scratch["counts"], scratch["tmp"]
+        center, born, survives = scratch["center"], scratch["born"], scratch["survives"]
+        hit = scratch["hit"]
+        if out is None:
+            out = np.empty(states.shape, dtype=np.uint8)
+
+        if self.rule.barriers == "neighbor":
+            np.not_equal(states, 0, out=traffic[1:-1, 1:-1], casting="unsafe")
+        else:
+            np.equal(states, 2, out=traffic[1:-1, 1:-1], casting="unsafe")
+        np.add(traffic[:-2, :-2], traffic[:-2, 1:-1], out=counts)
+        counts += traffic[:-2, 2:]
+        counts += traffic[1:-1, :-2]
+        counts += traffic[1:-1, 2:]
+        counts += traffic[2:, :-2]
+        counts += traffic[2:, 1:-1]
+        counts += traffic[2:, 2:]
+
+        # Traffic survives on survival counts, empty cells are born on birth
+        # counts and barriers (neither) keep their state.
+        _match_runs(counts, self.rule.birth_runs, born, tmp, hit)
+        _match_runs(counts, self.rule.survival_runs, survives, tmp, hit)
+        np.equal(states, 2, out=center)
+        np.logical_and(survives, center, out=survives)
+        np.equal(states, 0, out=center)
+        np.logical_and(born, center, out=born)
+        np.logical_or(born, survives, out=born)
+
+        # out = 2 for traffic, 1 for barriers, 0 otherwise
+        np.left_shift(born.view(np.uint8), 1, out=out)
+        layer = self._barriers
+        if layer is not None and layer.shape == states.shape:
+            np.bitwise_or(out, layer.states, out=out)
+        else:
+            np.equal(states, 1, out=center)
+            np.bitwise_or(out, center.view(np.uint8), out=out)
+        return out
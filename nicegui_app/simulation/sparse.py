@@ -0,0 +1,157 @@
+"""Sparse coordinate-set engine for low-density traffic.
+
+Live traffic is kept as a set of ``(x, y)`` coordinates next to a separate
+set of barrier coordinates, and each generation only visits the neighborhoods
+of live cells. With a few hundred vehicles on a large board this does a tiny
+fraction of the work of a dense scan.
+"""
+
+from collections import Counter
+from typing import Optional, Set, Tuple
+
+import numpy as np
+
+from .base import Engine
+from .vectorized import VectorizedEngine
+
+Coordinate = Tuple[int, int]
+
+_OFFSETS = [(dx, dy) for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dx or dy]
+
+_NO_CELLS = np.empty(0, dtype=np.intp)
+
+# Below this fraction of traffic cells the sparse engine beats a dense step.
+# A sparse step costs a few microseconds per live cell and a dense step a few
+# nanoseconds per board cell; on a 1000x1000 board the two break even at
+# about 0.07% traffic, so the switch happens a little below that.
+DEFAULT_DENSITY_THRESHOLD = 0.0005
+
+
+class SparseEngine(Engine):
+    """Engine that tracks live traffic as a set of coordinates."""
+
+    name = "sparse"
+
+    def __init__(self) -> None:
+        """Initialize the engine with no loaded board."""
+        self.traffic: Set[Coordinate] = set()
+        self.barriers: Set[Coordinate] = set()
+        self._shape: Optional[Tuple[int, int]] = None
+
+    def reset(self) -> None:
+        """Drop the coordinate sets so they are reloaded on the next step."""
+        self._shape = None
+
+    def load(self, states: np.ndarray) -> None:
+        """Load the traffic and barrier sets from an array of color states.
+
+        Args:
+            states: Color states with shape (height, width)
+        """
+        ys, xs = np.nonzero(states == 2)
+        self.traffic = set(zip(xs.tolist(), ys.tolist()))
+        ys, xs = np.nonzero(states == 1)
+        self.barriers = set(zip(xs.tolist(), ys.tolist()))
+        self._shape = states.shape
+
+    def next_traffic(self, width: int, height: int) -> Set[Coordinate]:
+        """Compute the next generation's traffic set.
+
+        Args:
+            width: Number of columns
+            height: Number of rows
+
+        Returns:
+            Set of traffic coordinates one generation later
+        """
+        traffic = self.traffic
+        counts = Counter(
+            (x + dx, y + dy) for x, y in traffic for dx, dy in _OFFSETS
+        )
+        barriers = self.barriers
+        return {
+            cell
+            for cell, count in counts.items()
+            if (count == 3 or (count == 2 and cell in traffic))
+            and 0 <= cell[0] < width
+            and 0 <= cell[1] < height
+            and cell not in barriers
+        }
+
+    def step(self, states: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Advance by one generation, writing births and deaths into ``states``.
+
+        Args:
+            states: Current color states with shape (height, width)
+            out: Ignored; only changed cells are written, in place
+
+        Returns:
+            The ``states`` array holding the next generation
+        """
+        if self._shape != states.shape:
+            self.load(states)
+
+        height, width = states.shape
+        new_traffic = self.next_traffic(width, height)
+        changes = []
+        for cells, state in ((new_traffic - self.traffic, 2), (self.traffic - new_traffic, 0)):
+            if cells:
+                xs, ys = zip(*cells)
+                xs, ys = np.array(xs, dtype=np.intp), np.array(ys, dtype=np.intp)
+                states[ys, xs] = state
+                changes.append(ys * width + xs)
+            else:
+                changes.append(_NO_CELLS)
+        self.traffic = new_traffic
+        self.last_changes = (changes[0], changes[1])
+        return states
+
+
+class AutoEngine(Engine):
+    """Engine that switches between sparse and dense stepping by density."""
+
+    name = "auto"
+
+    def __init__(self, density_threshold: float = DEFAULT_DENSITY_THRESHOLD) -> None:
+        """Initialize the engine.
+
+        Args:
+            density_threshold: Traffic density (blue cells / all cells) below
+                which the sparse engine is used
+        """
+        self.density_threshold = density_threshold
+        self.sparse = SparseEngine()
+        self.dense = VectorizedEngine()
+        self.current: Optional[str] = None
+
+    def reset(self) -> None:
+        """Forget the sparse engine's coordinate sets."""
+        self.sparse.reset()
+        self.current = None
+
+    def step(self, states: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Advance by one generation with whichever engine suits the density.
+
+        Args:
+            states: Current color states with shape (height, width)
+            out: Optional array for the dense engine to write into
+
+        Returns:
+            Array holding the next generation
+        """
+        if self.current == "sparse" and self.sparse._shape == states.shape:
+            population = len(self.sparse.traffic)
+        else:
+            population = int(np.count_nonzero(states == 2))
+
+        if population < self.density_threshold * states.size:
+            if self.current != "sparse":
+                self.sparse.reset()
+            self.current = "sparse"
+            result = self.sparse.step(states)
+            self.last_changes = self.sparse.last_changes
+            return result
+
+        self.current = "numpy"
+        self.last_changes = None
+        return self.dense.step(states, out)
@@ -0,0 +1,154 @@
+"""Vectorized board statistics for dashboards.
+
+:func:`compute_stats` summarizes a board in a handful of whole-array
+operations: the population of each color state, the bounding box of the
+traffic, the traffic density on open road and, given the previous
+generation, the number of traffic births and deaths.
+"""
+
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+
+class StepStats:
+    """Summary of one generation of a board."""
+
+    __slots__ = ("generation", "black", "orange", "blue", "births", "deaths", "bbox")
+
+    def __init__(
+        self,
+        generation: int,
+        black: int,
+        orange: int,
+        blue: int,
+        births: Optional[int] = None,
+        deaths: Optional[int] = None,
+        bbox: Optional[Tuple[int, int, int, int]] = None,
+    ) -> None:
+        """Initialize the stats record.
+
+        Args:
+            generation: Generation the stats describe
+            black: Number of empty road cells
+            orange: Number of barrier cells
+            blue: Number of traffic cells
+            births: Cells that became traffic since the previous generation,
+                or None if it is unknown
+            deaths: Traffic cells that disappeared since the previous
+                generation, or None if it is unknown
+            bbox: Bounding box of the traffic as (min_x, min_y, max_x, max_y),
+                inclusive, or None if there is no traffic
+        """
+        self.generation = generation
+        self.black = black
+        self.orange = orange
+        self.blue = blue
+        self.births = births
+        self.deaths = deaths
+        self.bbox = bbox
+
+    @property
+    def population(self) -> int:
+        """Return the number of active (orange and blue) cells."""
+        return self.orange + self.blue
+
+    @property
+    def density(self) -> float:
+        """Return the fraction of open road (non-barrier) cells holding traffic."""
+        open_cells = self.black + self.blue
+        return self.blue / open_cells if open_cells else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the stats to a dictionary for serialization.
+
+        Returns:
+            Dictionary representation of the stats
+        """
+        return {
+            "generation": self.generation,
+            "black": self.black,
+            "orange": self.orange,
+            "blue": self.blue,
+            "births": self.births,
+            "deaths": self.deaths,
+            "bbox": list(self.bbox) if self.bbox is not None else None,
+            "density": self.density,
+        }
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, StepStats):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        return (
+            f"StepStats(generation={self.generation}, black={self.black}, "
+            f"orange={self.orange}, blue={self.blue}, births={self.births}, "
+            f"deaths={self.deaths}, bbox={self.bbox})"
+        )
+
+
+def traffic_bbox(traffic: np.ndarray) -> Optional[Tuple[int, int, int, int]]:
+    """Return the inclusive bounding box of a boolean traffic mask.
+
+    Args:
+        traffic: Boolean array with shape (height, width)
+
+    Returns:
+        (min_x, min_y, max_x, max_y), or None if the mask is empty
+    """
+    rows = np.flatnonzero(traffic.any(axis=1))
+    if not len(rows):
+        return None
+    cols = np.flatnonzero(traffic[rows[0] : rows[-1] + 1].any(axis=0))
+    return int(cols[0]), int(rows[0]), int(cols[-1]), int(rows[-1])
+
+
+def traffic_changes(previous: np.ndarray, states: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the cells that became traffic and stopped being traffic.
+
+    Args:
+        previous: Color states of the previous generation
+        states: Color states of the new generation, with the same shape
+
+    Returns:
+        (births, deaths) as flat cell indices
+    """
+    toggled = np.flatnonzero((previous.ravel() == 2) != (states.ravel() == 2))
+    born = states.ravel()[toggled] == 2
+    return toggled[born], toggled[~born]
+
+
+def compute_stats(
+    states: np.ndarray,
+    previous: Optional[np.ndarray] = None,
+    generation: int = 0,
+    populations: Optional[Tuple[int, int, int]] = None,
+) -> StepStats:
+    """Summarize a board.
+
+    Args:
+        states: Color states with shape (height, width)
+        previous: Color states of the previous generation; births and deaths
+            are None without it
+        generation: Generation number to record
+        populations: Already known (black, orange, blue) counts, to skip
+            counting them again
+
+    Returns:
+        StepStats for the board
+    """
+    traffic = states == 2
+    if populations is None:
+        counts = np.bincount(states.ravel(), minlength=3)
+        populations = (int(counts[0]), int(counts[1]), int(counts[2]))
+
+    births = deaths = None
+    if previous is not None:
+        changed = np.not_equal(traffic, previous == 2)
+        toggled = int(np.count_nonzero(changed))
+        births = int(np.count_nonzero(np.logical_and(changed, traffic, out=changed)))
+        deaths = toggled - births
+
+    return StepStats(generation, *populations, births, deaths, traffic_bbox(traffic))
@@ -0,0 +1,274 @@
+"""Vectorized NumPy engine for the Conway traffic simulation.
+
+The functions in this module operate on 2D ``uint8`` arrays of color states
+(0=black, 1=orange, 2=blue) with shape ``(height, width)`` and produce the
+same results as :func:`simulation.conway.run_conway_step`.
+"""
+
+from typing import Dict, Optional, Tuple, TYPE_CHECKING
+
+import numpy as np
+
+from .base import Engine
+
+if TYPE_CHECKING:
+    from models.grid import Grid
+    from .barriers import BarrierLayer
+
+
+def grid_to_states(grid: "Grid") -> np.ndarray:
+    """Copy the color states of a grid into a 2D array.
+
+    Args:
+        grid: Grid to read
+
+    Returns:
+        Array of shape (height, width) with dtype uint8
+    """
+    return grid._states.copy()
+
+
+def states_to_grid(states: np.ndarray) -> "Grid":
+    """Build a new grid from a 2D array of color states.
+
+    Args:
+        states: Array of shape (height, width)
+
+    Returns:
+        New Grid instance with the given states
+    """
+    from models.grid import Grid
+
+    height, width = states.shape
+    grid = Grid(width, height)
+    grid._load_states(states)
+    return grid
+
+
+def count_traffic_neighbors(states: np.ndarray) -> np.ndarray:
+    """Count the traffic (blue) neighbors of every cell at once.
+
+    Cells outside the grid count as empty, matching the bounded edges of
+    :func:`simulation.conway._count_traffic_neighbors`.
+
+    Args:
+        states: Array of color states with shape (height, width)
+
+    Returns:
+        Array of the same shape holding neighbor counts (0-8)
+    """
+    height, width = states.shape
+    traffic = np.zeros((height + 2, width + 2), dtype=np.uint8)
+    traffic[1:-1, 1:-1] = states == 2
+
+    counts = traffic[:-2, :-2].copy()
+    counts += traffic[:-2, 1:-1]
+    counts += traffic[:-2, 2:]
+    counts += traffic[1:-1, :-2]
+    counts += traffic[1:-1, 2:]
+    counts += traffic[2:, :-2]
+    counts += traffic[2:, 1:-1]
+    counts += traffic[2:, 2:]
+    return counts
+
+
+class BandScratch:
+    """Preallocated scratch arrays for stepping one band of rows.
+
+    Reusing one instance per band makes :func:`step_rows` allocate nothing.
+    """
+
+    __slots__ = ("shape", "traffic", "counts", "alive", "mask")
+
+    def __init__(self, rows: int, width: int) -> None:
+        """Allocate the scratch arrays.
+
+        Args:
+            rows: Number of rows in the band
+            width: Number of columns
+        """
+        self.shape = (rows, width)
+        # Traffic of the band plus its halo rows, with zero side columns.
+        self.traffic = np.zeros((rows + 2, width + 2), dtype=np.uint8)
+        self.counts = np.empty(self.shape, dtype=np.uint8)
+        self.alive = np.empty(self.shape, dtype=bool)
+        self.mask = np.empty(self.shape, dtype=bool)
+
+
+def step_rows(
+    states: np.ndarray,
+    out: np.ndarray,
+    start: int,
+    stop: int,
+    scratch: Optional[BandScratch] = None,
+) -> None:
+    """Write rows ``start`` to ``stop`` of the next generation into ``out``.
+
+    Only the band itself and the one-row halo above and below it are read,
+    so disjoint bands can be computed independently and in parallel.
+
+    Args:
+        states: Current color states with shape (height, width)
+        out: Array of the same shape to write the band into
+        start: First row of the band
+        stop: Row after the last row of the band
+        scratch: Scratch arrays for this band size, reused across calls;
+            allocated for this call if missing or of the wrong shape
+    """
+    height, width = states.shape
+    if scratch is None or scratch.shape != (stop - start, width):
+        scratch = BandScratch(stop - start, width)
+    traffic, counts = scratch.traffic, scratch.counts
+    alive, mask = scratch.alive, scratch.mask
+
+    center = traffic[1:-1, 1:-1]
+    np.equal(states[start:stop], 2, out=center, casting="unsafe")
+    for row, source in ((0, start - 1), (-1, stop)):
+        if 0 <= source < height:
+            np.equal(states[source], 2, out=traffic[row, 1:-1], casting="unsafe")
+        else:
+            traffic[row].fill(0)
+
+    np.add(traffic[:-2, :-2], traffic[:-2, 1:-1], out=counts)
+    counts += traffic[:-2, 2:]
+    counts += traffic[1:-1, :-2]
+    counts += traffic[1:-1, 2:]
+    counts += traffic[2:, :-2]
+    counts += traffic[2:, 1:-1]
+    counts += traffic[2:, 2:]
+
+    # alive = (counts == 3) | (traffic & counts == 2), never on barriers
+    np.equal(counts, 3, out=alive)
+    np.equal(counts, 2, out=mask)
+    np.logical_and(mask, center, out=mask)
+    np.logical_or(alive, mask, out=alive)
+    np.not_equal(states[start:stop], 1, out=mask)
+    np.logical_and(alive, mask, out=alive)
+
+    # out = 2 for traffic, 1 for barriers, 0 otherwise
+    band = out[start:stop]
+    np.left_shift(alive.view(np.uint8), 1, out=band)
+    np.logical_not(mask, out=mask)
+    np.bitwise_or(band, mask.view(np.uint8), out=band)
+
+
+def step_states(states: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Advance an array of color states by one generation.
+
+    Rules match :func:`simulation.conway.run_conway_step`: orange barriers
+    stay in place, blue traffic survives with 2-3 traffic neighbors and
+    empty cells become traffic with exactly 3 traffic neighbors.
+
+    Args:
+        states: Current color states with shape (height, width)
+        out: Optional array to write the next generation into
+
+    Returns:
+        Array holding the next generation (``out`` if it was given)
+    """
+    if out is None:
+        out = np.empty(states.shape, dtype=np.uint8)
+    step_rows(states, out, 0, states.shape[0])
+    return out
+
+
+class VectorizedEngine(Engine):
+    """Vectorized engine that reuses scratch arrays between generations.
+
+    All intermediate arrays are allocated once per grid shape and every
+    operation writes into them with ``out=``, so a step allocates nothing
+    board-sized when the caller provides the output buffer. When the grid
+    supplies its barrier layer, the barrier masks are not recomputed.
+    """
+
+    name = "numpy"
+
+    def __init__(self) -> None:
+        """Initialize the engine with no scratch arrays."""
+        self._scratch: Dict[str, np.ndarray] = {}
+        self._shape: Optional[Tuple[int, int]] = None
+        self._barriers: Optional["BarrierLayer"] = None
+
+    def reset(self) -> None:
+        """Drop the barrier layer; the grid hands it over again before stepping."""
+        self._barriers = None
+
+    def set_barrier_layer(self, layer: "BarrierLayer") -> None:
+        """Use a precomputed barrier layer for the following steps.
+
+        Args:
+            layer: Barrier layer with the same shape as the states
+        """
+        self._barriers = layer
+
+    def _ensure_scratch(self, shape: Tuple[int, int]) -> Dict[str, np.ndarray]:
+        """Allocate the scratch arrays for a grid shape on first use."""
+        if self._shape != shape:
+            height, width = shape
+            self._scratch = {
+                "traffic": np.zeros((height + 2, width + 2), dtype=np.uint8),
+                "counts": np.empty(shape, dtype=np.uint8),
+                "alive": np.empty(shape, dtype=bool),
+                "mask": np.empty(shape, dtype=bool),
+            }
+            self._shape = shape
+        return self._scratch
+
+    def step(self, states: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Advance an array of color states by one generation.
+
+        Args:
+            states: Current color states with shape (height, width)
+            out: Optional array to write the next generation into
+
+        Returns:
+            Array holding the next generation (``out`` if it was given)
+        """
+        scratch = self._ensure_scratch(states.shape)
+        traffic, counts = scratch["traffic"], scratch["counts"]
+        alive, mask = scratch["alive"], scratch["mask"]
+        if out is None:
+            out = np.empty(states.shape, dtype=np.uint8)
+
+        center = traffic[1:-1, 1:-1]
+        np.equal(states, 2, out=center, casting="unsafe")
+        np.add(traffic[:-2, :-2], traffic[:-2, 1:-1], out=counts)
+        counts += traffic[:-2, 2:]
+        counts += traffic[1:-1, :-2]
+        counts += traffic[1:-1, 2:]
+        counts += traffic[2:, :-2]
+        counts += traffic[2:, 1:-1]
+        counts += traffic[2:, 2:]
+
+        # alive = (counts == 3) | (traffic & counts == 2), never on barriers
+        np.equal(counts, 3, out=alive)
+        np.equal(counts, 2, out=mask)
+        np.logical_and(mask, center, out=mask)
+        np.logical_or(alive, mask, out=alive)
+
+        # out = 2 for traffic, 1 for barriers, 0 otherwise
+        layer = self._barriers
+        if layer is not None and layer.shape == states.shape:
+            np.logical_and(alive, layer.open, out=alive)
+            np.left_shift(alive.view(np.uint8), 1, out=out)
+            np.bitwise_or(out, layer.states, out=out)
+            return out
+
+        np.not_equal(states, 1, out=mask)
+        np.logical_and(alive, mask, out=alive)
+        np.left_shift(alive.view(np.uint8), 1, out=out)
+        np.logical_not(mask, out=mask)
+        np.bitwise_or(out, mask.view(np.uint8), out=out)
+        return out
+
+
+def run_conway_step_vectorized(grid: "Grid") -> "Grid":
+    """Run one simulation step using the vectorized NumPy engine.
+
+    Args:
+        grid: Current grid state
+
+    Returns:
+        New grid with one simulation step applied
+    """
+    return states_to_grid(step_states(grid_to_states(grid)))
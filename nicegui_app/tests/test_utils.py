@@ -67,6 +67,24 @@ def create_barrier_pattern(grid: Grid) -> None:
         grid.cells[1][0].set_color_state(2)  # blue
 
 
+def create_random_pattern(
+    grid: Grid, seed: int, traffic_density: float = 0.35, barrier_density: float = 0.1
+) -> None:
+    """Fill the grid with random barriers and traffic from a fixed seed."""
+    import random
+
+    rng = random.Random(seed)
+    for row in grid.cells:
+        for cell in row:
+            roll = rng.random()
+            if roll < barrier_density:
+                cell.set_color_state(1)  # orange
+            elif roll < barrier_density + traffic_density:
+                cell.set_color_state(2)  # blue
+            else:
+                cell.set_color_state(0)  # black
+
+
 def assert_grid_states_equal(grid1: Grid, grid2: Grid) -> None:
     """Assert that two grids have the same state."""
     assert grid1.width == grid2.width
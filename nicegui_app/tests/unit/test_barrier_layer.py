@@ -0,0 +1,90 @@
+"""Unit tests for the static barrier layer."""
+
+import numpy as np
+import pytest
+from models import Grid
+from simulation.barriers import BarrierLayer
+from ..test_utils import create_random_pattern, assert_grid_states_equal
+
+
+class TestBarrierLayer:
+    """Test the masks derived from a barrier layout."""
+
+    def test_masks(self):
+        """Test that the layer holds matching barrier and open masks."""
+        states = np.array([[0, 1, 2], [1, 0, 0]], dtype=np.uint8)
+
+        layer = BarrierLayer.from_states(states)
+
+        assert layer.shape == (2, 3)
+        assert layer.count == 2
+        np.testing.assert_array_equal(layer.mask, states == 1)
+        np.testing.assert_array_equal(layer.open, states != 1)
+        np.testing.assert_array_equal(layer.states, (states == 1).astype(np.uint8))
+        for array in (layer.mask, layer.open, layer.states):
+            with pytest.raises(ValueError):
+                array[0, 0] = 1
+
+
+class TestGridBarrierLayer:
+    """Test when the grid reuses and rebuilds its barrier layer."""
+
+    def test_layer_is_reused_across_generations(self):
+        """Test that stepping never rebuilds the layer."""
+        grid = Grid(20, 20)
+        create_random_pattern(grid, seed=1)
+        layer = grid.barrier_layer
+
+        grid.step(5)
+        grid.apply_conway_step(engine="tiled")
+
+        assert grid.barrier_layer is layer
+
+    def test_traffic_edits_keep_the_layer(self):
+        """Test that edits not touching barriers keep the layer."""
+        grid = Grid(6, 6)
+        layer = grid.barrier_layer
+
+        grid.get_cell(2, 2).set_color_state(2)
+        grid.get_cell(2, 2).set_color_state(0)
+
+        assert grid.barrier_layer is layer
+
+    @pytest.mark.parametrize("edit", ["add", "remove", "resize", "clear", "load"])
+    def test_barrier_edits_rebuild_the_layer(self, edit):
+        """Test that every change to the layout rebuilds the layer."""
+        grid = Grid(6, 6)
+        grid.get_cell(1, 1).set_color_state(1)
+        layer = grid.barrier_layer
+
+        if edit == "add":
+            grid.cycle_cell_color(3, 3)
+        elif edit == "remove":
+            grid.cycle_cell_color(1, 1)
+        elif edit == "resize":
+            grid.resize(7, 6)
+        elif edit == "clear":
+            grid.clear_all()
+        else:
+            grid._load_states(np.ones((6, 6), dtype=np.uint8))
+
+        assert grid.barrier_layer is not layer
+        np.testing.assert_array_equal(grid.barrier_layer.mask, grid._states == 1)
+        assert grid.count_orange_cells() == np.count_nonzero(grid._states == 1)
+
+    @pytest.mark.parametrize("engine", ["numpy", "B3/S23"])
+    def test_engines_receive_the_layer(self, engine):
+        """Test that engines step with the grid's layer and stay correct."""
+        reference = Grid(16, 12)
+        create_random_pattern(reference, seed=5)
+        grid = Grid.from_dict(reference.to_dict())
+
+        for generation in range(6):
+            if generation == 3:
+                for g in (grid, reference):
+                    g.cycle_cell_color(4, 4)
+                    g.cycle_cell_color(5, 4)
+            grid.apply_conway_step(engine=engine)
+            reference.apply_conway_step(engine="python")
+            assert grid._engines[engine]._barriers is grid.barrier_layer
+            assert_grid_states_equal(reference, grid)
@@ -0,0 +1,80 @@
+"""Unit tests for the bit-packed SWAR simulation engine."""
+
+import numpy as np
+import pytest
+from models import Grid
+from simulation import run_conway_step
+from simulation.bitpacked import BitBoard
+from ..test_utils import (
+    create_blinker_pattern,
+    create_random_pattern,
+    assert_grid_states_equal,
+)
+
+
+class TestBitBoardConversion:
+    """Test packing grids into 64-bit words and back."""
+
+    @pytest.mark.parametrize("width,height", [(1, 1), (63, 2), (64, 3), (65, 4), (130, 5)])
+    def test_round_trip(self, width, height):
+        """Test that packing and unpacking preserves every cell state."""
+        grid = Grid(width, height)
+        create_random_pattern(grid, seed=width)
+
+        board = BitBoard.from_grid(grid)
+
+        assert board.traffic.dtype == np.uint64
+        assert board.words_per_row == -(-width // 64)
+        assert_grid_states_equal(grid, board.to_grid())
+
+    def test_population(self):
+        """Test counting traffic cells in the packed layer."""
+        grid = Grid(70, 3)
+        create_blinker_pattern(grid)
+        grid.cells[2][69].set_color_state(2)  # blue, in the second word
+        grid.cells[0][5].set_color_state(1)  # orange, not traffic
+
+        assert BitBoard.from_grid(grid).population() == 4
+
+
+class TestBitBoardStep:
+    """Test that bitwise stepping matches the reference implementation."""
+
+    @pytest.mark.parametrize(
+        "width,height", [(1, 1), (5, 1), (1, 5), (17, 9), (64, 8), (65, 7), (150, 12)]
+    )
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_matches_run_conway_step(self, width, height, seed):
+        """Test random boards with barriers and edges against run_conway_step."""
+        grid = Grid(width, height)
+        create_random_pattern(grid, seed=seed)
+        board = BitBoard.from_grid(grid)
+
+        for _ in range(5):
+            grid = run_conway_step(grid)
+            board.step()
+            assert_grid_states_equal(grid, board.to_grid())
+
+    def test_traffic_does_not_spill_into_padding(self):
+        """Test that births never appear past the right edge of the grid."""
+        grid = Grid(66, 3)
+        for y in range(3):
+            grid.cells[y][65].set_color_state(2)  # vertical blinker on the edge
+
+        board = BitBoard.from_grid(grid).step()
+        grid = run_conway_step(grid)
+
+        assert not (board.traffic & board._padding_mask()).any()
+        assert board.population() == grid.count_blue_cells() == 2
+        assert_grid_states_equal(grid, board.to_grid())
+
+    def test_grid_engine_selection(self):
+        """Test selecting the bit-packed engine through Grid.apply_conway_step."""
+        reference = Grid(80, 6)
+        create_random_pattern(reference, seed=11)
+        packed = Grid.from_dict(reference.to_dict(), storage="array")
+
+        for _ in range(3):
+            reference.apply_conway_step(engine="python")
+            packed.apply_conway_step(engine="bitpacked")
+            assert_grid_states_equal(reference, packed)
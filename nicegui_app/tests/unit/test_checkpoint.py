@@ -0,0 +1,266 @@
+"""Unit tests for simulation checkpoints."""
+
+import os
+import stat
+import threading
+import time
+
+import numpy as np
+import pytest
+from models import Grid
+from simulation.checkpoint import (
+    Checkpoint,
+    Checkpointer,
+    latest_checkpoint,
+    list_checkpoints,
+    read_checkpoint,
+    write_checkpoint,
+)
+from ..test_utils import create_blinker_pattern, create_random_pattern
+
+
+def random_states(seed, shape=(7, 9)):
+    """Return a random board of color states."""
+    return np.random.default_rng(seed).integers(0, 3, shape, dtype=np.uint8)
+
+
+class TestCheckpointFiles:
+    """Test writing and reading checkpoint files."""
+
+    def test_round_trip(self, tmp_path):
+        """Test that every field survives a write and read."""
+        rng = np.random.default_rng(1)
+        rng.random(5)
+        states = random_states(0)
+        path = write_checkpoint(
+            str(tmp_path), Checkpoint(42, states, 7, "incremental", rng.bit_generator.state)
+        )
+
+        checkpoint = read_checkpoint(path)
+
+        np.testing.assert_array_equal(checkpoint.states, states)
+        assert checkpoint.generation == 42
+        assert checkpoint.step_count == 7
+        assert checkpoint.engine == "incremental"
+        restored = np.random.default_rng()
+        checkpoint.restore_rng(restored)
+        assert restored.random() == rng.random()
+
+    def test_to_grid(self, tmp_path):
+        """Test that a checkpoint rebuilds the grid with its generation and engine."""
+        grid = Grid(8, 6)
+        create_random_pattern(grid, seed=2)
+        checkpoint = Checkpoint(11, grid._states.copy(), engine="lookup")
+
+        restored = checkpoint.to_grid()
+
+        np.testing.assert_array_equal(restored._states, grid._states)
+        assert restored.generation == 11
+        assert restored.engine == "lookup"
+
+    def test_no_temporary_files_left(self, tmp_path):
+        """Test that only the final checkpoint file remains after writing."""
+        write_checkpoint(str(tmp_path), Checkpoint(3, random_states(0)))
+
+        assert os.listdir(tmp_path) == ["checkpoint-000000000001.npz"]
+
+    def test_files_are_ordered_by_write_not_generation(self, tmp_path):
+        """Test that a checkpoint written after rewinding is the newest one."""
+        write_checkpoint(str(tmp_path), Checkpoint(50, random_states(0)))
+        path = write_checkpoint(str(tmp_path), Checkpoint(20, random_states(1)))
+
+        checkpoint = latest_checkpoint(str(tmp_path))
+
+        assert list_checkpoints(str(tmp_path))[0] == path
+        assert checkpoint.generation == 20
+        assert checkpoint.sequence == 2
+
+    def test_directory_is_synced_after_rename(self, tmp_path, monkeypatch):
+        """Test that the rename is made durable by syncing the directory."""
+        synced = []
+        fsync = os.fsync
+
+        def record_fsync(fd):
+            synced.append(stat.S_ISDIR(os.fstat(fd).st_mode))
+            fsync(fd)
+
+        monkeypatch.setattr(os, "fsync", record_fsync)
+        write_checkpoint(str(tmp_path), Checkpoint(0, random_states(0)))
+
+        assert synced == [False, True]
+
+    def test_latest_skips_corrupt_checkpoints(self, tmp_path):
+        """Test that the newest valid checkpoint is chosen."""
+        write_checkpoint(str(tmp_path), Checkpoint(10, random_states(0)))
+        newest = write_checkpoint(str(tmp_path), Checkpoint(20, random_states(1)))
+        with open(newest, "r+b") as f:
+            f.truncate(os.path.getsize(newest) // 2)
+
+        checkpoint = latest_checkpoint(str(tmp_path))
+
+        assert checkpoint.generation == 10
+        with pytest.raises(ValueError):
+            read_checkpoint(newest)
+
+    def test_checksum_mismatch_is_detected(self, tmp_path):
+        """Test that a checkpoint whose states do not match the CRC is rejected."""
+        path = write_checkpoint(str(tmp_path), Checkpoint(1, random_states(0)))
+        with np.load(path) as data:
+            metadata = data["metadata"]
+        with open(path, "wb") as f:
+            np.savez(f, states=random_states(1), metadata=metadata)
+
+        with pytest.raises(ValueError, match="Checksum"):
+            read_checkpoint(path)
+
+    def test_missing_directory(self, tmp_path):
+        """Test that a missing directory has no checkpoints."""
+        assert latest_checkpoint(str(tmp_path / "missing")) is None
+
+
+class TestCheckpointer:
+    """Test the background checkpoint writer."""
+
+    def test_writes_every_interval(self, tmp_path):
+        """Test that maybe_checkpoint only writes every few generations."""
+        checkpointer = Checkpointer(str(tmp_path), every=10, keep=100)
+        grid = Grid(6, 6)
+        create_blinker_pattern(grid)
+
+        for _ in range(25):
+            grid.apply_conway_step()
+            checkpointer.maybe_checkpoint(grid.generation, grid._states)
+            checkpointer.flush()
+        checkpointer.close()
+
+        generations = [read_checkpoint(path).generation for path in list_checkpoints(str(tmp_path))]
+        assert generations == [21, 11, 1]
+
+    def test_snapshot_is_copied(self, tmp_path):
+        """Test that changing the board after queuing does not affect the checkpoint."""
+        checkpointer = Checkpointer(str(tmp_path))
+        states = random_states(0)
+        expected = states.copy()
+
+        checkpointer.checkpoint(5, states)
+        states[:] = 0
+        checkpointer.close()
+
+        np.testing.assert_array_equal(latest_checkpoint(str(tmp_path)).states, expected)
+
+    def test_keeps_newest_files(self, tmp_path):
+        """Test that old checkpoint files are pruned."""
+        checkpointer = Checkpointer(str(tmp_path), keep=2)
+        for generation in [7, 8, 9, 3, 4]:
+            checkpointer.checkpoint(generation, random_states(generation))
+            checkpointer.flush()
+        checkpointer.close()
+
+        paths = list_checkpoints(str(tmp_path))
+        assert [os.path.basename(path) for path in paths] == [
+            "checkpoint-000000000005.npz",
+            "checkpoint-000000000004.npz",
+        ]
+        assert [read_checkpoint(path).generation for path in paths] == [4, 3]
+
+    def test_sequence_continues_after_existing_files(self, tmp_path):
+        """Test that a new checkpointer writes after the files already there."""
+        for generation in range(3):
+            write_checkpoint(str(tmp_path), Checkpoint(generation, random_states(generation)))
+        checkpointer = Checkpointer(str(tmp_path))
+
+        checkpointer.checkpoint(0, random_states(5))
+        checkpointer.close()
+
+        assert latest_checkpoint(str(tmp_path)).sequence == 4
+
+    def test_closed_checkpointer_rejects_checkpoints(self, tmp_path):
+        """Test that queuing after close raises RuntimeError."""
+        checkpointer = Checkpointer(str(tmp_path))
+        checkpointer.close()
+
+        with pytest.raises(RuntimeError, match="closed"):
+            checkpointer.checkpoint(0, random_states(0))
+
+    @pytest.mark.parametrize("kwargs", [{"every": 0}, {"keep": 0}])
+    def test_invalid_settings_raise_error(self, tmp_path, kwargs):
+        """Test that non-positive settings raise ValueError."""
+        with pytest.raises(ValueError):
+            Checkpointer(str(tmp_path), **kwargs)
+
+
+class TestAppResume:
+    """Test resuming the app from checkpoints."""
+
+    def test_resume_from_newest_checkpoint(self, tmp_path):
+        """Test that enable_checkpoints restores the newest valid checkpoint."""
+        from app import InteractiveGridApp
+
+        grid = Grid(9, 4)
+        create_random_pattern(grid, seed=3)
+        write_checkpoint(str(tmp_path), Checkpoint(30, grid._states.copy(), 12, "numpy"))
+
+        app = InteractiveGridApp()
+        assert app.enable_checkpoints(str(tmp_path))
+
+        np.testing.assert_array_equal(app.grid._states, grid._states)
+        assert (app.width, app.height) == (9, 4)
+        assert app.grid.generation == 30
+        assert app.simulation_step_count == 12
+
+    def test_stop_writes_checkpoint(self, tmp_path):
+        """Test that stopping the simulation checkpoints the final board."""
+        from app import InteractiveGridApp
+
+        app = InteractiveGridApp(width=5, height=5)
+        assert not app.enable_checkpoints(str(tmp_path))
+        create_blinker_pattern(app.grid)
+        app.grid.step(3)
+
+        app.stop_simulation()
+        app.checkpointer.close()
+
+        checkpoint = latest_checkpoint(str(tmp_path))
+        assert checkpoint.generation == 3
+        np.testing.assert_array_equal(checkpoint.states, app.grid._states)
+
+    def test_stop_during_a_step_checkpoints_the_finished_step(self, tmp_path):
+        """Test that stopping mid-step checkpoints the board the run ended on."""
+        from app import InteractiveGridApp
+
+        app = InteractiveGridApp(width=6, height=6)
+        app.enable_checkpoints(str(tmp_path))
+        create_blinker_pattern(app.grid)
+        in_step = threading.Event()
+        apply_conway_step = app.grid.apply_conway_step
+
+        def slow_step(*args, **kwargs):
+            in_step.set()
+            time.sleep(0.1)
+            return apply_conway_step(*args, **kwargs)
+
+        app.grid.apply_conway_step = slow_step
+        app.run_simulation_continuous()
+        assert in_step.wait(5)
+        app.stop_simulation()
+        app.simulation_thread.join(5)
+        app.checkpointer.close()
+
+        checkpoint = latest_checkpoint(str(tmp_path))
+        assert checkpoint.generation == app.grid.generation >= 1
+        np.testing.assert_array_equal(checkpoint.states, app.grid._states)
+
+    def test_resumes_once_per_process(self, tmp_path):
+        """Test that later apps share the checkpointer without resuming again."""
+        from app import InteractiveGridApp
+
+        write_checkpoint(str(tmp_path), Checkpoint(30, random_states(0), 12))
+        first = InteractiveGridApp()
+        second = InteractiveGridApp()
+
+        assert first.enable_checkpoints(str(tmp_path))
+        assert not second.enable_checkpoints(str(tmp_path))
+
+        assert second.checkpointer is first.checkpointer
+        assert second.grid.generation == 0
+        first.checkpointer.close()
@@ -0,0 +1,184 @@
+"""Unit tests for Zobrist hashing and cycle detection."""
+
+import numpy as np
+import pytest
+from models import Grid
+from simulation.cycles import Cycle, CycleDetector, zobrist_hash, zobrist_update
+from simulation.sparse import AutoEngine
+from ..test_utils import (
+    create_blinker_pattern,
+    create_block_pattern,
+    create_random_pattern,
+)
+
+
+class TestZobristHash:
+    """Test hashing the traffic layer."""
+
+    def test_hash_ignores_barriers(self):
+        """Test that only traffic cells contribute to the hash."""
+        states = np.zeros((4, 5), dtype=np.uint8)
+        empty = zobrist_hash(states)
+        states[1, 1] = 1
+        assert zobrist_hash(states) == empty
+        states[2, 3] = 2
+        assert zobrist_hash(states) != empty
+
+    def test_update_matches_full_hash(self):
+        """Test that the incremental update equals rehashing."""
+        rng = np.random.default_rng(0)
+        before = rng.integers(0, 3, size=(9, 7)).astype(np.uint8)
+        after = rng.integers(0, 3, size=(9, 7)).astype(np.uint8)
+
+        assert zobrist_update(zobrist_hash(before), before, after) == zobrist_hash(after)
+
+    def test_grid_hash_follows_edits_and_steps(self):
+        """Test that the grid keeps its hash current without rehashing."""
+        grid = Grid(15, 12)
+        create_random_pattern(grid, seed=1)
+        grid.state_hash
+
+        for x, y in [(0, 0), (3, 4), (3, 4), (3, 4)]:
+            grid.cycle_cell_color(x, y)
+            assert grid._hash == zobrist_hash(grid._states)
+        for engine in ["numpy", "tiled", "numpy"]:
+            grid.apply_conway_step(engine=engine)
+            assert grid.state_hash == zobrist_hash(grid._states)
+        grid.step(3)
+        assert grid.state_hash == zobrist_hash(grid._states)
+        grid.clear_all()
+        assert grid.state_hash == zobrist_hash(grid._states)
+
+
+    @pytest.mark.parametrize(
+        "engine",
+        ["sparse", "tiled", "incremental", "auto", "numpy", "B36/S23", AutoEngine(1.0)],
+    )
+    def test_steps_never_rehash(self, engine, monkeypatch):
+        """Test that stepping patches the hash instead of dropping it."""
+        grid = Grid(40, 30)
+        create_random_pattern(grid, seed=6, traffic_density=0.2)
+        grid.state_hash
+        rehashes = []
+        monkeypatch.setattr(
+            "simulation.cycles.zobrist_hash", lambda states: rehashes.append(1)
+        )
+
+        for _ in range(10):
+            grid.apply_conway_step(engine=engine)
+            assert grid._hash == zobrist_hash(grid._states)
+
+        assert not rehashes
+
+class TestCycleDetector:
+    """Test detecting repeated hashes."""
+
+    def test_reports_period_and_start(self):
+        """Test that a repeat reports when the cycle started and its period."""
+        detector = CycleDetector()
+        for generation, state_hash in enumerate([10, 11, 12, 13, 12]):
+            cycle = detector.observe(generation, state_hash)
+
+        assert cycle == Cycle(start=2, period=2)
+        assert detector.cycle is cycle
+        assert not cycle.is_still
+
+    def test_history_is_bounded(self):
+        """Test that cycles longer than the history are forgotten."""
+        detector = CycleDetector(max_history=3)
+        for generation, state_hash in enumerate([1, 2, 3, 4]):
+            assert detector.observe(generation, state_hash) is None
+
+        assert detector.observe(4, 1) is None
+        assert len(detector._seen) == 3
+        assert detector.observe(5, 4) == Cycle(start=3, period=2)
+
+    def test_invalid_history_raises_error(self):
+        """Test that a non-positive history size raises ValueError."""
+        with pytest.raises(ValueError, match="History size must be positive"):
+            CycleDetector(max_history=0)
+
+
+class TestGridCycles:
+    """Test finding and skipping cycles on a grid."""
+
+    def test_still_life(self):
+        """Test that a block is still from the first generation."""
+        grid = Grid(8, 8)
+        create_block_pattern(grid)
+
+        assert grid.find_cycle(10) == Cycle(start=0, period=1)
+        assert grid.generation == 1
+
+    def test_blinker(self):
+        """Test that a blinker has period 2."""
+        grid = Grid(5, 5)
+        create_blinker_pattern(grid)
+
+        cycle = grid.find_cycle(10)
+
+        assert cycle == Cycle(start=0, period=2)
+
+    def test_stabilization_generation(self):
+        """Test a pattern that settles after some generations."""
+        grid = Grid(10, 10)
+        for x, y in [(4, 4), (5, 4), (6, 4), (4, 5)]:  # settles into a still life
+            grid.get_cell(x, y).set_color_state(2)
+        reference = Grid.from_dict(grid.to_dict())
+
+        cycle = grid.find_cycle(50)
+
+        assert cycle is not None and cycle.period == 1
+        reference.step(cycle.start)
+        before = reference.to_dict()
+        reference.apply_conway_step()
+        assert reference.to_dict() == before
+
+    def test_no_cycle_within_budget(self):
+        """Test that None is returned when the budget runs out."""
+        grid = Grid(30, 30)
+        for x, y in [(1, 0), (2, 1), (0, 2), (1, 2), (2, 2)]:  # glider
+            grid.get_cell(x, y).set_color_state(2)
+
+        assert grid.find_cycle(8) is None
+        assert grid.generation == 8
+
+    def test_skip_cycle_matches_stepping(self):
+        """Test that jumping through a cycle equals stepping through it."""
+        grid = Grid(5, 5)
+        create_blinker_pattern(grid)
+        reference = Grid.from_dict(grid.to_dict())
+        cycle = grid.find_cycle(10)
+
+        grid.skip_cycle(cycle, 1001)
+        reference.step(grid.generation)
+
+        assert grid.generation == 1003
+        assert grid.to_dict() == reference.to_dict()
+
+    def test_skip_cycle_before_start_raises_error(self):
+        """Test that skipping requires the grid to be inside the cycle."""
+        with pytest.raises(ValueError, match="not reached the cycle"):
+            Grid(3, 3).skip_cycle(Cycle(start=5, period=2), 10)
+
+
+class TestAppCycleDetection:
+    """Test the app's cycle check during continuous simulation."""
+
+    @pytest.mark.parametrize("stop_on_cycle", [True, False])
+    def test_check_for_cycle(self, stop_on_cycle):
+        """Test that the app records the cycle and stops only when asked to."""
+        from app import InteractiveGridApp
+
+        app = InteractiveGridApp(width=5, height=5)
+        create_blinker_pattern(app.grid)
+        app.stop_on_cycle = stop_on_cycle
+        app.cycle_detector.observe(app.grid.generation, app.grid.state_hash)
+
+        results = []
+        for _ in range(2):
+            app.grid.apply_conway_step()
+            results.append(app.check_for_cycle())
+
+        assert results == [False, stop_on_cycle]
+        assert app.cycle == Cycle(start=0, period=2)
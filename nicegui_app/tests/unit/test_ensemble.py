@@ -0,0 +1,112 @@
+"""Unit tests for the batched ensemble engine."""
+
+import numpy as np
+import pytest
+from models import Grid
+from simulation.ensemble import Ensemble
+from simulation.vectorized import step_states
+from ..test_utils import create_random_pattern
+
+
+def barrier_grid(seed=0, width=24, height=18):
+    """Create a grid with random barriers and no traffic."""
+    grid = Grid(width, height)
+    create_random_pattern(grid, seed=seed, traffic_density=0.0, barrier_density=0.15)
+    return grid
+
+
+class TestEnsemble:
+    """Test stepping many boards at once."""
+
+    def test_invalid_arguments_raise_error(self):
+        """Test that mismatched shapes and periods raise ValueError."""
+        barriers = np.zeros((4, 5), dtype=bool)
+        with pytest.raises(ValueError, match="matching barriers"):
+            Ensemble(barriers, np.zeros((2, 5, 4), dtype=bool))
+        with pytest.raises(ValueError, match="Maximum period must be positive"):
+            Ensemble(barriers, np.zeros((2, 4, 5), dtype=bool), max_period=0)
+
+    def test_boards_share_the_barrier_layout(self):
+        """Test that random traffic never lands on barriers."""
+        grid = barrier_grid()
+        ensemble = Ensemble.from_grid(grid, 20, traffic_density=0.5, seed=1)
+
+        assert ensemble.boards == 20
+        assert not (ensemble.traffic.astype(bool) & ensemble.barriers).any()
+        for index in range(3):
+            states = ensemble.board_states(index)
+            np.testing.assert_array_equal(states == 1, grid._states == 1)
+
+    def test_every_board_matches_single_board_stepping(self):
+        """Test each board against stepping it on its own."""
+        ensemble = Ensemble.from_grid(barrier_grid(seed=2), 12, seed=3)
+        expected = [ensemble.board_states(index) for index in range(12)]
+
+        populations = ensemble.run(15)
+
+        assert populations.shape == (15, 12)
+        for index, states in enumerate(expected):
+            for _ in range(15):
+                states = step_states(states)
+            np.testing.assert_array_equal(ensemble.board_states(index), states)
+            assert populations[-1, index] == np.count_nonzero(states == 2)
+        np.testing.assert_array_equal(populations[-1], ensemble.populations())
+
+    def test_to_grid(self):
+        """Test that a board can be turned back into a grid."""
+        ensemble = Ensemble.from_grid(barrier_grid(), 3, seed=4)
+        ensemble.step()
+
+        grid = ensemble.to_grid(1)
+
+        np.testing.assert_array_equal(grid._states, ensemble.board_states(1))
+
+    def test_stabilization_outputs(self):
+        """Test still lifes, blinkers and boards that keep moving."""
+        barriers = np.zeros((8, 8), dtype=bool)
+        traffic = np.zeros((4, 8, 8), dtype=bool)
+        traffic[0, 2:4, 2:4] = True  # block: still from generation 0
+        traffic[1, 4, 2:5] = True  # blinker: period 2 from generation 0
+        traffic[2, 3, 3] = True  # lone cell: dies, then empty forever
+        traffic[3, [0, 1, 2, 2, 2], [1, 2, 0, 1, 2]] = True  # glider
+        ensemble = Ensemble(barriers, traffic)
+
+        ensemble.run(6)
+
+        np.testing.assert_array_equal(ensemble.stabilized, [True, True, True, False])
+        np.testing.assert_array_equal(ensemble.stabilized_at, [0, 0, 1, -1])
+        np.testing.assert_array_equal(ensemble.period, [1, 2, 1, 0])
+
+    def test_longer_periods(self):
+        """Test that periods up to max_period are detected."""
+        barriers = np.zeros((17, 17), dtype=bool)
+        traffic = np.zeros((1, 17, 17), dtype=bool)
+        # Pulsar quarter mirrored into all four quadrants (period 3).
+        for y, x in [(2, 4), (2, 5), (2, 6), (4, 2), (5, 2), (6, 2),
+                     (4, 7), (5, 7), (6, 7), (7, 4), (7, 5), (7, 6)]:
+            for yy in (y, 16 - y):
+                for xx in (x, 16 - x):
+                    traffic[0, yy, xx] = True
+
+        short = Ensemble(barriers, traffic, max_period=2)
+        short.run(10)
+        long = Ensemble(barriers, traffic, max_period=3)
+        long.run(10)
+
+        assert not short.stabilized[0]
+        assert long.period[0] == 3 and long.stabilized_at[0] == 0
+
+    def test_run_until_stable_stops_early(self):
+        """Test that run stops once every board has entered a cycle."""
+        barriers = np.zeros((6, 6), dtype=bool)
+        traffic = np.zeros((2, 6, 6), dtype=bool)
+        traffic[0, 1:3, 1:3] = True
+        traffic[1, 2, 1:4] = True
+        ensemble = Ensemble(barriers, traffic)
+
+        populations = ensemble.run(100, until_stable=True)
+
+        assert ensemble.generation == 2
+        np.testing.assert_array_equal(populations, [[4, 3], [4, 3]])
+        with pytest.raises(ValueError, match="non-negative"):
+            ensemble.run(-1)
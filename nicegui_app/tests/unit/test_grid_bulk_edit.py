@@ -0,0 +1,222 @@
+"""Unit tests for bulk region editing on Grid."""
+
+import numpy as np
+import pytest
+from models import Grid
+from simulation.cycles import zobrist_hash
+from simulation.vectorized import step_states
+from ..test_utils import create_random_pattern
+
+
+def assert_caches_consistent(grid):
+    """Assert that counters, hash and barrier layer match the board."""
+    states = grid._states
+    assert grid.count_orange_cells() == int(np.count_nonzero(states == 1))
+    assert grid.count_blue_cells() == int(np.count_nonzero(states == 2))
+    assert grid.state_hash == zobrist_hash(states)
+    np.testing.assert_array_equal(grid.barrier_layer.mask, states == 1)
+
+
+def primed_grid(seed=5):
+    """Return a random grid whose hash, barrier layer and engines are warm."""
+    grid = Grid(16, 12)
+    create_random_pattern(grid, seed=seed)
+    grid.state_hash
+    grid.barrier_layer
+    grid.apply_conway_step("incremental")
+    grid.apply_conway_step("numpy")
+    return grid
+
+
+class TestFillRect:
+    """Test Grid.fill_rect."""
+
+    def test_fills_rectangle(self):
+        """Test that only the rectangle is written."""
+        grid = primed_grid()
+        expected = grid._states.copy()
+        expected[2:5, 3:9] = 1
+
+        grid.fill_rect(3, 2, 6, 3, 1)
+
+        np.testing.assert_array_equal(grid._states, expected)
+        assert_caches_consistent(grid)
+
+    def test_clips_to_grid(self):
+        """Test that a rectangle crossing the edges is clipped."""
+        grid = Grid(5, 4)
+
+        grid.fill_rect(-2, 2, 10, 10, 2)
+
+        assert grid.count_blue_cells() == 10
+        grid.fill_rect(7, 7, 2, 2, 2)
+        assert grid.count_blue_cells() == 10
+
+    @pytest.mark.parametrize("args", [(0, 0, -1, 2, 1), (0, 0, 2, 2, 3)])
+    def test_invalid_arguments_raise_error(self, args):
+        """Test that negative sizes and invalid states raise ValueError."""
+        with pytest.raises(ValueError):
+            Grid(4, 4).fill_rect(*args)
+
+
+class TestSetCells:
+    """Test Grid.set_cells."""
+
+    def test_coordinate_list(self):
+        """Test setting a list of (x, y) pairs, duplicates included."""
+        grid = primed_grid()
+        cells = [(0, 0), (15, 11), (4, 7), (4, 7)]
+
+        grid.set_cells(cells, 2)
+
+        assert all(grid.get_cell(x, y).color_state == 2 for x, y in cells)
+        assert_caches_consistent(grid)
+
+    def test_mask(self):
+        """Test setting the cells of a boolean mask."""
+        grid = primed_grid()
+        mask = np.zeros((12, 16), dtype=bool)
+        mask[::3, ::2] = True
+
+        grid.set_cells(mask, 0)
+
+        assert not grid._states[mask].any()
+        assert_caches_consistent(grid)
+
+    def test_out_of_bounds_raises_error(self):
+        """Test that off-grid coordinates raise IndexError without writing."""
+        grid = Grid(4, 4)
+
+        with pytest.raises(IndexError):
+            grid.set_cells([(1, 1), (4, 0)], 2)
+        assert grid.count_active_cells() == 0
+
+    def test_wrong_mask_shape_raises_error(self):
+        """Test that a mask of another shape raises ValueError."""
+        with pytest.raises(ValueError, match="Mask"):
+            Grid(4, 4).set_cells(np.ones((3, 4), dtype=bool), 1)
+
+
+    @pytest.mark.parametrize(
+        "cells",
+        [[1, 2, 3, 0], [(1, 2, 0)], np.zeros((2, 2, 2), dtype=int), np.zeros((4, 4), dtype=int)],
+    )
+    def test_malformed_coordinates_raise_error(self, cells):
+        """Test that anything but (x, y) pairs raises ValueError without writing."""
+        grid = Grid(4, 4)
+
+        with pytest.raises(ValueError, match="pairs"):
+            grid.set_cells(cells, 2)
+        with pytest.raises(ValueError, match="pairs"):
+            grid.cycle_cells(cells)
+        assert grid.count_active_cells() == 0
+
+
+class TestCycleCells:
+    """Test Grid.cycle_cells."""
+
+    def test_matches_cycle_cell_color(self):
+        """Test that bulk cycling equals cycling each entry in turn."""
+        grid = primed_grid()
+        reference = Grid.from_numpy(grid._states)
+        cells = [(1, 1), (2, 1), (1, 1), (5, 5), (5, 5), (5, 5), (9, 3)]
+
+        grid.cycle_cells(cells)
+        for x, y in cells:
+            reference.cycle_cell_color(x, y)
+
+        np.testing.assert_array_equal(grid._states, reference._states)
+        assert_caches_consistent(grid)
+
+    def test_mask(self):
+        """Test that a boolean mask cycles each selected cell once."""
+        grid = primed_grid()
+        before = grid.to_numpy(copy=True)
+        mask = np.zeros((12, 16), dtype=bool)
+        mask[1::4, ::3] = True
+
+        grid.cycle_cells(mask)
+
+        np.testing.assert_array_equal(grid._states[mask], (before[mask] + 1) % 3)
+        np.testing.assert_array_equal(grid._states[~mask], before[~mask])
+        assert_caches_consistent(grid)
+
+    def test_empty_list(self):
+        """Test that cycling no cells is a no-op."""
+        grid = Grid(3, 3)
+        grid.cycle_cells([])
+        assert grid.count_active_cells() == 0
+
+
+class TestStamp:
+    """Test Grid.stamp."""
+
+    def test_stamp_with_clipping(self):
+        """Test that a pattern hanging over the edge is clipped."""
+        grid = Grid(6, 5)
+        pattern = np.array([[2, 2, 2], [1, 0, 1]])
+
+        grid.stamp(pattern, 4, 3)
+
+        np.testing.assert_array_equal(grid._states[3:, 4:], [[2, 2], [1, 0]])
+        assert grid.count_active_cells() == 3
+
+    def test_skip_empty(self):
+        """Test that black pattern cells leave the board unchanged when asked."""
+        grid = Grid(4, 4)
+        grid.fill_rect(0, 0, 4, 4, 1)
+
+        grid.stamp([[0, 2], [2, 0]], 1, 1, skip_empty=True)
+
+        np.testing.assert_array_equal(grid._states[1:3, 1:3], [[1, 2], [2, 1]])
+        grid.stamp([[0, 2], [2, 0]], 1, 1)
+        np.testing.assert_array_equal(grid._states[1:3, 1:3], [[0, 2], [2, 0]])
+
+    def test_invalid_pattern_raises_error(self):
+        """Test that malformed patterns raise ValueError."""
+        with pytest.raises(ValueError):
+            Grid(4, 4).stamp([1, 2], 0, 0)
+        with pytest.raises(ValueError):
+            Grid(4, 4).stamp([[5]], 0, 0)
+        grid = Grid(4, 4)
+        with pytest.raises(ValueError, match="Color states"):
+            grid.stamp([[0.5, 2]], 0, 0)
+        assert grid.count_active_cells() == 0
+
+
+class TestEnginesAfterBulkEdits:
+    """Test that cached engine state follows bulk edits."""
+
+    @pytest.mark.parametrize("engine", ["incremental", "numpy", "sparse"])
+    def test_steps_after_edits(self, engine):
+        """Test that stepping after bulk edits matches a fresh computation."""
+        grid = primed_grid()
+        grid.apply_conway_step(engine)
+
+        grid.fill_rect(2, 2, 4, 3, 2)
+        grid.stamp([[2, 0, 2], [0, 2, 0]], 10, 8)
+        grid.set_cells([(0, 11), (1, 11)], 1)
+        grid.cycle_cells([(7, 7), (8, 7)])
+        expected = step_states(grid._states)
+        grid.apply_conway_step(engine)
+
+        np.testing.assert_array_equal(grid._states, expected)
+        assert_caches_consistent(grid)
+
+
+class TestAppDragUsesBulkCycle:
+    """Test that the drag handler applies the dragged cells in one batch."""
+
+    def test_drag_cycles_cells(self):
+        """Test that releasing the mouse cycles every in-bounds dragged cell."""
+        from app import InteractiveGridApp
+
+        app = InteractiveGridApp(width=5, height=5)
+        app.is_dragging = True
+        app.dragged_cells = [(0, 0), (1, 0), (9, 9)]
+
+        app.on_cell_mouse_up(1, 0)
+
+        assert app.grid.get_cell(0, 0).color_state == 1
+        assert app.grid.get_cell(1, 0).color_state == 1
+        assert app.grid.count_active_cells() == 2
@@ -0,0 +1,104 @@
+"""Unit tests for the streaming generations iterator."""
+
+import itertools
+
+import numpy as np
+import pytest
+from models import Grid
+from simulation.vectorized import grid_to_states, step_states
+from ..test_utils import create_blinker_pattern, create_random_pattern
+
+
+class TestGenerations:
+    """Test Grid.generations."""
+
+    def test_snapshots_follow_the_simulation(self):
+        """Test that each snapshot holds the next generation."""
+        grid = Grid(14, 10)
+        create_random_pattern(grid, seed=4)
+        expected = grid_to_states(grid)
+
+        seen = []
+        for generation, states in grid.generations(stop=5):
+            np.testing.assert_array_equal(states, expected)
+            expected = step_states(expected)
+            seen.append(generation)
+
+        assert seen == [0, 1, 2, 3, 4]
+        assert grid.generation == 4
+
+    def test_snapshots_are_read_only_views(self):
+        """Test that snapshots share memory with the grid and cannot be written."""
+        grid = Grid(5, 5)
+        create_blinker_pattern(grid)
+
+        _, states = next(grid.generations())
+
+        assert np.shares_memory(states, grid._states)
+        with pytest.raises(ValueError):
+            states[0, 0] = 2
+
+    def test_start_skips_generations(self):
+        """Test that start advances without yielding."""
+        grid = Grid(5, 5)
+        create_blinker_pattern(grid)
+        reference = Grid.from_dict(grid.to_dict())
+        reference.step(7)
+
+        generation, states = next(grid.generations(start=7))
+
+        assert generation == 7
+        np.testing.assert_array_equal(states, reference._states)
+        assert list(Grid(3, 3).generations(start=3, stop=3)) == []
+
+    def test_iteration_is_lazy(self):
+        """Test that the grid only advances as items are consumed."""
+        grid = Grid(6, 6)
+        stream = grid.generations()
+
+        assert grid.generation == 0
+        list(itertools.islice(stream, 3))
+        assert grid.generation == 2
+        list(itertools.islice(stream, 1000))
+        assert grid.generation == 1002
+
+    def test_deltas_rebuild_every_generation(self):
+        """Test that applying deltas to an empty board reproduces the snapshots."""
+        grid = Grid(16, 12)
+        create_random_pattern(grid, seed=6)
+        expected = grid_to_states(grid)
+        board = np.zeros(grid.width * grid.height, dtype=np.uint8)
+
+        for generation, indices, values in grid.generations(stop=6, deltas=True):
+            board[indices] = values
+            np.testing.assert_array_equal(board.reshape(expected.shape), expected)
+            expected = step_states(expected)
+
+    def test_deltas_include_edits_between_items(self):
+        """Test that edits made while iterating show up in the next delta."""
+        grid = Grid(8, 8)
+        create_blinker_pattern(grid)
+        stream = grid.generations(deltas=True)
+        next(stream)
+
+        grid.get_cell(7, 7).set_color_state(1)
+        _, indices, values = next(stream)
+
+        assert 7 * 8 + 7 in indices.tolist()
+        assert values[indices.tolist().index(63)] == 1
+
+    def test_resize_during_iteration_raises_error(self):
+        """Test that resizing the grid invalidates the stream."""
+        grid = Grid(5, 5)
+        stream = grid.generations()
+        next(stream)
+
+        grid.resize(6, 6)
+
+        with pytest.raises(RuntimeError, match="resized"):
+            next(stream)
+
+    def test_negative_start_raises_error(self):
+        """Test that negative start raises ValueError."""
+        with pytest.raises(ValueError, match="start must be non-negative"):
+            next(Grid(3, 3).generations(start=-1))
@@ -0,0 +1,118 @@
+"""Unit tests for NumPy interop on Grid."""
+
+import numpy as np
+import pytest
+from models import Grid
+from ..test_utils import create_random_pattern
+
+
+class TestToNumpy:
+    """Test exporting the grid's states."""
+
+    def test_view_shares_memory(self):
+        """Test that the default export is a read-only view."""
+        grid = Grid(7, 5)
+        create_random_pattern(grid, seed=1)
+
+        array = grid.to_numpy()
+
+        assert array.shape == (5, 7)
+        assert np.shares_memory(array, grid._states)
+        with pytest.raises(ValueError):
+            array[0, 0] = 2
+        grid.get_cell(3, 2).set_color_state(1)
+        assert array[2, 3] == 1
+
+    def test_copy_is_independent(self):
+        """Test that copy=True returns a writable copy."""
+        grid = Grid(4, 4)
+
+        array = grid.to_numpy(copy=True)
+        array[0, 0] = 2
+
+        assert not np.shares_memory(array, grid._states)
+        assert grid.get_cell(0, 0).color_state == 0
+
+    def test_asarray(self):
+        """Test the __array__ protocol, with and without conversion."""
+        grid = Grid(6, 3)
+        create_random_pattern(grid, seed=2)
+
+        assert np.shares_memory(np.asarray(grid), grid._states)
+        np.testing.assert_array_equal(np.asarray(grid, dtype=np.int64), grid._states)
+        assert not np.shares_memory(np.array(grid), grid._states)
+
+    def test_asarray_without_copy(self):
+        """Test that copy=False shares memory and refuses dtype conversions."""
+        grid = Grid(4, 3)
+        create_random_pattern(grid, seed=5)
+
+        assert np.shares_memory(np.asarray(grid, dtype=np.uint8, copy=False), grid._states)
+        with pytest.raises(ValueError, match="requires a copy"):
+            np.asarray(grid, dtype=np.int64, copy=False)
+
+    def test_memoryview(self):
+        """Test sharing the states through the buffer protocol."""
+        grid = Grid(5, 4)
+        create_random_pattern(grid, seed=3)
+
+        view = memoryview(grid.to_numpy())
+
+        assert view.readonly
+        assert view.shape == (4, 5)
+        assert view.tobytes() == grid._states.tobytes()
+
+    def test_buffer_export(self):
+        """Test that __buffer__ exports a read-only memoryview."""
+        grid = Grid(3, 2)
+
+        assert grid.__buffer__(0).readonly
+        with pytest.raises(BufferError):
+            grid.__buffer__(1)
+
+
+class TestFromNumpy:
+    """Test creating grids from arrays."""
+
+    def test_round_trip(self):
+        """Test that from_numpy restores a board and its caches."""
+        states = np.random.default_rng(4).integers(0, 3, (6, 9), dtype=np.uint8)
+
+        grid = Grid.from_numpy(states)
+
+        assert (grid.width, grid.height) == (9, 6)
+        np.testing.assert_array_equal(grid.to_numpy(), states)
+        assert grid.count_blue_cells() == int(np.count_nonzero(states == 2))
+        assert grid.count_orange_cells() == int(np.count_nonzero(states == 1))
+        assert not np.shares_memory(grid.to_numpy(), states)
+
+    def test_accepts_lists(self):
+        """Test that nested lists of ints are accepted."""
+        grid = Grid.from_numpy([[0, 2], [1, 0]], storage="objects")
+
+        assert grid.get_cell(1, 0).color_state == 2
+        assert grid.get_cell(0, 1).color_state == 1
+
+    def test_accepts_whole_floats(self):
+        """Test that float arrays holding whole color states are accepted."""
+        grid = Grid.from_numpy(np.array([[0.0, 2.0], [1.0, 0.0]]))
+
+        np.testing.assert_array_equal(grid._states, [[0, 2], [1, 0]])
+
+    @pytest.mark.parametrize(
+        "array",
+        [
+            np.zeros(4),
+            np.zeros((2, 2, 2)),
+            [[0, 3]],
+            [[-1, 0]],
+            [[0.5, 2]],
+            [[1.999, 0]],
+            [[np.nan, 0]],
+            [["1", "2"]],
+        ],
+    )
+    def test_invalid_arrays_raise_error(self, array):
+        """Test that malformed arrays raise ValueError."""
+        with pytest.raises(ValueError):
+            Grid.from_numpy(array)
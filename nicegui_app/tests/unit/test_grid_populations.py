@@ -0,0 +1,93 @@
+"""Unit tests for the grid's incrementally maintained population counters."""
+
+import numpy as np
+import pytest
+from models import Grid
+from ..test_utils import create_blinker_pattern, create_random_pattern
+
+
+def assert_counts_match(grid):
+    """Assert that the O(1) counters agree with a full scan of the board."""
+    states = grid._states
+    assert grid.count_orange_cells() == int(np.count_nonzero(states == 1))
+    assert grid.count_blue_cells() == int(np.count_nonzero(states == 2))
+    assert grid.count_active_cells() == int(np.count_nonzero(states))
+
+
+class TestPopulationCounters:
+    """Test that population counters stay in sync with the board."""
+
+    def test_cell_writes(self):
+        """Test that cycling and setting cells updates the counters."""
+        grid = Grid(6, 5)
+        grid.cycle_cell_color(1, 1)
+        grid.cycle_cell_color(2, 2)
+        grid.cycle_cell_color(2, 2)
+        grid.get_cell(3, 3).set_color_state(2)
+        grid.get_cell(3, 3).set_color_state(2)
+
+        assert (grid.count_orange_cells(), grid.count_blue_cells()) == (1, 2)
+        assert_counts_match(grid)
+
+    @pytest.mark.parametrize("state", [5, -1, 3])
+    def test_invalid_write_changes_nothing(self, state):
+        """Test that an invalid state is rejected before the board or counters change."""
+        grid = Grid(6, 5)
+        create_random_pattern(grid, seed=4)
+        before = grid.to_numpy(copy=True)
+        counts = (grid.count_orange_cells(), grid.count_blue_cells())
+
+        with pytest.raises(ValueError, match="Color state"):
+            grid.get_cell(2, 3).color_state = state
+
+        np.testing.assert_array_equal(grid.to_numpy(), before)
+        assert (grid.count_orange_cells(), grid.count_blue_cells()) == counts
+        assert_counts_match(grid)
+
+    @pytest.mark.parametrize("engine", ["numpy", "python", "incremental", "sparse", "B36/S23"])
+    def test_steps(self, engine):
+        """Test that births and deaths from every engine update the counters."""
+        grid = Grid(18, 14)
+        create_random_pattern(grid, seed=9)
+
+        for _ in range(4):
+            grid.apply_conway_step(engine)
+            assert_counts_match(grid)
+        grid.step(5, engine=engine)
+        assert_counts_match(grid)
+
+    @pytest.mark.parametrize("engine", ["sparse", "incremental", "tiled"])
+    def test_reported_changes_avoid_full_recount(self, engine, monkeypatch):
+        """Test that engines reporting births and deaths skip the full-board count."""
+        grid = Grid(300, 200)
+        create_blinker_pattern(grid)
+        grid.apply_conway_step(engine)
+        counted = []
+        count_nonzero = np.count_nonzero
+
+        def record_count(array, *args, **kwargs):
+            counted.append(np.size(array))
+            return count_nonzero(array, *args, **kwargs)
+
+        monkeypatch.setattr(np, "count_nonzero", record_count)
+        for _ in range(5):
+            grid.apply_conway_step(engine)
+        monkeypatch.undo()
+
+        assert all(size < grid.width * grid.height for size in counted)
+        assert grid.count_blue_cells() == 3
+        assert_counts_match(grid)
+
+    def test_bulk_operations(self):
+        """Test resize, clear, advance and loading from a dictionary."""
+        grid = Grid(12, 12)
+        create_random_pattern(grid, seed=2)
+
+        grid.resize(7, 9)
+        assert_counts_match(grid)
+        grid.advance(8)
+        assert_counts_match(grid)
+        assert_counts_match(Grid.from_dict(grid.to_dict()))
+        grid.clear_all()
+        assert grid.count_active_cells() == 0
+        assert_counts_match(grid)
@@ -0,0 +1,134 @@
+"""Unit tests for anchored, vectorized grid resizing."""
+
+import numpy as np
+import pytest
+from models import Grid
+from models.grid import RESIZE_ANCHORS
+from simulation.cycles import zobrist_hash
+
+
+def numbered_grid(width=4, height=3):
+    """Return a grid whose states vary by position."""
+    states = (np.arange(width * height).reshape(height, width) % 3).astype(np.uint8)
+    return Grid.from_numpy(states)
+
+
+class TestResizeAnchors:
+    """Test where the old cells land for each anchor."""
+
+    @pytest.mark.parametrize(
+        "anchor, offset",
+        [
+            ("top-left", (0, 0)),
+            ("top", (0, 2)),
+            ("top-right", (0, 4)),
+            ("left", (1, 0)),
+            ("center", (1, 2)),
+            ("right", (1, 4)),
+            ("bottom-left", (3, 0)),
+            ("bottom", (3, 2)),
+            ("bottom-right", (3, 4)),
+        ],
+    )
+    def test_grow(self, anchor, offset):
+        """Test that growing pads on the sides opposite to the anchor."""
+        grid = numbered_grid()
+        old = grid.to_numpy(copy=True)
+
+        grid.resize(8, 6, anchor)
+
+        dy, dx = offset
+        expected = np.zeros((6, 8), dtype=np.uint8)
+        expected[dy : dy + 3, dx : dx + 4] = old
+        np.testing.assert_array_equal(grid._states, expected)
+
+    @pytest.mark.parametrize("anchor", list(RESIZE_ANCHORS))
+    def test_shrink_then_grow_round_trip(self, anchor):
+        """Test that cropping keeps the anchored part and regrowing restores it."""
+        grid = numbered_grid(9, 7)
+        old = grid.to_numpy(copy=True)
+
+        grid.resize(5, 3, anchor)
+        grid.resize(9, 7, anchor)
+
+        kept = grid._states != 0
+        np.testing.assert_array_equal(grid._states[kept], old[kept])
+        assert np.count_nonzero(kept) > 0
+
+    @pytest.mark.parametrize("anchor", list(RESIZE_ANCHORS))
+    def test_grow_then_shrink_round_trip(self, anchor):
+        """Test that shrinking back after an odd growth restores every cell."""
+        grid = Grid.from_numpy([[2, 1], [1, 2]])
+        old = grid.to_numpy(copy=True)
+
+        grid.resize(5, 5, anchor)
+        grid.resize(2, 2, anchor)
+
+        np.testing.assert_array_equal(grid._states, old)
+        assert (grid.count_orange_cells(), grid.count_blue_cells()) == (2, 2)
+
+    def test_center_crop(self):
+        """Test the cells kept by a centered crop."""
+        grid = numbered_grid(6, 6)
+        old = grid.to_numpy(copy=True)
+
+        grid.resize(2, 2, "center")
+
+        np.testing.assert_array_equal(grid._states, old[2:4, 2:4])
+
+    def test_unknown_anchor_raises_error(self):
+        """Test that an unknown anchor raises ValueError."""
+        with pytest.raises(ValueError, match="anchor"):
+            Grid(3, 3).resize(4, 4, "middle")
+
+
+class TestResizeState:
+    """Test that caches and cell views follow a resize."""
+
+    @pytest.mark.parametrize("storage", ["array", "objects"])
+    def test_cells_match_coordinates(self, storage):
+        """Test that every cell view reports its new coordinates."""
+        grid = Grid(4, 4, storage=storage)
+        grid.resize(2, 2)
+        grid.resize(5, 3, "bottom-right")
+
+        assert all(
+            (grid.cells[y][x].x, grid.cells[y][x].y) == (x, y)
+            for y in range(3)
+            for x in range(5)
+        )
+
+    def test_caches_after_resize(self):
+        """Test counters, hash and barriers after an anchored resize."""
+        grid = numbered_grid(7, 5)
+        grid.state_hash
+
+        grid.resize(4, 6, "right")
+
+        assert grid.count_blue_cells() == int(np.count_nonzero(grid._states == 2))
+        assert grid.count_orange_cells() == int(np.count_nonzero(grid._states == 1))
+        assert grid.state_hash == zobrist_hash(grid._states)
+        np.testing.assert_array_equal(grid.barrier_layer.mask, grid._states == 1)
+
+
+class TestCrop:
+    """Test zero-copy crops."""
+
+    def test_crop_is_a_view(self):
+        """Test that crop returns a read-only view of the rectangle."""
+        grid = numbered_grid(6, 5)
+
+        region = grid.crop(1, 2, 3, 2)
+
+        np.testing.assert_array_equal(region, grid._states[2:4, 1:4])
+        assert np.shares_memory(region, grid._states)
+        with pytest.raises(ValueError):
+            region[0, 0] = 0
+
+    def test_crop_is_clipped(self):
+        """Test that rectangles crossing the edges are clipped."""
+        grid = numbered_grid(4, 4)
+
+        assert grid.crop(-1, -1, 3, 3).shape == (2, 2)
+        assert grid.crop(3, 3, 5, 5).shape == (1, 1)
+        assert grid.crop(6, 0, 2, 2).size == 0
@@ -0,0 +1,106 @@
+"""Unit tests for board statistics."""
+
+import numpy as np
+import pytest
+from models import Grid
+from simulation.stats import StepStats, compute_stats, traffic_bbox
+from ..test_utils import create_blinker_pattern, create_random_pattern
+
+
+def scan_stats(before, after):
+    """Compute births and deaths cell by cell."""
+    births = deaths = 0
+    for old, new in zip(before.ravel().tolist(), after.ravel().tolist()):
+        births += old != 2 and new == 2
+        deaths += old == 2 and new != 2
+    return births, deaths
+
+
+class TestComputeStats:
+    """Test compute_stats on raw arrays."""
+
+    def test_populations_and_density(self):
+        """Test population counts and density on open road."""
+        states = np.array([[0, 1, 2], [2, 1, 0]], dtype=np.uint8)
+
+        stats = compute_stats(states, generation=4)
+
+        assert (stats.black, stats.orange, stats.blue) == (2, 2, 2)
+        assert stats.population == 4
+        assert stats.density == 0.5
+        assert stats.generation == 4
+        assert stats.births is None and stats.deaths is None
+
+    def test_bounding_box(self):
+        """Test the inclusive traffic bounding box, ignoring barriers."""
+        states = np.zeros((6, 8), dtype=np.uint8)
+        states[1, 5] = 2
+        states[4, 2] = 2
+        states[5, 7] = 1
+
+        assert compute_stats(states).bbox == (2, 1, 5, 4)
+        assert traffic_bbox(np.zeros((3, 3), dtype=bool)) is None
+
+    def test_empty_board(self):
+        """Test stats of a board that is all barriers."""
+        stats = compute_stats(np.ones((2, 2), dtype=np.uint8))
+
+        assert stats.density == 0.0
+        assert stats.bbox is None
+
+    def test_to_dict(self):
+        """Test the serializable form."""
+        stats = StepStats(1, 5, 2, 2, births=1, deaths=0, bbox=(0, 0, 1, 1))
+
+        assert stats.to_dict() == {
+            "generation": 1,
+            "black": 5,
+            "orange": 2,
+            "blue": 2,
+            "births": 1,
+            "deaths": 0,
+            "bbox": [0, 0, 1, 1],
+            "density": 2 / 7,
+        }
+
+
+class TestGridStats:
+    """Test Grid.stats and stats from steps."""
+
+    @pytest.mark.parametrize("engine", ["numpy", "incremental", "sparse", "python"])
+    def test_step_stats_match_scan(self, engine):
+        """Test births and deaths reported by a step against a cell scan."""
+        grid = Grid(20, 16)
+        create_random_pattern(grid, seed=11)
+
+        for _ in range(4):
+            before = grid._states.copy()
+            stats = grid.apply_conway_step(engine, stats=True)
+            assert (stats.births, stats.deaths) == scan_stats(before, grid._states)
+            assert stats == compute_stats(grid._states, before, grid.generation)
+
+    def test_blinker(self):
+        """Test that a blinker has two births and two deaths per step."""
+        grid = Grid(5, 5)
+        create_blinker_pattern(grid)
+
+        stats = grid.apply_conway_step(stats=True)
+
+        assert (stats.births, stats.deaths, stats.blue) == (2, 2, 3)
+        assert stats.bbox == (1, 0, 1, 2)
+        assert stats.generation == 1
+
+    def test_step_without_stats_returns_none(self):
+        """Test that stats are only computed on request."""
+        assert Grid(3, 3).apply_conway_step() is None
+
+    def test_stats_of_arbitrary_states(self):
+        """Test that Grid.stats summarizes any array."""
+        grid = Grid(4, 4)
+        states = np.full((2, 3), 2, dtype=np.uint8)
+
+        stats = grid.stats(states)
+
+        assert stats.blue == 6
+        assert stats.bbox == (0, 0, 2, 1)
+        assert grid.stats().blue == 0
@@ -0,0 +1,135 @@
+"""Unit tests for batched multi-generation stepping."""
+
+import numpy as np
+import pytest
+from models import Grid
+from simulation.vectorized import VectorizedEngine, grid_to_states
+from ..test_utils import (
+    create_blinker_pattern,
+    create_random_pattern,
+    assert_grid_states_equal,
+)
+
+
+class CountingEngine(VectorizedEngine):
+    """Vectorized engine that records how it was called."""
+
+    name = "counting"
+
+    def __init__(self):
+        super().__init__()
+        self.runs = []
+
+    def run(self, states, generations, out=None):
+        self.runs.append(generations)
+        return super().run(states, generations, out)
+
+
+class TestGridStep:
+    """Test Grid.step and the generation counter."""
+
+    @pytest.mark.parametrize("engine", ["numpy", "python", "tiled", "incremental", "threads"])
+    def test_matches_repeated_single_steps(self, engine):
+        """Test that step(n) equals n calls to apply_conway_step."""
+        reference = Grid(23, 17)
+        create_random_pattern(reference, seed=8)
+        grid = Grid.from_dict(reference.to_dict())
+
+        for _ in range(25):
+            reference.apply_conway_step(engine=engine)
+        grid.step(25, engine=engine)
+
+        assert_grid_states_equal(reference, grid)
+        assert grid.generation == reference.generation == 25
+
+    def test_generation_counter(self):
+        """Test that every way of advancing updates the generation."""
+        grid = Grid(6, 6)
+        assert grid.generation == 0
+
+        grid.apply_conway_step()
+        grid.step(4)
+        grid.advance(5)
+        grid.step(0)
+
+        assert grid.generation == 10
+
+    def test_callback_every(self):
+        """Test that the callback runs between batches with current states."""
+        grid = Grid(5, 5)
+        create_blinker_pattern(grid)
+        seen = []
+
+        grid.step(
+            7,
+            callback_every=3,
+            callback=lambda g: seen.append((g.generation, g.cells[0][1].is_blue_traffic())),
+        )
+
+        # The blinker is vertical after odd generations.
+        assert seen == [(3, True), (6, False), (7, True)]
+
+    def test_callback_without_interval_runs_once(self):
+        """Test that without callback_every the callback runs at the end."""
+        grid = Grid(5, 5)
+        calls = []
+
+        grid.step(10, callback=calls.append)
+
+        assert calls == [grid]
+
+    def test_whole_batches_go_to_the_engine(self):
+        """Test that generations are run inside the engine, not one by one."""
+        grid = Grid(8, 8)
+        engine = CountingEngine()
+
+        grid.step(10_000, engine=engine)
+        grid.step(10, callback_every=4, callback=lambda g: None, engine=engine)
+
+        assert engine.runs == [10_000, 4, 4, 2]
+
+    def test_steps_ping_pong_between_grid_buffers(self):
+        """Test that batched steps only use the grid's own buffers."""
+        grid = Grid(9, 9)
+        create_random_pattern(grid, seed=3)
+        buffers = {id(grid._states), id(grid._next)}
+
+        for generations in (1, 2, 5):
+            grid.step(generations)
+            assert {id(grid._states), id(grid._next)} == buffers
+
+    @pytest.mark.parametrize(
+        "kwargs, message",
+        [
+            ({"generations": -1}, "non-negative"),
+            ({"generations": 3, "callback_every": 0}, "callback_every must be positive"),
+        ],
+    )
+    def test_invalid_arguments_raise_error(self, kwargs, message):
+        """Test that invalid counts raise ValueError."""
+        with pytest.raises(ValueError, match=message):
+            Grid(3, 3).step(**kwargs)
+
+
+class TestEngineRun:
+    """Test Engine.run with and without a scratch buffer."""
+
+    def test_run_without_out_leaves_input_untouched(self):
+        """Test that run without out does not overwrite the input array."""
+        grid = Grid(10, 10)
+        create_random_pattern(grid, seed=4)
+        states = grid_to_states(grid)
+        original = states.copy()
+
+        VectorizedEngine().run(states, 3)
+
+        np.testing.assert_array_equal(states, original)
+
+    def test_run_with_out_alternates_buffers(self):
+        """Test that run with out returns one of the two given buffers."""
+        states = np.zeros((6, 6), dtype=np.uint8)
+        states[2, 1:4] = 2
+        out = np.empty_like(states)
+
+        assert VectorizedEngine().run(states, 1, out) is out
+        assert VectorizedEngine().run(out, 1, states) is states
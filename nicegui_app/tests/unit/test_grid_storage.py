@@ -0,0 +1,193 @@
+"""Unit tests for the array-backed grid storage and double buffering."""
+
+import tracemalloc
+
+import pytest
+from models import Grid, Cell, CellView
+from ..test_utils import (
+    create_blinker_pattern,
+    create_random_pattern,
+    assert_grid_states_equal,
+)
+
+
+class TestArrayStorage:
+    """Test the compact uint8 storage mode."""
+
+    def test_unknown_storage_raises_error(self):
+        """Test that an unknown storage mode raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown storage mode"):
+            Grid(3, 3, storage="linked-list")
+
+    def test_buffer_uses_one_byte_per_cell(self):
+        """Test that the grid keeps a single contiguous uint8 buffer."""
+        grid = Grid(200, 100, storage="array")
+        assert grid._states.nbytes == 200 * 100
+        assert grid._states.flags["C_CONTIGUOUS"]
+
+    def test_cells_are_views(self):
+        """Test that cells are CellView instances with correct coordinates."""
+        grid = Grid(3, 2, storage="array")
+
+        assert len(grid.cells) == 2
+        assert len(grid.cells[0]) == 3
+        for y, row in enumerate(grid.cells):
+            for x, cell in enumerate(row):
+                assert isinstance(cell, Cell)
+                assert isinstance(cell, CellView)
+                assert (cell.x, cell.y) == (x, y)
+                assert cell.is_black()
+
+    def test_cells_have_no_instance_dict(self):
+        """Test that cells and views are slotted and reject unknown attributes."""
+        view = Grid(3, 3, storage="array").get_cell(1, 1)
+
+        for cell in (Cell(0, 0, 2), view):
+            assert not hasattr(cell, "__dict__")
+            with pytest.raises(AttributeError):
+                cell.label = "x"
+        view.color_state = 2
+        assert view.color_state == 2
+
+    def test_view_writes_reach_the_buffer(self):
+        """Test that writes through a view are visible to other views."""
+        grid = Grid(4, 4, storage="array")
+        cell = grid.get_cell(1, 2)
+
+        cell.set_color_state(2)
+        assert grid.cells[2][1].is_blue_traffic()
+        assert grid._states[2, 1] == 2
+
+        grid.cycle_cell_color(1, 2)
+        assert cell.is_black()
+
+        cell.is_blue = True
+        assert grid.get_cell(1, 2).is_orange()
+
+    def test_out_of_bounds_access_raises_error(self):
+        """Test that rows and cells are bounds checked."""
+        grid = Grid(3, 3, storage="array")
+        with pytest.raises(IndexError):
+            grid.get_cell(3, 0)
+        with pytest.raises(IndexError):
+            grid.cells[3]
+        with pytest.raises(IndexError):
+            grid.cells[0][3]
+
+    def test_operations_match_object_storage(self):
+        """Test counting, clearing, resizing and serialization in both modes."""
+        objects_grid = Grid(8, 6, storage="objects")
+        create_random_pattern(objects_grid, seed=3)
+        array_grid = Grid.from_dict(objects_grid.to_dict(), storage="array")
+
+        assert isinstance(objects_grid.cells, list)
+        assert_grid_states_equal(objects_grid, array_grid)
+        assert objects_grid.to_dict() == array_grid.to_dict()
+        assert array_grid.count_active_cells() == objects_grid.count_active_cells()
+        assert array_grid.count_orange_cells() == objects_grid.count_orange_cells()
+        assert array_grid.count_blue_cells() == objects_grid.count_blue_cells()
+
+        objects_grid.resize(5, 9)
+        array_grid.resize(5, 9)
+        assert_grid_states_equal(objects_grid, array_grid)
+
+        array_grid.clear_all()
+        assert array_grid.count_active_cells() == 0
+
+    @pytest.mark.parametrize("engine", ["python", "numpy"])
+    def test_conway_step_matches_object_storage(self, engine):
+        """Test that both engines evolve array-backed grids identically."""
+        objects_grid = Grid(12, 10, storage="objects")
+        create_random_pattern(objects_grid, seed=5)
+        array_grid = Grid.from_dict(objects_grid.to_dict(), storage="array")
+
+        for _ in range(4):
+            objects_grid.apply_conway_step(engine=engine)
+            array_grid.apply_conway_step(engine=engine)
+            assert_grid_states_equal(objects_grid, array_grid)
+
+    def test_save_and_load_array_grid(self, tmp_path):
+        """Test that array-backed grids round-trip through files."""
+        grid = Grid(5, 5, storage="array")
+        create_blinker_pattern(grid)
+        save_path = tmp_path / "array_grid.json"
+
+        grid.save_to_file(save_path)
+        loaded = Grid.load_from_file(save_path, storage="array")
+
+        assert loaded.storage == "array"
+        assert_grid_states_equal(grid, loaded)
+
+
+class TestDoubleBuffering:
+    """Test stepping by swapping the grid's two state buffers."""
+
+    def test_default_engine_is_vectorized(self):
+        """Test that grids step with the NumPy engine by default."""
+        assert Grid(3, 3).engine == "numpy"
+
+    def test_buffers_are_swapped(self):
+        """Test that each step swaps the current and scratch buffers."""
+        grid = Grid(6, 6)
+        create_blinker_pattern(grid)
+        current, scratch = grid._states, grid._next
+
+        grid.apply_conway_step()
+        assert grid._states is scratch
+        assert grid._next is current
+
+        grid.apply_conway_step()
+        assert grid._states is current
+        assert grid._next is scratch
+
+    @pytest.mark.parametrize("engine", ["tiled", "sparse"])
+    def test_in_place_engines_keep_buffers(self, engine):
+        """Test that engines updating the current buffer in place skip the swap."""
+        grid = Grid(6, 6)
+        create_blinker_pattern(grid)
+        current = grid._states
+
+        grid.apply_conway_step(engine=engine)
+
+        assert grid._states is current
+        assert grid.cells[0][1].is_blue_traffic()
+
+    def test_persistent_cells_follow_the_current_generation(self):
+        """Test that the objects storage mode keeps the same cells across steps."""
+        grid = Grid(5, 5, storage="objects")
+        create_blinker_pattern(grid)
+        cell = grid.cells[0][1]
+
+        grid.apply_conway_step()
+
+        assert grid.cells[0][1] is cell
+        assert cell.is_blue_traffic()
+        assert grid.cells[1][0].is_black()
+
+    def test_python_engine_matches_numpy_engine(self):
+        """Test that the pure-Python engine still gives identical results."""
+        python_grid = Grid(14, 11)
+        create_random_pattern(python_grid, seed=12)
+        python_grid.engine = "python"
+        numpy_grid = Grid.from_dict(python_grid.to_dict())
+
+        for _ in range(5):
+            python_grid.apply_conway_step()
+            numpy_grid.apply_conway_step()
+            assert_grid_states_equal(python_grid, numpy_grid)
+
+    def test_stepping_does_not_allocate_boards(self):
+        """Test that a step allocates far less than one board of memory."""
+        grid = Grid(300, 300)
+        create_random_pattern(grid, seed=1)
+        grid.apply_conway_step()
+
+        tracemalloc.start()
+        try:
+            for _ in range(5):
+                grid.apply_conway_step()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert peak < grid._states.nbytes // 4
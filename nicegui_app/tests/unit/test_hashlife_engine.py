@@ -0,0 +1,99 @@
+"""Unit tests for the HashLife fast-forward engine."""
+
+import numpy as np
+import pytest
+from models import Grid
+from simulation.hashlife import HashLife
+from simulation.vectorized import grid_to_states, step_states
+from ..test_utils import (
+    create_blinker_pattern,
+    create_block_pattern,
+    create_random_pattern,
+    assert_grid_states_equal,
+)
+
+
+def _step_many(states: np.ndarray, generations: int) -> np.ndarray:
+    """Advance states one generation at a time with the vectorized engine."""
+    for _ in range(generations):
+        states = step_states(states)
+    return states
+
+
+class TestHashLifeNodes:
+    """Test canonical macrocell construction."""
+
+    def test_nodes_are_canonical(self):
+        """Test that equal subtrees are represented by the same node."""
+        engine = HashLife()
+        leaf = engine.barrier_node(0)
+        first = engine.join(leaf, leaf, leaf, leaf)
+        second = engine.join(leaf, leaf, leaf, leaf)
+        assert first is second
+        assert first is engine.barrier_node(1)
+
+    def test_repeated_structure_is_shared(self):
+        """Test that an empty board collapses to one node per level."""
+        engine = HashLife()
+        root = engine.from_states(np.zeros((16, 16), dtype=np.uint8), level=5)
+        assert root.level == 5
+        assert root.nw.se.nw is root.nw.se.se
+
+
+class TestHashLifeAdvance:
+    """Test that HashLife jumps match single stepping."""
+
+    @pytest.mark.parametrize("width,height", [(1, 1), (7, 5), (20, 13), (33, 3)])
+    @pytest.mark.parametrize("generations", [0, 1, 2, 3, 7, 16, 37])
+    def test_matches_vectorized_steps(self, width, height, generations):
+        """Test random boards with barriers and edges against stepping."""
+        grid = Grid(width, height)
+        create_random_pattern(grid, seed=width * 100 + height)
+        states = grid_to_states(grid)
+
+        actual = HashLife().advance(states, generations)
+
+        np.testing.assert_array_equal(actual, _step_many(states, generations))
+
+    def test_negative_generations_raise_error(self):
+        """Test that negative generation counts raise ValueError."""
+        with pytest.raises(ValueError, match="non-negative"):
+            HashLife().advance(np.zeros((3, 3), dtype=np.uint8), -1)
+
+
+class TestGridAdvance:
+    """Test the Grid.advance API."""
+
+    def test_advance_matches_apply_conway_step(self):
+        """Test that advancing equals repeated single steps."""
+        stepped = Grid(24, 18)
+        create_random_pattern(stepped, seed=4)
+        advanced = Grid.from_dict(stepped.to_dict(), storage="array")
+
+        for _ in range(50):
+            stepped.apply_conway_step(engine="numpy")
+        advanced.advance(50)
+
+        assert_grid_states_equal(stepped, advanced)
+
+    def test_advance_far_ahead(self):
+        """Test jumping thousands of generations on periodic patterns."""
+        grid = Grid(10, 10)
+        create_blinker_pattern(grid)
+        grid.cells[6][6].set_color_state(1)  # orange barrier
+        original = grid.to_dict()
+
+        grid.advance(4096)
+        assert grid.to_dict() == original
+
+        grid.advance(4097)
+        assert grid.cells[0][1].is_blue_traffic()
+        assert grid.cells[2][1].is_blue_traffic()
+        assert grid.cells[6][6].is_orange()
+
+    def test_block_survives_in_corner(self):
+        """Test that a still life touching the bounded edges is preserved."""
+        grid = Grid(2, 2)
+        create_block_pattern(grid)
+        grid.advance(1000)
+        assert grid.count_blue_cells() == 4
@@ -0,0 +1,188 @@
+"""Unit tests for the compressed generation history."""
+
+import numpy as np
+import pytest
+from models import Grid
+from simulation.history import Frame, History
+from ..test_utils import create_blinker_pattern, create_random_pattern
+
+
+def record_run(grid, history, generations):
+    """Step a grid, recording every generation; return the boards seen."""
+    boards = {grid.generation: grid._states.copy()}
+    history.record(grid.generation, grid._states)
+    for _ in range(generations):
+        grid.apply_conway_step()
+        history.record(grid.generation, grid._states)
+        boards[grid.generation] = grid._states.copy()
+    return boards
+
+
+class TestFrame:
+    """Test the run-length encoding of frames."""
+
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_round_trip(self, seed):
+        """Test that applying a frame to zeros restores the encoded data."""
+        rng = np.random.default_rng(seed)
+        data = (rng.random(200) < 0.3).astype(np.uint8) * rng.integers(1, 4, 200, dtype=np.uint8)
+        board = np.zeros(200, dtype=np.uint8)
+
+        Frame(0, data).apply(board)
+
+        np.testing.assert_array_equal(board, data)
+
+    def test_runs_at_the_edges(self):
+        """Test runs touching the first and last cell."""
+        data = np.zeros(200, dtype=np.uint8)
+        data[[0, 1, 50, 199]] = [2, 2, 1, 2]
+        frame = Frame(0, data)
+
+        assert frame.packed is None
+        assert frame.starts.tolist() == [0, 50, 199]
+        assert frame.lengths.tolist() == [2, 1, 1]
+        assert frame.values.tolist() == [2, 2, 1, 2]
+
+    @pytest.mark.parametrize("size", [1, 7, 8, 201])
+    def test_busy_data_is_bit_packed(self, size):
+        """Test that data with many short runs is packed to two bits per cell."""
+        data = np.resize(np.array([3, 0, 1, 0, 2, 2, 0], dtype=np.uint8), size)
+        board = np.zeros(size, dtype=np.uint8)
+        frame = Frame(0, data)
+
+        frame.apply(board)
+
+        assert frame.packed is not None
+        assert frame.nbytes == (size + 3) // 4
+        np.testing.assert_array_equal(board, data)
+
+    def test_empty_frame(self):
+        """Test that an all-zero delta stores nothing."""
+        frame = Frame(0, np.zeros(50, dtype=np.uint8))
+
+        assert frame.nbytes == 0
+
+
+class TestHistory:
+    """Test the History ring buffer."""
+
+    def test_random_access(self):
+        """Test that every recorded generation is reconstructed exactly."""
+        grid = Grid(20, 15)
+        create_random_pattern(grid, seed=3)
+        history = History(keyframe_interval=8)
+
+        boards = record_run(grid, history, 50)
+
+        assert history.generations == list(range(51))
+        for generation, board in boards.items():
+            np.testing.assert_array_equal(history.states_at(generation), board)
+
+    def test_deltas_capture_edits(self):
+        """Test that edits between recorded generations are kept."""
+        grid = Grid(6, 6)
+        history = History()
+        history.record(0, grid._states)
+        grid.get_cell(2, 3).set_color_state(1)
+        history.record(1, grid._states)
+
+        assert history.states_at(1)[3, 2] == 1
+        assert history.states_at(0)[3, 2] == 0
+
+    def test_memory_cap_evicts_oldest(self):
+        """Test that old generations are dropped to stay under the cap."""
+        grid = Grid(30, 30)
+        create_random_pattern(grid, seed=5)
+        history = History(max_bytes=4000, keyframe_interval=4)
+
+        boards = record_run(grid, history, 60)
+
+        assert history.nbytes <= 4000
+        assert history.last == 60
+        assert 0 not in history
+        assert history.generations == list(range(history.first, 61))
+        for generation in history.generations:
+            np.testing.assert_array_equal(history.states_at(generation), boards[generation])
+
+    def test_busy_board_stays_under_the_cap(self):
+        """Test that a busy board's frames never outgrow the board itself."""
+        rng = np.random.default_rng(4)
+        states = rng.choice(np.array([0, 1, 2], dtype=np.uint8), size=(500, 500), p=[0.5, 0.1, 0.4])
+        grid = Grid.from_numpy(states)
+        max_bytes = 2 * 1024 * 1024
+        history = History(max_bytes=max_bytes, keyframe_interval=8)
+
+        boards = record_run(grid, history, 40)
+
+        # Each frame takes at most a quarter of the board, so the cap holds
+        # the uncompressed latest board plus at least this many frames.
+        assert len(history) >= (max_bytes - states.size) // (states.size // 4)
+        assert history.nbytes <= max_bytes
+        for generation in history.generations[::5]:
+            np.testing.assert_array_equal(history.states_at(generation), boards[generation])
+
+    def test_latest_generation_is_always_kept(self):
+        """Test that a cap smaller than one board still keeps the newest one."""
+        grid = Grid(10, 10)
+        create_blinker_pattern(grid)
+        history = History(max_bytes=1)
+
+        record_run(grid, history, 3)
+
+        assert history.generations == [3]
+
+    def test_recording_an_earlier_generation_truncates(self):
+        """Test that recording after a rewind drops the old future."""
+        grid = Grid(12, 12)
+        create_random_pattern(grid, seed=8)
+        history = History(keyframe_interval=4)
+        boards = record_run(grid, history, 40)
+
+        replacement = np.zeros_like(boards[10])
+        history.record(10, replacement)
+
+        assert history.generations == list(range(11))
+        np.testing.assert_array_equal(history.states_at(10), replacement)
+        np.testing.assert_array_equal(history.states_at(9), boards[9])
+
+    def test_shape_change_starts_over(self):
+        """Test that a board of a new shape clears the history."""
+        history = History()
+        history.record(0, np.zeros((3, 3), dtype=np.uint8))
+        history.record(1, np.zeros((4, 4), dtype=np.uint8))
+
+        assert history.generations == [1]
+
+    def test_missing_generation_raises_error(self):
+        """Test that unknown generations raise KeyError."""
+        history = History()
+        history.record(5, np.zeros((3, 3), dtype=np.uint8))
+
+        with pytest.raises(KeyError):
+            history.states_at(4)
+        assert 4 not in history
+
+    @pytest.mark.parametrize("kwargs", [{"max_bytes": 0}, {"keyframe_interval": 0}])
+    def test_invalid_settings_raise_error(self, kwargs):
+        """Test that non-positive settings raise ValueError."""
+        with pytest.raises(ValueError):
+            History(**kwargs)
+
+
+class TestAppRewind:
+    """Test rewinding the app through its history."""
+
+    def test_rewind_to_earlier_generation(self):
+        """Test that the app restores a recorded generation."""
+        from app import InteractiveGridApp
+
+        app = InteractiveGridApp(width=5, height=5)
+        create_blinker_pattern(app.grid)
+        start = app.grid._states.copy()
+        for _ in range(3):
+            app.run_simulation_step()
+
+        assert app.rewind_to(0)
+        assert app.grid.generation == 0
+        np.testing.assert_array_equal(app.grid._states, start)
+        assert not app.rewind_to(10)
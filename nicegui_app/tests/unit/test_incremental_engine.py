@@ -0,0 +1,138 @@
+"""Unit tests for the incremental neighbor-count engine."""
+
+import numpy as np
+import pytest
+from models import Grid
+from simulation.incremental import IncrementalEngine, padded_neighbor_counts
+from simulation.vectorized import count_traffic_neighbors, grid_to_states, step_states
+from ..test_utils import (
+    create_blinker_pattern,
+    create_block_pattern,
+    create_random_pattern,
+    assert_grid_states_equal,
+)
+
+
+class TestIncrementalEngine:
+    """Test stepping by patching a persistent neighbor-count field."""
+
+    def test_padded_counts_match_vectorized_counts(self):
+        """Test that the inner count field equals a full recount."""
+        grid = Grid(17, 11)
+        create_random_pattern(grid, seed=4)
+        states = grid_to_states(grid)
+
+        counts = padded_neighbor_counts(states)
+
+        assert counts.shape == (13, 19)
+        np.testing.assert_array_equal(counts[1:-1, 1:-1], count_traffic_neighbors(states))
+
+    @pytest.mark.parametrize("use_jit", [False, True])
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_matches_vectorized_steps(self, seed, use_jit):
+        """Test random boards against full-board stepping for many generations."""
+        grid = Grid(31, 24)
+        create_random_pattern(grid, seed=seed, traffic_density=0.3)
+        expected = grid_to_states(grid)
+        states = expected.copy()
+        engine = IncrementalEngine(use_jit=use_jit)
+
+        for _ in range(40):
+            expected = step_states(expected)
+            states = engine.step(states)
+            np.testing.assert_array_equal(states, expected)
+            np.testing.assert_array_equal(
+                engine.counts, padded_neighbor_counts(states)
+            )
+
+    def test_still_life_leaves_nothing_to_check(self):
+        """Test that a settled board costs nothing per generation."""
+        grid = Grid(50, 50)
+        create_block_pattern(grid)
+        states = grid_to_states(grid)
+        engine = IncrementalEngine()
+
+        engine.step(states)
+
+        assert engine.pending_cells == 0
+
+    def test_work_follows_the_changes(self):
+        """Test that only the neighborhood of a blinker is re-examined."""
+        states = np.zeros((100, 100), dtype=np.uint8)
+        states[50, 49:52] = 2
+        engine = IncrementalEngine()
+
+        for _ in range(3):
+            states = engine.step(states)
+
+        # Four changed cells per generation, each with a 3x3 block.
+        assert 0 < engine.pending_cells <= 4 * 9
+
+    def test_busy_board_steps_densely_until_it_settles(self):
+        """Test that a busy board is stepped densely, then sparsely again, exactly."""
+        states = np.zeros((60, 60), dtype=np.uint8)
+        states[:30] = (np.random.default_rng(5).random((30, 60)) < 0.4) * 2
+        states[50, 9:12] = 2
+        expected = states.copy()
+        engine = IncrementalEngine()
+
+        states = engine.step(states)
+        expected = step_states(expected)
+        assert engine.pending_cells == states.size
+
+        for _ in range(300):
+            expected = step_states(expected)
+            states = engine.step(states)
+            np.testing.assert_array_equal(states, expected)
+            np.testing.assert_array_equal(engine.counts, padded_neighbor_counts(states))
+        assert engine.pending_cells < states.size
+
+
+class TestGridIncrementalEngine:
+    """Test the incremental engine through Grid.apply_conway_step."""
+
+    def test_cycle_cell_color_keeps_counts_consistent(self):
+        """Test that edits between steps patch the counts without a reset."""
+        reference = Grid(20, 20)
+        create_blinker_pattern(reference)
+        grid = Grid.from_dict(reference.to_dict())
+        grid.apply_conway_step(engine="incremental")
+        reference.apply_conway_step(engine="numpy")
+        engine = grid._engines["incremental"]
+
+        for x, y in [(10, 10), (11, 10), (11, 10), (12, 10), (1, 0), (1, 0)]:
+            grid.cycle_cell_color(x, y)
+            reference.cycle_cell_color(x, y)
+            assert engine.counts is not None
+            np.testing.assert_array_equal(
+                engine.counts, padded_neighbor_counts(grid._states)
+            )
+
+        for _ in range(4):
+            grid.apply_conway_step(engine="incremental")
+            reference.apply_conway_step(engine="numpy")
+            assert_grid_states_equal(reference, grid)
+
+    def test_other_engines_still_reset_on_edits(self):
+        """Test that engines without an edit hook are reset as before."""
+        grid = Grid(40, 40)
+        create_block_pattern(grid)
+        grid.apply_conway_step(engine="tiled")
+        tiled = grid._engines["tiled"]
+        assert tiled.active_tiles == 0
+
+        grid.cycle_cell_color(30, 30)
+
+        assert tiled.active_tiles == -1
+
+    @pytest.mark.parametrize("storage", ["objects", "array"])
+    def test_matches_python_engine(self, storage):
+        """Test the incremental engine against the reference in both storage modes."""
+        reference = Grid(20, 15)
+        create_random_pattern(reference, seed=9)
+        grid = Grid.from_dict(reference.to_dict(), storage=storage)
+
+        for _ in range(6):
+            reference.apply_conway_step(engine="python")
+            grid.apply_conway_step(engine="incremental")
+            assert_grid_states_equal(reference, grid)
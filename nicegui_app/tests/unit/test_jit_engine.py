@@ -0,0 +1,122 @@
+"""Unit tests for the optional Numba backend and engine selection."""
+
+import numpy as np
+import pytest
+from models import Grid
+from simulation import jit
+from simulation.engines import ENGINE_ENV_VAR, default_engine_name
+from simulation.incremental import IncrementalEngine, padded_neighbor_counts
+from simulation.vectorized import grid_to_states, step_states
+from ..test_utils import create_blinker_pattern, create_random_pattern, assert_grid_states_equal
+
+
+class TestJitBackend:
+    """Test the JIT kernels with whichever backend is installed."""
+
+    def test_backend_matches_numba_detection(self):
+        """Test that the backend reflects whether Numba could be imported."""
+        assert jit.BACKEND == ("numba" if jit.HAS_NUMBA else "python")
+        assert jit.JitEngine().backend == jit.BACKEND
+
+    def test_whole_board_matches_vectorized_step(self):
+        """Test full-board stepping against the NumPy engine."""
+        grid = Grid(19, 13)
+        create_random_pattern(grid, seed=7)
+        states = grid_to_states(grid)
+        out = np.empty_like(states)
+
+        for _ in range(5):
+            expected = step_states(states)
+            assert jit.step_states_jit(states, out) is out
+            np.testing.assert_array_equal(out, expected)
+            states, out = out, states
+
+    def test_step_cells_updates_only_listed_cells(self):
+        """Test stepping an irregular list of cells against a count field."""
+        grid = Grid(12, 10)
+        create_random_pattern(grid, seed=3)
+        states = grid_to_states(grid)
+        expected = step_states(states)
+        counts = padded_neighbor_counts(states)
+        ys, xs = np.array([0, 9, 4, 4, 6, 2]), np.array([0, 11, 3, 7, 5, 8])
+        listed = np.zeros(states.shape, dtype=bool)
+        listed[ys, xs] = True
+        stepped = states.copy()
+
+        changed = jit.step_cells(stepped, counts, ys, xs)
+
+        np.testing.assert_array_equal(stepped[listed], expected[listed])
+        np.testing.assert_array_equal(stepped[~listed], states[~listed])
+        np.testing.assert_array_equal(counts, padded_neighbor_counts(stepped))
+        assert sorted(changed.tolist()) == np.flatnonzero(
+            stepped[ys, xs] != states[ys, xs]
+        ).tolist()
+
+    def test_incremental_engine_uses_compiled_kernel(self):
+        """Test that the incremental engine steps candidate lists with Numba."""
+        pytest.importorskip("numba")
+        grid = Grid(40, 30)
+        create_blinker_pattern(grid)
+        states = grid_to_states(grid)
+        engine = IncrementalEngine()
+
+        assert engine.use_jit
+        for _ in range(4):
+            expected = step_states(states)
+            states = engine.step(states)
+            np.testing.assert_array_equal(states, expected)
+        assert 0 < engine.pending_cells < states.size
+
+    def test_grid_engine(self):
+        """Test the numba engine through Grid.apply_conway_step."""
+        reference = Grid(15, 11)
+        create_random_pattern(reference, seed=2)
+        grid = Grid.from_dict(reference.to_dict())
+
+        for _ in range(4):
+            reference.apply_conway_step(engine="numpy")
+            grid.apply_conway_step(engine="numba")
+            assert_grid_states_equal(reference, grid)
+
+    def test_compiled_kernel_matches_vectorized_step(self):
+        """Test the Numba-compiled kernel on boards with barriers and edges."""
+        pytest.importorskip("numba")
+        assert jit.BACKEND == "numba"
+        rng = np.random.default_rng(11)
+
+        for shape in [(1, 1), (1, 9), (8, 1), (37, 23)]:
+            states = rng.choice(np.array([0, 1, 2], dtype=np.uint8), size=shape, p=[0.5, 0.1, 0.4])
+            np.testing.assert_array_equal(jit.step_states_jit(states), step_states(states))
+
+
+class TestEngineSetting:
+    """Test forcing the default engine through the environment."""
+
+    def test_default_without_setting(self, monkeypatch):
+        """Test that grids use the NumPy engine by default."""
+        monkeypatch.delenv(ENGINE_ENV_VAR, raising=False)
+        assert default_engine_name() == "numpy"
+        assert Grid(3, 3).engine == "numpy"
+
+    @pytest.mark.parametrize("name", ["python", "numba", "bitpacked", "B36/S23"])
+    def test_setting_forces_engine(self, monkeypatch, name):
+        """Test that the environment variable selects the engine of new grids."""
+        monkeypatch.setenv(ENGINE_ENV_VAR, name)
+        grid = Grid(5, 5)
+        grid.apply_conway_step()
+
+        assert grid.engine == name
+        assert list(grid._engines) == [name]
+
+    def test_unknown_setting_raises_error(self, monkeypatch):
+        """Test that a misspelled engine name is reported."""
+        monkeypatch.setenv(ENGINE_ENV_VAR, "nmupy")
+        with pytest.raises(ValueError, match="Unknown simulation engine"):
+            Grid(3, 3)
+
+    def test_forced_numba_without_numba_raises_error(self, monkeypatch):
+        """Test that forcing the Numba engine does not silently run the Python fallback."""
+        monkeypatch.setattr("simulation.engines.HAS_NUMBA", False)
+        monkeypatch.setenv(ENGINE_ENV_VAR, "numba")
+        with pytest.raises(ValueError, match="requires Numba"):
+            default_engine_name()
@@ -0,0 +1,89 @@
+"""Unit tests for the lookup-table rule compiler and engines."""
+
+import numpy as np
+import pytest
+from models import Grid
+from simulation.lookup import (
+    BlockLookupEngine,
+    LookupEngine,
+    compile_block_table,
+    compile_cell_table,
+)
+from simulation.vectorized import grid_to_states, step_states
+from ..test_utils import create_random_pattern, assert_grid_states_equal
+
+
+class TestCompiledTables:
+    """Test the compiled transition tables."""
+
+    def test_cell_table_encodes_conway_rules(self):
+        """Test individual entries of the 3x3 table."""
+        table = compile_cell_table()
+        assert table.shape == (1024,)
+        assert table[0] == 0
+        assert table[0b000_000_111] == 2  # birth with three neighbors
+        assert table[0b000_010_011] == 2  # survival with two neighbors
+        assert table[0b000_010_001] == 0  # death with one neighbor
+        assert table[0b111_111_111] == 0  # death with eight neighbors
+        assert table[(1 << 9) | 0b000_000_111] == 1  # barriers never change
+
+    def test_tables_are_cached_and_read_only(self):
+        """Test that each rule is compiled once and cannot be modified."""
+        assert compile_cell_table((3,), (2, 3)) is compile_cell_table((3,), (2, 3))
+        assert compile_block_table() is compile_block_table()
+        assert LookupEngine().table is LookupEngine().table
+        with pytest.raises(ValueError):
+            compile_cell_table()[0] = 2
+
+    def test_block_table_matches_cell_table(self):
+        """Test random 4x4 blocks against four 3x3 lookups."""
+        rng = np.random.default_rng(0)
+        block_table = compile_block_table()
+        for index in rng.integers(0, 1 << 20, size=200).tolist():
+            # Barrier cells never hold traffic.
+            for k, bit in enumerate([5, 6, 9, 10]):
+                if index >> (16 + k) & 1:
+                    index &= ~(1 << bit)
+            states = np.zeros((4, 4), dtype=np.uint8)
+            for bit in range(16):
+                if index >> bit & 1:
+                    states[bit // 4, bit % 4] = 2
+            for k, (row, col) in enumerate([(1, 1), (1, 2), (2, 1), (2, 2)]):
+                if index >> (16 + k) & 1:
+                    states[row, col] = 1
+
+            expected = step_states(states)[1:3, 1:3].ravel()
+            packed = int(block_table[index])
+            assert [(packed >> (2 * k)) & 3 for k in range(4)] == expected.tolist()
+
+
+class TestLookupEngines:
+    """Test stepping boards with the lookup engines."""
+
+    @pytest.mark.parametrize("engine_class", [LookupEngine, BlockLookupEngine])
+    @pytest.mark.parametrize("shape", [(1, 1), (2, 7), (5, 2), (23, 37)])
+    def test_matches_vectorized_steps(self, engine_class, shape):
+        """Test random boards of even and odd sizes against full-board stepping."""
+        grid = Grid(shape[1], shape[0])
+        create_random_pattern(grid, seed=sum(shape))
+        expected = grid_to_states(grid)
+        states = expected.copy()
+        out = np.empty_like(states)
+        engine = engine_class()
+
+        for _ in range(15):
+            expected = step_states(expected)
+            states, out = engine.step(states, out), states
+            np.testing.assert_array_equal(states, expected)
+
+    @pytest.mark.parametrize("engine", ["lookup", "lookup-block"])
+    def test_grid_engine_matches_python_engine(self, engine):
+        """Test the lookup engines through Grid.apply_conway_step."""
+        reference = Grid(20, 15)
+        create_random_pattern(reference, seed=9)
+        grid = Grid.from_dict(reference.to_dict())
+
+        for _ in range(6):
+            reference.apply_conway_step(engine="python")
+            grid.apply_conway_step(engine=engine)
+            assert_grid_states_equal(reference, grid)
@@ -0,0 +1,168 @@
+"""Unit tests for the multi-process and thread-pool band engines."""
+
+import multiprocessing
+
+import numpy as np
+import pytest
+from models import Grid
+from simulation.parallel import ProcessPoolEngine, ThreadPoolEngine, split_bands
+from simulation.conway import step_states_python
+from simulation.vectorized import BandScratch, grid_to_states, step_rows, step_states
+from ..test_utils import create_random_pattern, assert_grid_states_equal
+
+
+class TestSplitBands:
+    """Test splitting rows into worker bands."""
+
+    def test_bands_cover_all_rows(self):
+        """Test that bands are contiguous and cover every row."""
+        bands = split_bands(10, 3)
+        assert bands == [(0, 3), (3, 6), (6, 10)]
+
+    def test_more_workers_than_rows(self):
+        """Test that no empty bands are created."""
+        assert split_bands(2, 8) == [(0, 1), (1, 2)]
+
+
+class TestProcessPoolEngine:
+    """Test stepping bands in persistent worker processes."""
+
+    def test_invalid_worker_count_raises_error(self):
+        """Test that non-positive worker counts raise ValueError."""
+        with pytest.raises(ValueError, match="workers must be positive"):
+            ProcessPoolEngine(workers=0)
+
+    @pytest.mark.parametrize("workers", [1, 3])
+    def test_run_matches_vectorized_steps(self, workers):
+        """Test many generations across band boundaries against one process."""
+        grid = Grid(29, 31)
+        create_random_pattern(grid, seed=workers)
+        states = grid_to_states(grid)
+        expected = states
+        for _ in range(25):
+            expected = step_states(expected)
+
+        with ProcessPoolEngine(workers=workers) as engine:
+            actual = engine.run(states, 25)
+
+        np.testing.assert_array_equal(actual, expected)
+
+    def test_pool_is_reused_and_restarted_on_resize(self):
+        """Test that workers persist between calls and follow shape changes."""
+        grid = Grid(12, 12, storage="array")
+        create_random_pattern(grid, seed=2)
+        reference = Grid.from_dict(grid.to_dict())
+        engine = ProcessPoolEngine(workers=2)
+
+        try:
+            for _ in range(3):
+                grid.apply_conway_step(engine=engine)
+                reference.apply_conway_step(engine="python")
+                assert_grid_states_equal(reference, grid)
+            conns = engine._conns
+
+            grid.apply_conway_step(engine=engine)
+            reference.apply_conway_step(engine="python")
+            assert engine._conns is conns
+
+            grid.resize(7, 9)
+            reference.resize(7, 9)
+            grid.apply_conway_step(engine=engine)
+            reference.apply_conway_step(engine="python")
+            assert engine._conns is not conns
+            assert_grid_states_equal(reference, grid)
+        finally:
+            engine.close()
+
+
+    def test_forked_child_does_not_shut_down_the_pool(self):
+        """Test that a finalizer inherited through fork leaves the workers alone."""
+        if "fork" not in multiprocessing.get_all_start_methods():
+            pytest.skip("fork start method not available")
+        states = np.zeros((6, 6), dtype=np.uint8)
+        states[2, 1:4] = 2
+
+        with ProcessPoolEngine(workers=2) as engine:
+            engine.step(states)
+            child = multiprocessing.get_context("fork").Process(target=engine._finalizer)
+            child.start()
+            child.join()
+
+            assert child.exitcode == 0
+            np.testing.assert_array_equal(engine.step(states), step_states(states))
+
+
+class TestStepRows:
+    """Test the band kernel shared by the parallel engines."""
+
+    def test_bands_with_reused_scratch_match_reference(self):
+        """Test stepping equal bands through one scratch against the Python rules."""
+        states = np.random.default_rng(2).integers(0, 3, (48, 30), dtype=np.uint8)
+        out = np.empty_like(states)
+        scratch = BandScratch(12, 30)
+
+        for start in range(0, 48, 12):
+            step_rows(states, out, start, start + 12, scratch)
+
+        np.testing.assert_array_equal(out, step_states_python(states))
+
+
+class TestThreadPoolEngine:
+    """Test stepping bands on a thread pool."""
+
+    def test_invalid_worker_count_raises_error(self):
+        """Test that non-positive worker counts raise ValueError."""
+        with pytest.raises(ValueError, match="workers must be positive"):
+            ThreadPoolEngine(workers=-1)
+
+    @pytest.mark.parametrize("workers", [1, 2, 4])
+    def test_matches_vectorized_steps(self, workers):
+        """Test many generations across band boundaries against one thread."""
+        grid = Grid(40, 70)
+        create_random_pattern(grid, seed=workers)
+        expected = grid_to_states(grid)
+        states = expected.copy()
+
+        with ThreadPoolEngine(workers=workers) as engine:
+            for _ in range(20):
+                expected = step_states(expected)
+                states = engine.step(states)
+                np.testing.assert_array_equal(states, expected)
+
+    def test_output_buffers_alternate(self):
+        """Test that stepping reuses two buffers instead of allocating."""
+        states = np.zeros((64, 64), dtype=np.uint8)
+        states[10, 10:13] = 2
+
+        with ThreadPoolEngine(workers=2) as engine:
+            first = engine.step(states)
+            second = engine.step(first)
+            third = engine.step(second)
+
+        assert first is not second
+        assert third is first
+        assert third[10, 10:13].tolist() == [0, 2, 0]
+
+    def test_band_scratch_is_reused(self):
+        """Test that each band keeps its scratch arrays across steps."""
+        states = np.zeros((64, 64), dtype=np.uint8)
+        states[10, 10:13] = 2
+
+        with ThreadPoolEngine(workers=2) as engine:
+            engine.step(engine.step(states))
+            scratch = dict(engine._scratch)
+            engine.step(states)
+
+            assert engine._scratch == scratch
+            assert len(scratch) == 2
+
+    def test_grid_engine_selection(self):
+        """Test selecting the thread engine through Grid.apply_conway_step."""
+        reference = Grid(18, 50)
+        create_random_pattern(reference, seed=6)
+        threaded = Grid.from_dict(reference.to_dict(), storage="array")
+
+        for _ in range(5):
+            reference.apply_conway_step(engine="python")
+            threaded.apply_conway_step(engine="threads")
+            assert_grid_states_equal(reference, threaded)
@@ -0,0 +1,142 @@
+"""Unit tests for B/S rulestrings and the compiled rule engine."""
+
+import numpy as np
+import pytest
+from models import Grid
+from simulation.rules import RuleEngine, compile_rule, parse_rulestring
+from simulation.vectorized import grid_to_states, step_states
+from ..test_utils import create_random_pattern, assert_grid_states_equal
+
+
+def reference_step(states, birth, survival, barriers_count=False):
+    """Step a board cell by cell for any B/S rule."""
+    height, width = states.shape
+    result = states.copy()
+    for y in range(height):
+        for x in range(width):
+            if states[y, x] == 1:
+                continue
+            neighbors = states[max(y - 1, 0) : y + 2, max(x - 1, 0) : x + 2]
+            live = (neighbors == 2) | ((neighbors == 1) & barriers_count)
+            count = int(np.count_nonzero(live)) - int(states[y, x] == 2)
+            keep = survival if states[y, x] == 2 else birth
+            result[y, x] = 2 if count in keep else 0
+    return result
+
+
+class TestRulestrings:
+    """Test parsing and compiling rulestrings."""
+
+    @pytest.mark.parametrize(
+        "rulestring, birth, survival",
+        [
+            ("B3/S23", {3}, {2, 3}),
+            ("b36s23", {3, 6}, {2, 3}),
+            ("B2/S", {2}, set()),
+            (" B/S012345678 ", set(), set(range(9))),
+        ],
+    )
+    def test_parse_rulestring(self, rulestring, birth, survival):
+        """Test that birth and survival counts are parsed."""
+        assert parse_rulestring(rulestring) == (frozenset(birth), frozenset(survival))
+
+    @pytest.mark.parametrize("rulestring", ["", "23/3", "B9/S23", "B3/S23/X", "S23/B3"])
+    def test_invalid_rulestring_raises_error(self, rulestring):
+        """Test that malformed rulestrings raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid rulestring"):
+            compile_rule(rulestring)
+
+    def test_unknown_barrier_mode_raises_error(self):
+        """Test that unknown barrier semantics raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown barrier mode"):
+            compile_rule("B3/S23", barriers="bouncy")
+
+    def test_rules_are_compiled_once(self):
+        """Test that equivalent spellings share one cached rule."""
+        rule = compile_rule("B36/S23")
+        assert compile_rule("b63s32") is rule
+        assert rule.rulestring == "B36/S23"
+        assert rule.birth_runs == [(3, 3), (6, 6)]
+        assert rule.survival_runs == [(2, 3)]
+        assert compile_rule("B36/S23", barriers="neighbor") is not rule
+
+
+class TestRuleEngine:
+    """Test stepping boards with compiled rules."""
+
+    def test_conway_rule_matches_builtin_engine(self):
+        """Test that B3/S23 matches the built-in traffic rule."""
+        grid = Grid(31, 19)
+        create_random_pattern(grid, seed=2)
+        expected = grid_to_states(grid)
+        states = expected.copy()
+        engine = RuleEngine("B3/S23")
+
+        for _ in range(10):
+            expected = step_states(expected)
+            states = engine.step(states)
+            np.testing.assert_array_equal(states, expected)
+
+    @pytest.mark.parametrize("rulestring", ["B36/S23", "B2/S", "B3678/S34678", "B0/S8", "B/S"])
+    @pytest.mark.parametrize("barriers", ["static", "neighbor"])
+    def test_matches_reference_rules(self, rulestring, barriers):
+        """Test custom rules and barrier semantics against a per-cell reference."""
+        grid = Grid(13, 11)
+        create_random_pattern(grid, seed=len(rulestring))
+        states = grid_to_states(grid)
+        birth, survival = parse_rulestring(rulestring)
+        engine = RuleEngine(rulestring, barriers=barriers)
+
+        for _ in range(4):
+            expected = reference_step(states, birth, survival, barriers == "neighbor")
+            states = engine.step(states)
+            np.testing.assert_array_equal(states, expected)
+
+    def test_neighbor_barriers_count_as_traffic(self):
+        """Test that a barrier completes a birth only with neighbor semantics."""
+        states = np.array([[2, 0, 2], [0, 0, 0], [0, 1, 0]], dtype=np.uint8)
+
+        assert RuleEngine("B3/S23").step(states)[1, 1] == 0
+        assert RuleEngine("B3/S23", barriers="neighbor").step(states)[1, 1] == 2
+
+    def test_engine_names(self):
+        """Test that engines are named after their canonical rulestring."""
+        assert RuleEngine("b36s23").name == "B36/S23"
+        assert RuleEngine("B36/S23", barriers="neighbor").name == "B36/S23:neighbor"
+
+
+class TestGridRules:
+    """Test selecting rules by rulestring on a grid."""
+
+    @pytest.mark.parametrize("name", ["B36/S23", "B36/S23:neighbor"])
+    def test_rulestring_as_engine_name(self, name):
+        """Test that rulestrings are accepted wherever engine names are."""
+        grid = Grid(12, 9)
+        create_random_pattern(grid, seed=6)
+        expected = grid_to_states(grid)
+        barriers_count = name.endswith(":neighbor")
+
+        grid.engine = name
+        for _ in range(3):
+            grid.apply_conway_step()
+            expected = reference_step(expected, {3, 6}, {2, 3}, barriers_count)
+            np.testing.assert_array_equal(grid_to_states(grid), expected)
+
+    def test_conway_rulestring_matches_default_engine(self):
+        """Test that the B3/S23 engine evolves a grid like the default engine."""
+        reference = Grid(20, 15)
+        create_random_pattern(reference, seed=9)
+        grid = Grid.from_dict(reference.to_dict())
+
+        for _ in range(6):
+            reference.apply_conway_step()
+            grid.apply_conway_step(engine="B3/S23")
+            assert_grid_states_equal(reference, grid)
+
+    def test_invalid_engine_name_raises_error(self):
+        """Test that names that are neither engines nor rulestrings fail."""
+        grid = Grid(3, 3)
+        with pytest.raises(ValueError, match="Unknown simulation engine"):
+            grid.apply_conway_step(engine="B3/T23")
+        with pytest.raises(ValueError, match="Unknown barrier mode"):
+            grid.apply_conway_step(engine="B3/S23:sticky")
@@ -0,0 +1,140 @@
+"""Unit tests for the sparse coordinate-set engine."""
+
+import time
+
+import numpy as np
+import pytest
+from models import Grid
+from simulation.sparse import DEFAULT_DENSITY_THRESHOLD, AutoEngine, SparseEngine
+from simulation.vectorized import VectorizedEngine, grid_to_states, step_states
+from ..test_utils import (
+    create_blinker_pattern,
+    create_random_pattern,
+    assert_grid_states_equal,
+)
+
+
+class TestSparseEngine:
+    """Test stepping traffic stored as coordinate sets."""
+
+    def test_load_splits_traffic_and_barriers(self):
+        """Test that traffic and barriers are loaded into separate sets."""
+        states = np.zeros((4, 5), dtype=np.uint8)
+        states[1, 2] = 2
+        states[3, 4] = 1
+        engine = SparseEngine()
+
+        engine.load(states)
+
+        assert engine.traffic == {(2, 1)}
+        assert engine.barriers == {(4, 3)}
+
+    @pytest.mark.parametrize("width,height", [(1, 1), (6, 1), (25, 19)])
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_matches_vectorized_steps(self, width, height, seed):
+        """Test random boards with barriers and edges against dense stepping."""
+        grid = Grid(width, height)
+        create_random_pattern(grid, seed=seed)
+        expected = grid_to_states(grid)
+        states = expected.copy()
+        engine = SparseEngine()
+
+        for _ in range(10):
+            expected = step_states(expected)
+            states = engine.step(states)
+            np.testing.assert_array_equal(states, expected)
+            assert engine.traffic == set(
+                zip(*reversed(np.nonzero(expected == 2)))
+            )
+
+    def test_blinker_on_large_board(self):
+        """Test that only the live neighborhood is visited on a large board."""
+        states = np.zeros((2000, 2000), dtype=np.uint8)
+        states[1000, 999:1002] = 2
+        engine = SparseEngine()
+
+        states = engine.step(states)
+
+        assert engine.traffic == {(1000, 999), (1000, 1000), (1000, 1001)}
+        assert states[999:1002, 1000].tolist() == [2, 2, 2]
+        assert np.count_nonzero(states) == 3
+
+
+class TestAutoEngine:
+    """Test automatic selection between sparse and dense stepping."""
+
+    def test_low_density_uses_sparse(self):
+        """Test that a nearly empty board is stepped sparsely."""
+        grid = Grid(50, 50)
+        create_blinker_pattern(grid)
+        engine = AutoEngine(density_threshold=0.05)
+
+        engine.step(grid_to_states(grid))
+
+        assert engine.current == "sparse"
+
+    def test_high_density_uses_dense(self):
+        """Test that a busy board is stepped densely."""
+        grid = Grid(20, 20)
+        create_random_pattern(grid, seed=3, traffic_density=0.5)
+        engine = AutoEngine(density_threshold=0.05)
+
+        engine.step(grid_to_states(grid))
+
+        assert engine.current == "numpy"
+
+    def test_switching_engines_matches_reference(self):
+        """Test that results stay exact while the density crosses the threshold."""
+        reference = Grid(30, 30)
+        create_random_pattern(reference, seed=8, traffic_density=0.3)
+        auto = Grid.from_dict(reference.to_dict(), storage="array")
+        engine = AutoEngine(density_threshold=0.08)
+        used = set()
+
+        for _ in range(40):
+            reference.apply_conway_step(engine="numpy")
+            auto.apply_conway_step(engine=engine)
+            used.add(engine.current)
+            assert_grid_states_equal(reference, auto)
+
+        assert used == {"sparse", "numpy"}
+
+    def test_not_slower_than_dense_at_threshold(self):
+        """Test that the default threshold does not pick a slower sparse step."""
+        size = 1000
+        states = np.zeros((size, size), dtype=np.uint8)
+        rng = np.random.default_rng(0)
+        blocks = int(DEFAULT_DENSITY_THRESHOLD * states.size / 4) - 1
+        ys = rng.integers(0, size // 4, blocks) * 4
+        xs = rng.integers(0, size // 4, blocks) * 4
+        for y, x in zip(ys, xs):
+            states[y : y + 2, x : x + 2] = 2  # still-life blocks
+        out = np.empty_like(states)
+
+        def best_time(engine):
+            engine.step(states, out)
+            times = []
+            for _ in range(5):
+                start = time.perf_counter()
+                engine.step(states, out)
+                times.append(time.perf_counter() - start)
+            return min(times)
+
+        auto = AutoEngine()
+        auto_time = best_time(auto)
+
+        assert auto.current == "sparse"
+        assert auto_time <= 1.25 * best_time(VectorizedEngine())
+
+    def test_grid_edits_reach_sparse_sets(self):
+        """Test that edits between steps are picked up by the sparse engine."""
+        grid = Grid(40, 40, storage="array")
+        create_blinker_pattern(grid)
+        grid.apply_conway_step(engine="auto")
+
+        grid.cycle_cell_color(20, 20)  # orange
+        grid.cycle_cell_color(20, 20)  # blue
+        grid.apply_conway_step(engine="auto")
+
+        assert grid.count_blue_cells() == 3
+        assert grid.get_cell(20, 20).is_black()
@@ -0,0 +1,95 @@
+"""Unit tests for the dirty-tile incremental engine."""
+
+import numpy as np
+import pytest
+from models import Grid
+from simulation.tiled import TiledEngine
+from simulation.vectorized import grid_to_states, step_states
+from ..test_utils import (
+    create_block_pattern,
+    create_random_pattern,
+    assert_grid_states_equal,
+)
+
+
+class TestTiledEngine:
+    """Test stepping only the tiles that can change."""
+
+    def test_invalid_tile_size_raises_error(self):
+        """Test that non-positive tile sizes raise ValueError."""
+        with pytest.raises(ValueError, match="Tile size must be positive"):
+            TiledEngine(tile_size=0)
+
+    @pytest.mark.parametrize("tile_size", [1, 3, 8, 64])
+    @pytest.mark.parametrize("seed", [0, 1])
+    def test_matches_vectorized_steps(self, tile_size, seed):
+        """Test random boards against full-board stepping for many generations."""
+        grid = Grid(37, 23)
+        create_random_pattern(grid, seed=seed, traffic_density=0.2)
+        expected = grid_to_states(grid)
+        states = expected.copy()
+        engine = TiledEngine(tile_size=tile_size)
+
+        for _ in range(30):
+            expected = step_states(expected)
+            states = engine.step(states)
+            np.testing.assert_array_equal(states, expected)
+
+    def test_settled_tiles_go_idle(self):
+        """Test that a still life leaves no active tiles after settling."""
+        grid = Grid(64, 64)
+        create_block_pattern(grid)
+        states = grid_to_states(grid)
+        engine = TiledEngine(tile_size=16)
+
+        engine.step(states)
+        assert engine.active_tiles == 0
+
+        engine.step(states)
+        assert engine.active_tiles == 0
+        assert np.count_nonzero(states == 2) == 4
+
+    def test_activity_stays_near_oscillators(self):
+        """Test that only tiles around a blinker stay active."""
+        states = np.zeros((64, 64), dtype=np.uint8)
+        states[44, 43:46] = 2  # horizontal blinker inside one tile
+        engine = TiledEngine(tile_size=8)
+
+        for _ in range(4):
+            states = engine.step(states)
+
+        assert engine.active_tiles == 9
+
+
+class TestGridTiledEngine:
+    """Test the tiled engine through Grid.apply_conway_step."""
+
+    def test_user_edits_wake_up_tiles(self):
+        """Test that edits between steps are picked up by settled tiles."""
+        reference = Grid(40, 40)
+        create_block_pattern(reference)
+        tiled = Grid.from_dict(reference.to_dict(), storage="array")
+
+        for _ in range(3):
+            tiled.apply_conway_step(engine="tiled")
+        for x in (30, 31, 32):
+            tiled.get_cell(x, 30).set_color_state(2)  # blue blinker
+            reference.get_cell(x, 30).set_color_state(2)
+
+        for _ in range(3):
+            reference.apply_conway_step(engine="numpy")
+            tiled.apply_conway_step(engine="tiled")
+            assert_grid_states_equal(reference, tiled)
+
+    @pytest.mark.parametrize("storage", ["objects", "array"])
+    def test_matches_python_engine(self, storage):
+        """Test the tiled engine against the reference in both storage modes."""
+        reference = Grid(20, 15)
+        create_random_pattern(reference, seed=9)
+        tiled = Grid.from_dict(reference.to_dict(), storage=storage)
+        engine = TiledEngine(tile_size=4)
+
+        for _ in range(6):
+            reference.apply_conway_step(engine="python")
+            tiled.apply_conway_step(engine=engine)
+            assert_grid_states_equal(reference, tiled)
@@ -0,0 +1,84 @@
+"""Unit tests for the vectorized NumPy simulation engine."""
+
+import numpy as np
+import pytest
+from models import Grid
+from simulation import run_conway_step, run_conway_step_vectorized
+from simulation.vectorized import count_traffic_neighbors, grid_to_states, step_states
+from simulation.conway import _count_traffic_neighbors
+from ..test_utils import (
+    create_blinker_pattern,
+    create_random_pattern,
+    assert_grid_states_equal,
+)
+
+
+class TestNeighborCounting:
+    """Test bulk traffic neighbor counting."""
+
+    def test_counts_match_reference(self):
+        """Test that shifted-array counts match the per-cell counter."""
+        grid = Grid(9, 7)
+        create_random_pattern(grid, seed=1)
+
+        counts = count_traffic_neighbors(grid_to_states(grid))
+
+        for y in range(grid.height):
+            for x in range(grid.width):
+                assert counts[y, x] == _count_traffic_neighbors(grid, x, y)
+
+    def test_barriers_are_not_counted(self):
+        """Test that orange barriers do not count as traffic neighbors."""
+        states = np.ones((3, 3), dtype=np.uint8)
+        assert count_traffic_neighbors(states).sum() == 0
+
+
+class TestVectorizedStep:
+    """Test that the vectorized step matches the reference implementation."""
+
+    @pytest.mark.parametrize("width,height", [(1, 1), (1, 6), (6, 1), (12, 9), (31, 17)])
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_matches_run_conway_step(self, width, height, seed):
+        """Test random boards with barriers and edges against run_conway_step."""
+        grid = Grid(width, height)
+        create_random_pattern(grid, seed=seed)
+
+        for _ in range(4):
+            expected = run_conway_step(grid)
+            actual = run_conway_step_vectorized(grid)
+            assert_grid_states_equal(expected, actual)
+            grid = expected
+
+    def test_step_states_writes_into_out(self):
+        """Test that the next generation is written into a provided buffer."""
+        grid = Grid(5, 5)
+        create_blinker_pattern(grid)
+        states = grid_to_states(grid)
+        out = np.empty_like(states)
+
+        result = step_states(states, out=out)
+
+        assert result is out
+        assert out[0, 1] == 2 and out[1, 1] == 2 and out[2, 1] == 2
+        assert out[1, 0] == 0 and out[1, 2] == 0
+
+
+class TestGridEngineSelection:
+    """Test selecting the engine through Grid.apply_conway_step."""
+
+    def test_numpy_engine_matches_python_engine(self):
+        """Test that both engines evolve a grid identically."""
+        python_grid = Grid(15, 10)
+        create_random_pattern(python_grid, seed=7)
+        numpy_grid = Grid.from_dict(python_grid.to_dict())
+
+        for _ in range(5):
+            python_grid.apply_conway_step(engine="python")
+            numpy_grid.apply_conway_step(engine="numpy")
+            assert_grid_states_equal(python_grid, numpy_grid)
+
+    def test_unknown_engine_raises_error(self):
+        """Test that an unknown engine name raises ValueError."""
+        grid = Grid(3, 3)
+        with pytest.raises(ValueError, match="Unknown simulation engine"):
+            grid.apply_conway_step(engine="fortran")